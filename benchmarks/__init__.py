@@ -0,0 +1,11 @@
+"""
+Benchmarks for the build tooling
+
+corpus.py generates synthetic courses shaped like slides/ (weekXX folders
+with slides.json parts, Korean text, mixed-language fences and two-column
+layouts); run.py times the bootstrap stages and slide transforms on them
+and keeps a JSON history with regression checks against a baseline.
+
+Usage:
+    python3 -m benchmarks --sizes 13,100,1000
+"""
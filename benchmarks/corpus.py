@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Synthetic course generator for benchmarks
+
+Produces a project tree with slides/weekNN-topic/ folders that look like
+the real course: slides-0X-*.md parts listed in slides.json, a slides.md
+assembled from them, and a summary.md with learning objectives. Output is
+deterministic for a given week count and seed.
+"""
+
+import json
+import random
+import shutil
+import sys
+from pathlib import Path
+from typing import List, Dict
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / 'tools'
+sys.path.insert(0, str(TOOLS_DIR))
+
+from deck_index import assemble_parts
+
+# Bump when the generated content changes, so cached corpora are rebuilt
+CORPUS_VERSION = 1
+
+PART_NAMES = ['intro', 'theory', 'practice1', 'practice2', 'practice3']
+
+TOPICS = ['hci-hmi-theory', 'csharp-wpf-basics', 'csharp-realtime-data', 'python-pyside6-basics',
+          'imgui-basics', 'imgui-advanced', 'python-deployment', 'csharp-test-deploy']
+
+KOREAN_WORDS = ['반도체', '장비', '실시간', '데이터', '모니터링', '인터페이스', '사용자', '알람', '제어',
+                '화면', '설계', '구현', '성능', '최적화', '스레드', '동기화', '이벤트', '바인딩',
+                '레이아웃', '시각화', '센서', '공정', '챔버', '온도', '압력', '가스', '유량', '상태']
+
+CODE_SAMPLES = {
+    'csharp': [
+        'public class {name}ViewModel : INotifyPropertyChanged',
+        '{{',
+        '    private double _temperature;',
+        '    public double Temperature',
+        '    {{',
+        '        get => _temperature;',
+        '        set {{ _temperature = value; OnPropertyChanged(); }}',
+        '    }}',
+        '}}',
+    ],
+    'python': [
+        'class {name}Monitor(QWidget):',
+        '    def __init__(self, parent=None):',
+        '        super().__init__(parent)',
+        '        self.timer = QTimer(self)',
+        '        self.timer.timeout.connect(self.update_readings)',
+        '        self.timer.start(100)  # 100ms 주기로 갱신',
+    ],
+    'cpp': [
+        'void Render{name}Panel(const EquipmentState& state) {{',
+        '    ImGui::Begin("{name}");',
+        '    ImGui::Text("Temperature: %.1f", state.temperature);',
+        '    if (ImGui::Button("Start")) {{',
+        '        state.Start();',
+        '    }}',
+        '    ImGui::End();',
+        '}}',
+    ],
+    'xml': [
+        '<Grid>',
+        '    <TextBlock Text="{{Binding Temperature}}" FontSize="24"/>',
+        '    <Button Content="시작" Command="{{Binding StartCommand}}"/>',
+        '</Grid>',
+    ],
+    'bash': [
+        'python -m venv .venv',
+        'pip install -r requirements.txt',
+        'python main.py --config equipment.yaml',
+    ],
+}
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(KOREAN_WORDS) for _ in range(words))
+
+
+def code_block(rng: random.Random, repeat: int = 1) -> List[str]:
+    lang = rng.choice(sorted(CODE_SAMPLES))
+    name = rng.choice(['Chamber', 'Gas', 'Alarm', 'Recipe', 'Wafer'])
+    body = [line.format(name=name) for line in CODE_SAMPLES[lang]] * repeat
+    return [f'```{lang}'] + body + ['```']
+
+
+def make_slide(rng: random.Random, week: int, part: int, n: int) -> List[str]:
+    """One slide: heading, bullets, and a fence, a two-column block or a table"""
+    lines = [f'## {week}.{part}.{n} {sentence(rng, 3)}', '']
+    lines += [f'- **{rng.choice(KOREAN_WORDS)}**: {sentence(rng, rng.randint(4, 14))}'
+              for _ in range(rng.randint(2, 6))]
+    lines.append('')
+    kind = rng.random()
+    if kind < 0.45:
+        lines += code_block(rng, rng.randint(1, 4))
+    elif kind < 0.75:
+        lines += ['<div class="grid grid-cols-2 gap-8">', '<div>', '']
+        lines += [f'**{sentence(rng, 2)}**', ''] + code_block(rng) + ['', '</div>', '<div>', '']
+        lines += [f'- {sentence(rng, rng.randint(3, 9))}' for _ in range(rng.randint(2, 5))]
+        lines += ['', '</div>', '</div>']
+    else:
+        lines += ['| 항목 | 설명 | 값 |', '|------|------|-----|']
+        lines += [f'| {rng.choice(KOREAN_WORDS)} | {sentence(rng, 4)} | {rng.randint(1, 500)} |'
+                  for _ in range(rng.randint(3, 6))]
+    return lines
+
+
+def make_part(rng: random.Random, week: int, part: int, slides: int) -> str:
+    blocks = [[f'# Week {week} Part {part}: {sentence(rng, 3)}', '', sentence(rng, 8)]]
+    blocks += [make_slide(rng, week, part, n) for n in range(1, slides)]
+    return '\n\n---\n\n'.join('\n'.join(block) for block in blocks) + '\n'
+
+
+def generate_course(root: Path, weeks: int, parts: int = 5, slides_per_part: int = 8,
+                    seed: int = 0) -> Dict[str, int]:
+    """
+    Write a synthetic course under root/slides
+
+    Args:
+        root: Project root to create (slides/ and src/ are created inside)
+        weeks: Number of weekNN folders
+        parts: slides-0X parts per week
+        slides_per_part: Slides in each part
+        seed: Random seed
+
+    Returns:
+        Dictionary with week, file and byte counts
+    """
+    rng = random.Random(seed)
+    slides_dir = root / 'slides'
+    (root / 'src').mkdir(parents=True, exist_ok=True)
+    stats = {'weeks': weeks, 'files': 0, 'bytes': 0}
+
+    for week in range(1, weeks + 1):
+        folder = slides_dir / f'week{week:02d}-{TOPICS[week % len(TOPICS)]}'
+        folder.mkdir(parents=True, exist_ok=True)
+        names = []
+        texts = []
+        for part in range(1, parts + 1):
+            name = f'slides-{part:02d}-{PART_NAMES[(part - 1) % len(PART_NAMES)]}.md'
+            names.append(name)
+            texts.append(make_part(rng, week, part, slides_per_part))
+
+        files = {name: text for name, text in zip(names, texts)}
+        files['slides.md'] = assemble_parts(texts)[0]
+        files['slides.json'] = json.dumps({'files': names}, indent=2)
+        files['summary.md'] = (f'# Week {week}: {sentence(rng, 3)}\n\n## 🎯 학습 목표\n'
+                               f'{sentence(rng, 12)}\n\n## 내용\n{sentence(rng, 20)}\n')
+        for name, text in files.items():
+            data = text.encode('utf-8')
+            (folder / name).write_bytes(data)
+            stats['files'] += 1
+            stats['bytes'] += len(data)
+
+    return stats
+
+
+def ensure_course(cache_dir: Path, weeks: int, seed: int = 0) -> Path:
+    """
+    Return a generated course of the given size, reusing a previous one
+
+    Returns:
+        Project root of the course
+    """
+    root = cache_dir / f'course-{weeks}w-s{seed}'
+    stamp = root / '.corpus.json'
+    expected = {'version': CORPUS_VERSION, 'weeks': weeks, 'seed': seed}
+    try:
+        if json.loads(stamp.read_text(encoding='utf-8')) == expected:
+            return root
+    except (OSError, ValueError):
+        pass
+
+    if root.exists():
+        shutil.rmtree(root)
+    generate_course(root, weeks, seed=seed)
+    stamp.write_text(json.dumps(expected), encoding='utf-8')
+    return root
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print("Usage: python3 benchmarks/corpus.py <output_dir> <weeks>")
+        sys.exit(1)
+    result = generate_course(Path(sys.argv[1]), int(sys.argv[2]))
+    print(f"✅ Generated {result['weeks']} weeks, {result['files']} files, "
+          f"{result['bytes'] / 1024 / 1024:.1f} MB")
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner
+
+Generates (or reuses) synthetic courses of each size, measures every
+target in its own interpreter, appends the results to a JSON history and
+flags regressions against a stored baseline.
+
+Usage:
+    python3 -m benchmarks --sizes 13,100,1000
+    python3 -m benchmarks --sizes 13 --targets scan-weeks,index-html --save-baseline
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'tools'))
+
+from benchmarks.corpus import ensure_course
+from benchmarks.targets import TARGETS
+from output_writer import write_json
+
+BENCH_DIR = PROJECT_ROOT / '.cache' / 'benchmarks'
+DEFAULT_HISTORY = BENCH_DIR / 'history.json'
+DEFAULT_BASELINE = PROJECT_ROOT / 'benchmarks' / 'baseline.json'
+DEFAULT_SIZES = '13,100,1000'
+
+
+def run_target(name: str, course_root: Path) -> Dict[str, Any]:
+    """Measure one target in a fresh interpreter"""
+    with tempfile.TemporaryDirectory(prefix='bench-result-') as tmp:
+        result_path = Path(tmp) / 'result.json'
+        completed = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.targets', name, str(course_root), str(result_path)],
+            cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"{name} failed:\n{completed.stderr.strip()}")
+        return json.loads(result_path.read_text(encoding='utf-8'))
+
+
+def best_of(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fastest run's numbers, with the highest peak RSS seen across runs"""
+    best = dict(min(runs, key=lambda run: run['wall_ms']))
+    peaks = [run['peak_rss_kb'] for run in runs if run['peak_rss_kb'] is not None]
+    best['peak_rss_kb'] = max(peaks) if peaks else None
+    best['runs'] = len(runs)
+    return best
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    Flag results that are slower or larger than the baseline
+
+    A wall-time regression needs both the relative threshold and an
+    absolute min_delta_ms, so tiny targets do not flag on timer noise.
+
+    Returns:
+        Human-readable regression messages
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        wall, base_wall = result['wall_ms'], base['wall_ms']
+        if wall > base_wall * (1 + threshold) and wall - base_wall > min_delta_ms:
+            regressions.append(f"{key}: wall {base_wall:.1f} → {wall:.1f} ms (+{(wall / base_wall - 1) * 100:.0f}%)")
+        rss, base_rss = result.get('peak_rss_kb'), base.get('peak_rss_kb')
+        if rss and base_rss and rss > base_rss * (1 + threshold):
+            regressions.append(f"{key}: peak RSS {base_rss / 1024:.1f} → {rss / 1024:.1f} MB")
+    return regressions
+
+
+def load_json(path: Path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_result(key: str, result: Dict[str, Any]):
+    io = result['io']
+    rss = f"{result['peak_rss_kb'] / 1024:7.1f} MB" if result['peak_rss_kb'] else '      n/a'
+    calls = f"{io.get('read_calls', io.get('read_blocks', 0)):>8} r {io.get('write_calls', io.get('write_blocks', 0)):>8} w"
+    print(f"   {key:40} {result['wall_ms']:10.1f} ms {rss} {calls}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='benchmarks', description='Benchmark the build tooling on synthetic courses')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help=f'Comma-separated week counts (default: {DEFAULT_SIZES})')
+    parser.add_argument('--targets', help=f"Comma-separated targets (default: all of {', '.join(TARGETS)})")
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per target; the fastest is kept (default: 3)')
+    parser.add_argument('--corpus-dir', default=str(BENCH_DIR), help='Where generated courses are kept')
+    parser.add_argument('--history', default=str(DEFAULT_HISTORY), help='JSON history file to append to')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Relative slowdown flagged as regression (default: 0.25)')
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help='Ignore slowdowns smaller than this (default: 5)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    targets = [name.strip() for name in args.targets.split(',')] if args.targets else list(TARGETS)
+    unknown = [name for name in targets if name not in TARGETS]
+    if unknown:
+        print(f"❌ Unknown target(s): {', '.join(unknown)}")
+        return 1
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in sizes:
+        start = time.perf_counter()
+        course_root = ensure_course(Path(args.corpus_dir), size)
+        print(f"\n📚 {size} weeks ({course_root}, ready in {time.perf_counter() - start:.1f} s)")
+        for name in targets:
+            key = f'{size}w:{name}'
+            results[key] = best_of([run_target(name, course_root) for _ in range(args.repeat)])
+            print_result(key, results[key])
+
+    baseline_path = Path(args.baseline)
+    baseline = load_json(baseline_path, {}).get('results', {})
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+
+    record = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'results': results,
+        'regressions': regressions,
+    }
+    history_path = Path(args.history)
+    history = load_json(history_path, [])
+    history.append(record)
+    write_json(history_path, history, indent=1, ensure_ascii=False)
+    print(f"\n🗂️  Appended to {history_path} ({len(history)} run(s))")
+
+    if args.save_baseline:
+        write_json(baseline_path, {key: record[key] for key in ('timestamp', 'commit', 'python', 'platform', 'cpus', 'results')},
+                   indent=1, ensure_ascii=False)
+        print(f"📌 Saved baseline: {baseline_path}")
+
+    if not baseline:
+        if not args.save_baseline:
+            print("ℹ️  No baseline to compare against (use --save-baseline)")
+    elif regressions:
+        print(f"⚠️  {len(regressions)} regression(s) against {baseline_path}:")
+        for message in regressions:
+            print(f"   - {message}")
+        return 1
+    else:
+        print(f"✅ No regressions against {baseline_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark targets and the per-target measurement child
+
+Each target has an untimed prepare step (copying a course, warming a
+cache) and a timed run step. run.py measures every target in a fresh
+interpreter, so peak RSS and I/O counters belong to that target alone:
+
+    python3 -m benchmarks.targets <target> <course_root> <result.json>
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'tools'))
+sys.path.insert(0, str(PROJECT_ROOT / 'scripts'))
+
+import bootstrap
+import lecture_tools
+from week_metadata import scan_weeks_directory
+
+# target name → (prepare(course_root, workdir) -> state, run(state))
+Target = Tuple[Callable[[Path, Path], Any], Callable[[Any], Any]]
+
+
+def _project_with_slides(course_root: Path, workdir: Path, copy: bool = False) -> Path:
+    """A scratch project whose slides/ is the course's (linked, or copied when it gets modified)"""
+    project = workdir / 'project'
+    (project / 'src').mkdir(parents=True)
+    if copy:
+        shutil.copytree(course_root / 'slides', project / 'slides')
+    else:
+        os.symlink(course_root / 'slides', project / 'slides', target_is_directory=True)
+    return project
+
+
+def _prepare_copy(course_root: Path, workdir: Path) -> Path:
+    return _project_with_slides(course_root, workdir)
+
+
+def _prepare_copy_noop(course_root: Path, workdir: Path) -> Path:
+    project = _project_with_slides(course_root, workdir)
+    bootstrap.copy_slides_to_src(project)
+    return project
+
+
+def _prepare_scan(course_root: Path, workdir: Path) -> Tuple[Path, Optional[Path]]:
+    return course_root / 'slides', None
+
+
+def _prepare_scan_cached(course_root: Path, workdir: Path) -> Tuple[Path, Optional[Path]]:
+    scan_weeks_directory(course_root / 'slides', workdir)
+    return course_root / 'slides', workdir
+
+
+def _prepare_index_html(course_root: Path, workdir: Path):
+    return scan_weeks_directory(course_root / 'slides', workdir)
+
+
+def _transform_target(name: str) -> Target:
+    def prepare(course_root: Path, workdir: Path):
+        project = _project_with_slides(course_root, workdir, copy=True)
+        return lecture_tools.collect_files([str(project / 'slides')], lecture_tools.DEFAULT_PATTERN)
+
+    def run(files):
+        return lecture_tools.run_pipeline(files, [name], jobs=1)
+
+    return prepare, run
+
+
+TARGETS: Dict[str, Target] = {
+    'scan-weeks': (_prepare_scan, lambda state: scan_weeks_directory(*state)),
+    'scan-weeks-cached': (_prepare_scan_cached, lambda state: scan_weeks_directory(*state)),
+    'index-html': (_prepare_index_html, lambda weeks: bootstrap.generate_index_html(weeks, {})),
+    'copy-slides': (_prepare_copy, bootstrap.copy_slides_to_src),
+    'copy-slides-noop': (_prepare_copy_noop, bootstrap.copy_slides_to_src),
+}
+for _name in lecture_tools.TRANSFORMS:
+    TARGETS[f'transform:{_name}'] = _transform_target(_name)
+
+
+def io_counters() -> Dict[str, int]:
+    """Read/write call and byte counters of this process (/proc/self/io, else block counts)"""
+    try:
+        with open('/proc/self/io', 'r') as f:
+            fields = dict(line.split(': ') for line in f.read().splitlines())
+        return {'read_calls': int(fields['syscr']), 'write_calls': int(fields['syscw']),
+                'read_bytes': int(fields['rchar']), 'write_bytes': int(fields['wchar'])}
+    except (OSError, KeyError, ValueError):
+        pass
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {'read_blocks': usage.ru_inblock, 'write_blocks': usage.ru_oublock}
+    return {}
+
+
+def peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def measure(name: str, course_root: Path) -> Dict[str, Any]:
+    """
+    Prepare and run one target, returning wall time, peak RSS and I/O deltas
+
+    Tool output is discarded so printing does not skew the timings.
+    """
+    prepare, run = TARGETS[name]
+    with tempfile.TemporaryDirectory(prefix='bench-') as tmp, \
+            open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        state = prepare(course_root, Path(tmp))
+        rss_before = peak_rss_kb()
+        io_before = io_counters()
+        start = time.perf_counter()
+        run(state)
+        wall = time.perf_counter() - start
+        io_after = io_counters()
+        rss_after = peak_rss_kb()
+
+    return {
+        'wall_ms': round(wall * 1000, 3),
+        'peak_rss_kb': rss_after,
+        'rss_growth_kb': rss_after - rss_before if rss_after is not None else None,
+        'io': {key: io_after[key] - io_before.get(key, 0) for key in io_after},
+    }
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 3 or argv[0] not in TARGETS:
+        print(f"Usage: python3 -m benchmarks.targets <{'|'.join(TARGETS)}> <course_root> <result.json>")
+        return 1
+    result = measure(argv[0], Path(argv[1]))
+    Path(argv[2]).write_text(json.dumps(result), encoding='utf-8')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
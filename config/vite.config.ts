@@ -1,7 +1,106 @@
-import { defineConfig } from 'vite'
+import { defineConfig, type Plugin } from 'vite'
+import fs from 'node:fs'
+import path from 'node:path'
+import { fileURLToPath } from 'node:url'
+
+const configDir = path.dirname(fileURLToPath(import.meta.url))
+
+const mimeTypes: Record<string, string> = {
+  '.md': 'text/markdown; charset=utf-8',
+  '.json': 'application/json; charset=utf-8',
+  '.html': 'text/html; charset=utf-8',
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.gif': 'image/gif',
+  '.svg': 'image/svg+xml'
+}
+
+// `python3 tools/bootstrap.py --mode alias` writes slides-alias.json instead of
+// copying slides/ into src/slides; serve /slides straight from that directory.
+function slidesAlias(): Plugin | null {
+  const aliasConfig = path.join(configDir, 'slides-alias.json')
+  if (!fs.existsSync(aliasConfig)) {
+    return null
+  }
+
+  const { slidesRoot } = JSON.parse(fs.readFileSync(aliasConfig, 'utf-8'))
+  const root = path.resolve(configDir, slidesRoot)
+
+  const middleware = (req, res, next) => {
+    const urlPath = decodeURIComponent((req.url || '/').split('?')[0])
+    const filePath = path.join(root, urlPath)
+    if (!filePath.startsWith(root + path.sep)) {
+      return next()
+    }
+
+    fs.stat(filePath, (err, stat) => {
+      if (err || !stat.isFile()) {
+        return next()
+      }
+      res.setHeader('Content-Type', mimeTypes[path.extname(filePath)] || 'application/octet-stream')
+      res.setHeader('Content-Length', stat.size)
+      fs.createReadStream(filePath).pipe(res)
+    })
+  }
+
+  return {
+    name: 'slides-alias',
+    configureServer(server) {
+      server.middlewares.use('/slides', middleware)
+    },
+    configurePreviewServer(server) {
+      server.middlewares.use('/slides', middleware)
+    }
+  }
+}
+
+// bootstrap.py names every generated deck file after a hash of its content
+// (chunk-00.1a2b3c4d5e.html, slides.index.<hash>.json, slides.<hash>.html and
+// its part-*.<hash>.md), so those can be cached forever; only manifest.json
+// must be revalidated.
+const FINGERPRINTED = /\.[0-9a-f]{10}\.(md|html|json)$/
+
+function generatedCaching(): Plugin {
+  const middleware = (req, res, next) => {
+    const urlPath = (req.url || '/').split('?')[0]
+    const cacheControl = FINGERPRINTED.test(urlPath)
+      ? 'public, max-age=31536000, immutable'
+      : 'no-cache'
+
+    // Static file handlers set their own Cache-Control; ours wins
+    const writeHead = res.writeHead
+    res.writeHead = function (statusCode, ...rest) {
+      const headers = rest.find((arg) => arg && typeof arg === 'object')
+      if (headers && !Array.isArray(headers)) {
+        for (const name of Object.keys(headers)) {
+          if (name.toLowerCase() === 'cache-control') {
+            delete headers[name]
+          }
+        }
+      }
+      if (statusCode === 200) {
+        res.setHeader('Cache-Control', cacheControl)
+      }
+      return writeHead.call(this, statusCode, ...rest)
+    }
+    next()
+  }
+
+  return {
+    name: 'generated-caching',
+    configureServer(server) {
+      server.middlewares.use('/generated', middleware)
+    },
+    configurePreviewServer(server) {
+      server.middlewares.use('/generated', middleware)
+    }
+  }
+}
 
 export default defineConfig({
   root: 'src',
+  plugins: [generatedCaching(), slidesAlias()].filter(Boolean),
   server: {
     port: 5173,
     host: true,
@@ -15,4 +114,4 @@ export default defineConfig({
     assetsDir: 'assets'
   },
   publicDir: false
-})
\ No newline at end of file
+})
@@ -6,44 +6,61 @@ import sys
 import os
 from pathlib import Path
 
-def remove_time_allocations(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'tools'))
+from slide_model import Deck, iter_blocks, load_deck, save_deck
+
+# Remove (X분) patterns
+TIME_PATTERN = re.compile(r'[ \t]*\(\d+분\)')
+# Remove time allocation in bullet points like '- **실습**: 30분'
+TIME_BULLET_PATTERN = re.compile(r'- \*\*.*?\*\*:\s*\d+분')
 
-    original_content = content
+def strip_slide(lines, code_lines, headings):
+    """Return the slide's lines without time allocations"""
+    drop = set()
 
-    # Remove time allocation patterns
-    patterns = [
-        # Remove (X분) patterns
-        r'\s*\(\d+분\)',
-        # Remove section headers with time allocation like '## ⏰ 세션 구성'
-        r'## ⏰ 세션 구성.*?(?=\n## |\n---|\Z)',
-        # Remove time allocation section headers
-        r'## ⏰.*?(?=\n## |\n---|\Z)',
-        # Remove specific session time patterns like ': (45분)'
-        r':\s*\(\d+분\)',
-        # Remove time allocation in bullet points that contain 분
-        r'- \*\*.*?\*\*:\s*\d+분.*?\n',
-        # Remove standalone time references at end of lines
-        r'\s+\(\d+분\)(?=\s*$)',
-        # Remove specific time allocation headers with numbers
-        r'### \d+\.\d+.*?\(\d+분\).*?\n',
-        # Remove session time allocations in headers
-        r'## \d+.*?\(\d+분\)',
-    ]
+    # Remove time allocation sections like '## ⏰ 세션 구성' up to the next ## heading
+    for n, heading in enumerate(headings):
+        if heading.level == 2 and lines[heading.start].startswith('## ⏰'):
+            end = next((h.start for h in headings[n + 1:] if h.level == 2), len(lines))
+            drop.update(range(heading.start, end))
 
-    for pattern in patterns:
-        content = re.sub(pattern, '', content, flags=re.MULTILINE | re.DOTALL)
+    result = []
+    for i, line in enumerate(lines):
+        if i in drop:
+            continue
+        if i in code_lines:
+            result.append(line)
+            continue
+        if TIME_BULLET_PATTERN.search(line):
+            continue
+        line = TIME_PATTERN.sub('', line).rstrip()
+        # Clean up multiple consecutive blank lines
+        if not line and result and not result[-1]:
+            continue
+        result.append(line)
+    return result
 
-    # Clean up multiple consecutive newlines
-    content = re.sub(r'\n{3,}', '\n\n', content)
+def process_deck(deck: Deck):
+    """Strip time allocations outside code blocks; returns modification messages"""
+    mods = []
+    for slide in deck.slides:
+        code_lines = set()
+        for block in iter_blocks(slide.blocks, ('fence',)):
+            code_lines.update(range(block.start, block.end))
+        headings = list(iter_blocks(slide.blocks, ('heading',)))
 
-    # Clean up trailing whitespace
-    content = re.sub(r'[ \t]+$', '', content, flags=re.MULTILINE)
+        stripped = strip_slide(slide.lines, code_lines, headings)
+        if stripped != slide.lines:
+            slide.lines = stripped
+            mods.append(f"Slide {slide.h}: removed time allocations")
+    return mods
+
+def remove_time_allocations(file_path):
+    deck = load_deck(file_path)
 
-    if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if process_deck(deck):
+        save_deck(file_path, deck)
         print(f'Updated: {file_path}')
         return True
     else:
@@ -61,4 +78,4 @@ def main():
     print(f'\nTotal files updated: {updated_count}')
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
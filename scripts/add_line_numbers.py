@@ -2,71 +2,55 @@
 """
 Add line numbers to all code blocks (Python, JavaScript, C#, etc.)
 """
-import re
+import sys
+from pathlib import Path
 
-def count_code_lines(code_block):
-    """Count non-empty code lines"""
-    lines = code_block.strip().split('\n')
-    return len([l for l in lines if l.strip()])
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
 
-def add_line_numbers_to_file(filepath):
-    """Add line numbers to all code blocks in a markdown file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Pattern to match code blocks without line numbers
-    pattern = r'^```(python|javascript|csharp|cpp|java|css)$'
-
-    lines = content.split('\n')
-    result = []
-    i = 0
+from slide_model import Deck, iter_blocks, count_fence_lines, load_deck, save_deck
 
-    while i < len(lines):
-        line = lines[i]
+# Languages whose code blocks get line numbers
+CODE_LANGUAGES = ('python', 'javascript', 'csharp', 'cpp', 'java', 'css')
 
-        # Check if this is a code block start without line numbers
-        match = re.match(pattern, line.strip())
-        if match:
-            lang = match.group(1)
+def process_deck(deck: Deck, languages=CODE_LANGUAGES):
+    """
+    Add {1-N} line numbers to fences of the given languages that have none
 
-            # Find the closing ```
-            code_lines = []
-            i += 1
-            while i < len(lines) and lines[i].strip() != '```':
-                code_lines.append(lines[i])
-                i += 1
+    Returns:
+        List of modification messages
+    """
+    mods = []
+    for slide in deck.slides:
+        for block in iter_blocks(slide.blocks, ('fence',)):
+            # Only bare ```lang openers; anything with attributes is left alone
+            opening = slide.lines[block.start]
+            if block.lang not in languages or opening.strip() != f'```{block.lang}':
+                continue
 
             # Count non-empty lines
-            line_count = len([l for l in code_lines if l.strip()])
+            line_count = count_fence_lines(slide, block)
 
             # Add line numbers to opening tag
-            result.append(f'```{lang} {{1-{line_count}}}')
-            result.extend(code_lines)
-            if i < len(lines):
-                result.append(lines[i])  # closing ```
-        else:
-            result.append(line)
+            indent = opening[:len(opening) - len(opening.lstrip())]
+            slide.replace_line(block.start, f'{indent}```{block.lang} {{1-{line_count}}}')
+            mods.append(f"Slide {slide.h}: {block.lang} block → {{1-{line_count}}}")
+    return mods
 
-        i += 1
+def add_line_numbers_to_file(filepath):
+    """Add line numbers to all code blocks in a markdown file"""
+    deck = load_deck(filepath)
+    process_deck(deck)
 
     # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(result))
+    save_deck(filepath, deck)
 
     print(f"Added line numbers to: {filepath}")
 
 if __name__ == '__main__':
-    files = [
-        '/home/cbchoi/Projects/lecture-hmi/src/slides/week01-hci-hmi-theory/slides-03-practice1.md',
-        '/home/cbchoi/Projects/lecture-hmi/src/slides/week01-hci-hmi-theory/slides-04-practice2.md',
-        '/home/cbchoi/Projects/lecture-hmi/src/slides/week01-hci-hmi-theory/slides-05-practice3.md',
-    ]
+    if len(sys.argv) < 2:
+        print("Usage: python3 add_line_numbers.py <file1> [file2] ...")
+        sys.exit(1)
 
-    for filepath in files:
+    # Edit the files under slides/; bootstrap.py publishes them to src/slides
+    for filepath in sys.argv[1:]:
         add_line_numbers_to_file(filepath)
-
-        # Copy to slides folder
-        import shutil
-        dest = filepath.replace('/src/slides/', '/slides/')
-        shutil.copy(filepath, dest)
-        print(f"Copied to: {dest}")
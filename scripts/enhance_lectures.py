@@ -7,10 +7,13 @@ Enhance lecture slides with:
 4. Code explanations
 """
 
-import os
-import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+
+from slide_model import iter_blocks, load_deck, save_deck
+
 # Design patterns theory content to add to Week 2
 WEEK2_DESIGN_PATTERNS = """
 ---
@@ -396,25 +399,25 @@ def add_design_patterns_to_week2(slides_dir):
         print(f"File not found: {theory_file}")
         return
 
-    with open(theory_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    deck = load_deck(theory_file)
 
     # Find the end of CLR section and insert design patterns
-    insertion_point = content.find("## WPF 계층 구조")
-
-    if insertion_point == -1:
+    # (the heading itself, not a mention of it inside a code block)
+    for slide in deck.slides:
+        heading = slide.find_heading("## WPF 계층 구조")
+        if heading:
+            break
+    else:
         print("Could not find insertion point")
         return
 
-    new_content = (
-        content[:insertion_point] +
-        WEEK_DESIGN_PATTERNS +
-        "\n" +
-        content[insertion_point:]
+    slide.lines = (
+        slide.lines[:heading.start] +
+        WEEK2_DESIGN_PATTERNS.split('\n') +
+        slide.lines[heading.start:]
     )
 
-    with open(theory_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    save_deck(theory_file, deck)
 
     print(f"✅ Enhanced {theory_file}")
 
@@ -452,20 +455,19 @@ def process_markdown_file(md_file):
     """Process a single markdown file"""
     print(f"  📄 {md_file.name}")
 
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    deck = load_deck(md_file)
+    blocks = [block for slide in deck.slides for block in iter_blocks(slide.blocks)]
 
     # Already has two-column layout
-    if '<div class="grid grid-cols-2 gap-8">' in content:
+    if any(block.kind == 'columns' for block in blocks):
         print(f"    ✓ Already has two-column layout")
         return
 
     # Find code blocks without explanations
-    code_pattern = r'```(\w+)\n(.*?)```'
-    matches = list(re.finditer(code_pattern, content, re.DOTALL))
+    fences = [block for block in blocks if block.kind == 'fence' and block.lang]
 
-    if matches:
-        print(f"    Found {len(matches)} code blocks")
+    if fences:
+        print(f"    Found {len(fences)} code blocks")
 
 def main():
     """Main function"""
@@ -17,33 +17,10 @@ set WEEK=%1
 echo Exporting PDF for Week %WEEK%...
 echo.
 
-REM Auto-detect running development server port
-echo Detecting development server...
-set DEV_PORT=
-
-REM Check common ports
-for %%p in (5173 5174 3000 8080) do (
-    curl -s http://localhost:%%p >nul 2>&1
-    if !errorlevel! equ 0 (
-        set DEV_PORT=%%p
-        echo Found development server on port %%p
-        goto :found_server
-    )
-)
-
-echo Error: No development server found on common ports (5173, 5174, 3000, 8080)
-echo Please start the development server first with: scripts\start-dev.bat
-echo.
-pause
-exit /b 1
-
-:found_server
-
-REM Create pdf-exports directory if it doesn't exist
-if not exist "pdf-exports" mkdir pdf-exports
-
+REM export_pdf.py starts its own local server, renders only the parts that
+REM changed since the last export and merges them into pdf-exports\week%WEEK%.pdf
 echo Generating PDF... This may take a few moments.
-node tools/export-pdf.mjs --week %WEEK% --port %DEV_PORT%
+python scripts\export_pdf.py --week %WEEK%
 
 if %errorlevel% eq 0 (
     echo.
@@ -53,9 +30,9 @@ if %errorlevel% eq 0 (
     echo.
     echo ✗ PDF generation failed!
     echo Make sure:
-    echo   1. Development server is running
-    echo   2. Week %WEEK% content exists
-    echo   3. All dependencies are installed
+    echo   1. Week %WEEK% content exists
+    echo   2. Playwright and pypdf are installed:
+    echo      pip install playwright pypdf ^&^& python -m playwright install chromium
 )
 
 echo.
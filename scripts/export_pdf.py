@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Export lecture PDFs in one parallel run
+
+Starts the in-memory preview server (tools/preview_server.py) on a free
+local port, prints every slides.json part through a bounded pool of
+headless Chromium pages and merges the part PDFs into pdf-exports/weekNN.pdf.
+
+Part PDFs are cached in .cache/pdf/ under a hash of the part, the page
+template, src/css and src/themes, so editing slides-03-practice1.md only
+re-renders that part, and weeks whose hashes all match the last export
+are skipped without opening a browser.
+
+Requires Playwright (pip install playwright && python3 -m playwright install chromium)
+and, for weeks with more than one part, pypdf (pip install pypdf).
+
+Usage:
+    python3 scripts/export_pdf.py --all
+    python3 scripts/export_pdf.py --week 03 --week 05 --jobs 6
+    python3 scripts/export_pdf.py --week 03 --force
+"""
+
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'tools'))
+
+from deck_pages import deck_part_names, template_hash
+from output_writer import copy_file, write_json
+from preview_server import PRINT_DIR, PreviewServer
+from week_metadata import scan_weeks_directory
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
+
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / 'pdf-exports'
+CACHE_DIR = PROJECT_ROOT / '.cache' / 'pdf'
+STATE_NAME = 'state.json'
+# Bump when the printing itself changes (page options, waits), invalidating every cached PDF
+EXPORT_VERSION = 1
+# Styles every deck page pulls in
+STYLE_DIRS = ('css', 'themes')
+DEFAULT_TIMEOUT_SECONDS = 120
+
+
+def style_hash(project_root: Path) -> str:
+    """Hash of the stylesheets under src/css and src/themes"""
+    digest = hashlib.sha256()
+    for name in STYLE_DIRS:
+        for path in sorted((project_root / 'src' / name).rglob('*.css')):
+            digest.update(path.relative_to(project_root).as_posix().encode('utf-8'))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def plan_week(week: Dict[str, Any], slides_dir: Path, base_key: str) -> Dict[str, Any]:
+    """
+    Work out a week's parts and their cache keys
+
+    Args:
+        week: Week dictionary from scan_weeks_directory
+        slides_dir: slides/ directory
+        base_key: Hash of everything besides the part itself (template, styles)
+
+    Returns:
+        Dict with folder, number, key (the whole week) and parts
+        (name, key and cached PDF path of each part, in deck order)
+    """
+    folder = week['folder']
+    parts = []
+    for name in deck_part_names(slides_dir / folder):
+        digest = hashlib.sha256(base_key.encode('utf-8'))
+        digest.update(json.dumps([week['number'], week['title'], name]).encode('utf-8'))
+        digest.update((slides_dir / folder / name).read_bytes())
+        key = digest.hexdigest()[:16]
+        parts.append({
+            'name': name,
+            'key': key,
+            'pdf': CACHE_DIR / folder / f'{Path(name).stem}.{key}.pdf'
+        })
+    week_key = hashlib.sha256(''.join(part['key'] for part in parts).encode('utf-8')).hexdigest()[:16]
+    return {'folder': folder, 'number': week['number'], 'key': week_key, 'parts': parts}
+
+
+def load_state() -> Dict[str, Any]:
+    try:
+        with open(CACHE_DIR / STATE_NAME, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == EXPORT_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': EXPORT_VERSION, 'weeks': {}}
+
+
+def prune_part_pdfs(plan: Dict[str, Any]):
+    """Drop cached part PDFs that no part of the week points to anymore"""
+    keep = {part['pdf'].name for part in plan['parts']}
+    for stale in (CACHE_DIR / plan['folder']).glob('*.pdf'):
+        if stale.name not in keep:
+            stale.unlink()
+
+
+def merge_parts(plan: Dict[str, Any], output: Path):
+    """
+    Concatenate a week's part PDFs into its output file, with one bookmark
+    per part file so a page can be traced back to the part to edit
+    """
+    if len(plan['parts']) == 1:
+        copy_file(plan['parts'][0]['pdf'], output)
+        return
+    writer = PdfWriter()
+    for part in plan['parts']:
+        writer.append(str(part['pdf']), outline_item=part['name'])
+    tmp_path = output.with_name(f'.{output.name}.tmp')
+    with open(tmp_path, 'wb') as f:
+        writer.write(f)
+    tmp_path.replace(output)
+
+
+async def print_part(pages: asyncio.Queue, base_url: str, folder: str, part: Dict[str, Any],
+                     timeout_ms: int) -> float:
+    """
+    Print one part with the next free page of the pool
+
+    Returns:
+        Seconds spent rendering
+    """
+    page = await pages.get()
+    start = time.perf_counter()
+    try:
+        url = f"{base_url}/generated/{folder}/{PRINT_DIR}/{Path(part['name']).stem}.html?print-pdf"
+        await page.goto(url, wait_until='networkidle', timeout=timeout_ms)
+        await page.wait_for_function('() => window.Reveal && Reveal.isReady()', timeout=timeout_ms)
+        await page.evaluate('document.fonts.ready.then(() => true)')
+        part['pdf'].parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = part['pdf'].with_name(f".{part['pdf'].name}.tmp")
+        await page.pdf(path=str(tmp_path), print_background=True, prefer_css_page_size=True)
+        tmp_path.replace(part['pdf'])
+    finally:
+        pages.put_nowait(page)
+    return time.perf_counter() - start
+
+
+async def render_parts(server: PreviewServer, todo: List[Dict[str, Any]], jobs: int, port: int,
+                       timeout_ms: int) -> int:
+    """
+    Serve the site and print the given parts through a pool of `jobs` pages
+
+    Args:
+        server: Preview server over the project
+        todo: Dicts with folder and part, from plan_week
+        jobs: Number of browser pages printing at once
+        port: Local port for the server (0 = any free port)
+        timeout_ms: Per-page navigation and readiness timeout
+
+    Returns:
+        Number of parts that failed
+    """
+    http = await asyncio.start_server(server.handle, '127.0.0.1', port)
+    base_url = f"http://127.0.0.1:{http.sockets[0].getsockname()[1]}"
+    failures = 0
+    async with http, async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        context = await browser.new_context()
+        pages: asyncio.Queue = asyncio.Queue()
+        for _ in range(min(jobs, len(todo))):
+            pages.put_nowait(await context.new_page())
+
+        tasks = [print_part(pages, base_url, item['folder'], item['part'], timeout_ms) for item in todo]
+        for item, result in zip(todo, await asyncio.gather(*tasks, return_exceptions=True)):
+            label = f"{item['folder']}/{item['part']['name']}"
+            if isinstance(result, Exception):
+                failures += 1
+                print(f"❌ {label}: {result}")
+            else:
+                print(f"   📄 {label} ({result:.1f} s)")
+        await browser.close()
+    return failures
+
+
+def select_weeks(weeks: List[Dict[str, Any]], numbers: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Weeks with slides matching the requested numbers (all when None)"""
+    with_slides = [week for week in weeks if week['has_slides']]
+    if not numbers:
+        return with_slides
+    wanted = {number.zfill(2) for number in numbers}
+    missing = wanted - {week['number'] for week in with_slides}
+    for number in sorted(missing):
+        print(f"⚠️  Week {number} has no slides, skipping")
+    return [week for week in with_slides if week['number'] in wanted]
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Export lecture PDFs through a pool of headless browser pages')
+    parser.add_argument('--week', action='append', dest='weeks', metavar='NN',
+                        help='Week to export (repeatable, or comma-separated)')
+    parser.add_argument('--all', action='store_true', help='Export every week (default when no --week is given)')
+    parser.add_argument('--jobs', type=int, default=4, help='Browser pages printing in parallel (default: 4)')
+    parser.add_argument('--port', type=int, default=0, help='Port for the local server (default: any free port)')
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT_DIR), help='Directory for weekNN.pdf files')
+    parser.add_argument('--force', action='store_true', help='Re-render every part, ignoring cached PDFs')
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT_SECONDS,
+                        help=f'Seconds to wait for a part to load (default: {DEFAULT_TIMEOUT_SECONDS})')
+    args = parser.parse_args(argv)
+    if args.weeks:
+        args.weeks = [number.strip() for value in args.weeks for number in value.split(',') if number.strip()]
+    if args.all:
+        args.weeks = None
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    start = time.perf_counter()
+    slides_dir = PROJECT_ROOT / 'slides'
+    output_dir = Path(args.output)
+
+    weeks = scan_weeks_directory(slides_dir, PROJECT_ROOT / '.cache')
+    selected = select_weeks(weeks, args.weeks)
+    if not selected:
+        print("❌ No weeks to export")
+        return 1
+
+    base_key = hashlib.sha256(json.dumps([EXPORT_VERSION, template_hash(), style_hash(PROJECT_ROOT)])
+                              .encode('utf-8')).hexdigest()
+    state = load_state()
+    plans = []
+    todo = []
+    for week in selected:
+        plan = plan_week(week, slides_dir, base_key)
+        output = output_dir / f"week{plan['number']}.pdf"
+        previous = state['weeks'].get(plan['folder'], {})
+        if not args.force and previous.get('key') == plan['key'] and output.exists():
+            print(f"✅ Week {plan['number']}: unchanged, keeping {output}")
+            continue
+        plans.append(plan)
+        for part in plan['parts']:
+            if args.force or not part['pdf'].exists():
+                todo.append({'folder': plan['folder'], 'part': part})
+
+    if not plans:
+        print(f"✅ All {len(selected)} week(s) up to date ({time.perf_counter() - start:.1f} s)")
+        return 0
+
+    if todo and async_playwright is None:
+        print("❌ Playwright is required for PDF export: "
+              "pip install playwright && python3 -m playwright install chromium")
+        return 1
+    if PdfWriter is None and any(len(plan['parts']) > 1 for plan in plans):
+        print("❌ pypdf is required to merge part PDFs: pip install pypdf")
+        return 1
+
+    failures = 0
+    if todo:
+        print(f"🖨️  Rendering {len(todo)} part(s) of {len(plans)} week(s) with {min(args.jobs, len(todo))} page(s)")
+        # The export only needs deck pages, so the server gets no index page
+        server = PreviewServer(PROJECT_ROOT, weeks, lambda weeks: '')
+        failures = asyncio.run(render_parts(server, todo, args.jobs, args.port, args.timeout * 1000))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for plan in plans:
+        output = output_dir / f"week{plan['number']}.pdf"
+        if not all(part['pdf'].exists() for part in plan['parts']):
+            print(f"❌ Week {plan['number']}: some parts failed, {output} not updated")
+            continue
+        merge_parts(plan, output)
+        prune_part_pdfs(plan)
+        state['weeks'][plan['folder']] = {'key': plan['key'], 'parts': [part['name'] for part in plan['parts']]}
+        print(f"✅ Week {plan['number']}: {output} ({len(plan['parts'])} part(s))")
+
+    write_json(CACHE_DIR / STATE_NAME, state, indent=1, sort_keys=True)
+    print(f"⏱️  Exported {len(plans)} week(s) in {time.perf_counter() - start:.1f} s")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
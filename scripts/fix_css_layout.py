@@ -2,62 +2,50 @@
 """
 Fix CSS code blocks to use grid layout and add line numbers
 """
-import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+
+from slide_model import Deck, iter_blocks, load_deck, save_deck
+import add_line_numbers
+
+def process_deck(deck: Deck):
+    """Convert column containers to the grid layout and number CSS blocks"""
+    mods = []
+    for slide in deck.slides:
+        for block in iter_blocks(slide.blocks, ('columns', 'column')):
+            line = slide.lines[block.start]
+            # Replace <div class="columns"> with <div class="grid grid-cols-2 gap-8">
+            # and <div class="column"> with <div>
+            if block.kind == 'columns' and '<div class="columns">' in line:
+                fixed = line.replace('<div class="columns">', '<div class="grid grid-cols-2 gap-8">')
+            elif block.kind == 'column' and '<div class="column">' in line:
+                fixed = line.replace('<div class="column">', '<div>')
+            else:
+                continue
+            slide.replace_line(block.start, fixed)
+            mods.append(f"Slide {slide.h}: {block.kind} → grid layout")
+
+    # Add line numbers to CSS code blocks (the whole block is kept)
+    mods.extend(add_line_numbers.process_deck(deck, ('css',)))
+    return mods
 
 def fix_css_blocks(filepath):
     """Fix CSS code blocks in markdown file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Replace <div class="columns"> with <div class="grid grid-cols-2 gap-8">
-    content = re.sub(
-        r'<div class="columns">',
-        '<div class="grid grid-cols-2 gap-8">',
-        content
-    )
-
-    # Replace <div class="column"> with <div>
-    content = re.sub(
-        r'<div class="column">',
-        '<div>',
-        content
-    )
-
-    # Add line numbers to CSS code blocks
-    def add_line_numbers(match):
-        code = match.group(0)
-        # Check if already has line numbers
-        if '{' in code.split('\n')[0]:
-            return code
-
-        # Count lines in the code block
-        lines = code.split('\n')
-        code_lines = len([l for l in lines[1:-1] if l.strip()])  # Skip ``` lines
-
-        # Add line numbers
-        first_line = lines[0]
-        return first_line.replace('```css', f'```css {{1-{code_lines}}}')
-
-    # Find all CSS code blocks and add line numbers
-    content = re.sub(
-        r'```css\n.*?```',
-        add_line_numbers,
-        content,
-        flags=re.DOTALL
-    )
+    deck = load_deck(filepath)
+    process_deck(deck)
 
     # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    save_deck(filepath, deck)
 
     print(f"Fixed CSS blocks in: {filepath}")
 
 if __name__ == '__main__':
-    filepath = '/home/cbchoi/Projects/lecture-hmi/src/slides/week01-hci-hmi-theory/slides-05-practice3.md'
-    fix_css_blocks(filepath)
-
-    # Copy to slides folder
-    import shutil
-    dest = '/home/cbchoi/Projects/lecture-hmi/slides/week01-hci-hmi-theory/slides-05-practice3.md'
-    shutil.copy(filepath, dest)
-    print(f"Copied to: {dest}")
+    if len(sys.argv) < 2:
+        print("Usage: python3 fix_css_layout.py <file1> [file2] ...")
+        sys.exit(1)
+
+    # Edit the files under slides/; bootstrap.py publishes them to src/slides
+    for filepath in sys.argv[1:]:
+        fix_css_blocks(filepath)
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Layout-aware slide splitter
+
+Estimates the rendered height of every block from a cost model instead of
+counting raw lines: code lines are shorter than text lines, Korean (and
+other East Asian wide) characters take two columns when wrapping, headings
+are taller, and a two-column container is as tall as its tallest column.
+Slides over the height budget are cut in a single greedy pass over their
+top-level blocks (and top-level list items), so fences and column divs are
+never broken. Continuation slides repeat the slide heading with a (n/N)
+suffix, following the decks' existing convention.
+
+Usage:
+    python3 scripts/layout_split.py [--max-height N] [--costs costs.json] <file1> [file2] ...
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+
+from slide_model import Slide, Deck, Block, LIST_ITEM, display_width, is_safe_cut, load_deck, save_deck
+
+# Heights are in "text line" units: one unwrapped body text line is 1.0.
+# Defaults follow the 1400x900 Reveal canvas and src/themes/custom.css
+# (24px body text, h1 2.2em / h2 1.6em / h3 1.2em, code at ~0.6em).
+DEFAULT_COSTS: Dict[str, Any] = {
+    'max_height': 28.0,       # Budget per slide
+    'text_columns': 100,      # Half-width characters per body text line
+    'code_columns': 140,      # Characters per code line before pre-wrap kicks in
+    'text_line': 1.0,
+    'code_line': 0.7,
+    'code_padding': 1.5,      # <pre> padding and margins
+    'table_row': 1.3,
+    'blank': 0.4,             # Gap between blocks
+    'columns_padding': 0.5,
+    'heading': {1: 2.6, 2: 2.0, 3: 1.5, 4: 1.2, 5: 1.1, 6: 1.0},
+    'min_fill': 0.6,          # Earliest a heading may pull the cut forward, as a share of the budget
+}
+
+# An existing "(1/2)" style suffix on a heading
+PART_SUFFIX = re.compile(r'\s*\(\d+/\d+\)\s*$')
+# Inline HTML tags take no room of their own (style attributes can be long)
+HTML_TAG = re.compile(r'</?[A-Za-z][^>]*>')
+
+
+def merge_costs(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Return DEFAULT_COSTS updated with overrides (heading levels merged per level)"""
+    costs = dict(DEFAULT_COSTS)
+    costs['heading'] = dict(DEFAULT_COSTS['heading'])
+    for key, value in (overrides or {}).items():
+        if key == 'heading':
+            costs['heading'].update({int(level): cost for level, cost in value.items()})
+        else:
+            costs[key] = value
+    return costs
+
+
+def wrapped_lines(text: str, columns: float) -> int:
+    """Rendered lines for one source line wrapped at the given width"""
+    width = display_width(text.strip())
+    if width == 0:
+        return 1
+    return -(-width // max(1, int(columns)))
+
+
+def text_height(lines: List[str], costs: Dict[str, Any], scale: float) -> float:
+    columns = costs['text_columns'] * scale
+    visible = (HTML_TAG.sub('', line) for line in lines)
+    return sum(wrapped_lines(text, columns) for text in visible if text.strip()) * costs['text_line']
+
+
+def fence_height(lines: List[str], block: Block, costs: Dict[str, Any], scale: float) -> float:
+    end = block.end - 1 if block.closed else block.end
+    columns = costs['code_columns'] * scale
+    rendered = sum(wrapped_lines(line, columns) for line in lines[block.start + 1:end])
+    return costs['code_padding'] + rendered * costs['code_line']
+
+
+def block_height(lines: List[str], block: Block, costs: Dict[str, Any], scale: float = 1.0) -> float:
+    """
+    Estimate the rendered height of a block
+
+    Args:
+        lines: The slide's lines
+        block: Block to measure
+        costs: Cost model (see DEFAULT_COSTS)
+        scale: Share of the slide width available (0.5 inside a two-column layout)
+
+    Returns:
+        Height in text line units
+    """
+    kind = block.kind
+    if kind == 'blank':
+        return costs['blank']
+    if kind == 'heading':
+        return costs['heading'].get(block.level, costs['text_line'])
+    if kind == 'fence':
+        return fence_height(lines, block, costs, scale)
+    if kind == 'table':
+        # The |---| delimiter row is not rendered
+        rows = [line for line in lines[block.start:block.end] if not set(line.strip()) <= set('|-: ')]
+        return len(rows) * costs['table_row']
+    if kind == 'columns':
+        if not block.children:
+            return text_height(lines[block.start:block.end], costs, scale)
+        column_scale = scale / len(block.children)
+        tallest = max(sum(block_height(lines, child, costs, column_scale) for child in column.children)
+                      for column in block.children)
+        return costs['columns_padding'] + tallest
+    if kind == 'list':
+        height = 0.0
+        i = block.start
+        for fence in block.children:
+            height += text_height(lines[i:fence.start], costs, scale)
+            height += fence_height(lines, fence, costs, scale)
+            i = fence.end
+        return height + text_height(lines[i:block.end], costs, scale)
+    return text_height(lines[block.start:block.end], costs, scale)
+
+
+def split_units(slide: Slide) -> List[Block]:
+    """
+    Top-level blocks, with top-level lists broken into their items
+
+    These are the only places a slide may be cut. Fences and column
+    containers stay whole; list items keep their nested lines and fences.
+    """
+    lines = slide.lines
+    units = []
+    for block in slide.blocks:
+        if block.kind != 'list':
+            units.append(block)
+            continue
+        indent = len(lines[block.start]) - len(lines[block.start].lstrip())
+        fences = iter(block.children)
+        fence = next(fences, None)
+        item = None
+        i = block.start
+        while i < block.end:
+            if fence is not None and i == fence.start:
+                item.children.append(fence)
+                i = fence.end
+                fence = next(fences, None)
+                continue
+            match = LIST_ITEM.match(lines[i])
+            if match and len(match.group(1)) == indent:
+                if item is not None:
+                    item.end = i
+                item = Block('list', i, block.end)
+                units.append(item)
+            i += 1
+    return units
+
+
+def slide_heading(slide: Slide) -> Optional[Block]:
+    """The heading a slide opens with, if any"""
+    for block in slide.blocks:
+        if block.kind == 'heading':
+            return block
+        if block.kind not in ('blank', 'html'):
+            return None
+    return None
+
+
+def find_cuts(slide: Slide, costs: Dict[str, Any],
+              heading: Optional[Block] = None) -> Tuple[List[int], float]:
+    """
+    Choose cut lines for a slide in one pass
+
+    Units are added greedily until the next one would overflow the budget.
+    The cut then moves back to the last heading in the chunk once the chunk
+    is at least min_fill full, and never leaves a heading at the bottom of a
+    chunk. Continuation chunks reserve room for the carried heading.
+
+    Args:
+        slide: Slide to split
+        costs: Cost model
+        heading: Heading repeated on continuation slides, if any
+
+    Returns:
+        (cut line indices, estimated height of the whole slide)
+    """
+    lines = slide.lines
+    units = split_units(slide)
+    heights = [block_height(lines, unit, costs) for unit in units]
+    prefix = [0.0]
+    for height in heights:
+        prefix.append(prefix[-1] + height)
+
+    if prefix[-1] <= costs['max_height']:
+        return [], prefix[-1]
+
+    # Room for the blank lines split_slide adds around each separator
+    padding = 2 * costs['blank']
+    budget = costs['max_height'] - padding
+    carried = block_height(lines, heading, costs) + padding if heading is not None else 0.0
+    # The first chunk keeps the slide heading; later ones may not start before this unit
+    min_cut = 1
+    if heading is not None:
+        min_cut = next(n for n, unit in enumerate(units) if unit.start == heading.start) + 1
+    cuts = []
+    chunk_start = 0
+    last_heading = None
+    has_content = False
+
+    for j, unit in enumerate(units):
+        # Blank lines and bare closing tags never start a slide of their own
+        grows = unit.kind != 'blank' and heights[j] > 0
+        if grows and has_content and j >= min_cut and prefix[j + 1] - prefix[chunk_start] > budget:
+            cut = j
+            if last_heading is not None and \
+                    prefix[last_heading] - prefix[chunk_start] >= budget * costs['min_fill']:
+                cut = last_heading
+            # ... unless what follows the heading would overflow the next slide anyway
+            if prefix[j + 1] - prefix[cut] > costs['max_height'] - padding - carried:
+                cut = j
+            # Keep a heading with the content below it
+            k = cut - 1
+            while k >= min_cut and units[k].kind == 'blank':
+                k -= 1
+            if k >= min_cut and units[k].kind == 'heading':
+                cut = k
+            if not is_safe_cut(lines, units[cut].start):
+                cut = j
+            if not is_safe_cut(lines, units[cut].start):
+                continue
+            cuts.append(units[cut].start)
+            chunk_start = cut
+            min_cut = cut + 1
+            budget = costs['max_height'] - padding - carried
+            last_heading = None
+            has_content = False
+            for n in range(cut, j):
+                if units[n].kind not in ('blank', 'heading'):
+                    has_content = True
+                if units[n].kind == 'heading' and n >= min_cut:
+                    last_heading = n
+        if unit.kind == 'heading' and j >= min_cut:
+            last_heading = j
+        if unit.kind not in ('blank', 'heading'):
+            has_content = True
+
+    return cuts, prefix[-1]
+
+
+def continuation_heading(heading_line: str, part: int, total: int) -> str:
+    return f"{PART_SUFFIX.sub('', heading_line.rstrip())} ({part}/{total})"
+
+
+def split_slide(deck: Deck, index: int, costs: Dict[str, Any]) -> Optional[str]:
+    """
+    Split deck.slides[index] if it overflows the budget
+
+    Returns:
+        A modification message, or None if the slide was left alone
+    """
+    slide = deck.slides[index]
+    heading = slide_heading(slide)
+    cuts, height = find_cuts(slide, costs, heading)
+    if not cuts:
+        return None
+
+    heading_line = slide.lines[heading.start] if heading is not None else None
+    pieces = deck.split_slide(index, cuts)
+    total = len(pieces)
+    if heading_line is not None:
+        # A heading that already carries (k/M) belongs to a series; keep it verbatim
+        numbered = not PART_SUFFIX.search(heading_line)
+        if numbered:
+            pieces[0].replace_line(heading.start, continuation_heading(heading_line, 1, total))
+        for part, piece in enumerate(pieces[1:], start=2):
+            first = next((block for block in piece.blocks if block.kind != 'blank'), None)
+            if first is not None and first.kind == 'heading' and first.level <= heading.level:
+                continue
+            carried = continuation_heading(heading_line, part, total) if numbered else heading_line
+            piece.lines = piece.lines[:1] + [carried, ''] + piece.lines[1:]
+
+    return f"Slide {index + 1}: Split (est. height {height:.1f}) into {total} slides"
+
+
+def has_front_matter(deck: Deck) -> bool:
+    """Slidev-style decks open with a '---' front matter block and use their own separators"""
+    lines = deck.slides[0].lines
+    return bool(lines) and lines[0] == '---'
+
+
+def process_deck(deck: Deck, costs: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Split every slide whose estimated height exceeds the budget
+
+    Args:
+        deck: Deck to modify in place
+        costs: Cost model overrides (see DEFAULT_COSTS)
+
+    Returns:
+        List of modification messages
+    """
+    if has_front_matter(deck):
+        return []
+    costs = merge_costs(costs)
+    mods = []
+    for i in reversed(range(len(deck.slides))):
+        mod = split_slide(deck, i, costs)
+        if mod:
+            mods.append(mod)
+    mods.reverse()
+    return mods
+
+
+def process_file(filepath, costs: Optional[Dict[str, Any]] = None) -> List[str]:
+    deck = load_deck(filepath)
+    mods = process_deck(deck, costs)
+    save_deck(filepath, deck)
+    return mods
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Split slides whose estimated rendered height overflows')
+    parser.add_argument('files', nargs='+', help='Markdown deck files')
+    parser.add_argument('--max-height', type=float, help=f"Height budget in text lines (default: {DEFAULT_COSTS['max_height']})")
+    parser.add_argument('--costs', help='JSON file with cost model overrides')
+    args = parser.parse_args(argv)
+
+    costs = {}
+    if args.costs:
+        with open(args.costs, 'r', encoding='utf-8') as f:
+            costs = json.load(f)
+    if args.max_height:
+        costs['max_height'] = args.max_height
+
+    for filepath in args.files:
+        mods = process_file(filepath, costs)
+        print(f"Processed {filepath}")
+        for mod in mods:
+            print(f"  - {mod}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
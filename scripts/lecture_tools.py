@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Run slide transforms as one fused pipeline
+
+Each deck is read and parsed once, the selected transforms run in order on
+the in-memory slide model, and the file is written once (only if it
+changed). Files are spread over a process pool. Files the same transforms
+already left unchanged are looked up in .cache/content.db (see
+tools/content_db.py) and skipped while their content stays the same.
+
+Usage:
+    python3 scripts/lecture_tools.py run split,line-numbers,wrap,strip-time slides/
+    python3 scripts/lecture_tools.py list
+    python3 scripts/lecture_tools.py slides-index
+    python3 scripts/lecture_tools.py report [--max-lines 40] [--max-width 70]
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+SLIDES_DIR = PROJECT_ROOT / 'slides'
+# remove_time_allocations.py lives at the project root
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / 'tools'))
+
+from slide_model import parse_deck
+from output_writer import write_text
+from deck_assemble import load_source_map, deck_position
+import content_db
+import profiler
+import split_long_slides
+import aggressive_split
+import add_line_numbers
+import wrap_long_lines
+import fix_css_layout
+import remove_time_allocations
+import slide_metrics
+
+# Transform name → (process_deck function, description), in suggested order
+TRANSFORMS = {
+    'split': (split_long_slides.process_deck, 'Split slides over 40 non-empty lines'),
+    'aggressive-split': (aggressive_split.process_deck, 'Split slides whose estimated rendered height overflows'),
+    'fix-css': (fix_css_layout.process_deck, 'Convert columns/column divs to the grid layout, number CSS blocks'),
+    'line-numbers': (add_line_numbers.process_deck, 'Add {1-N} line numbers to bare code fences'),
+    'wrap': (wrap_long_lines.process_deck, 'Wrap long lines inside two-column layouts'),
+    'strip-time': (remove_time_allocations.process_deck, 'Remove (N분) time allocations'),
+}
+
+# Deck files picked up when a directory is given
+DEFAULT_PATTERN = 'slides*.md'
+
+# --profile output, relative to the project root
+DEFAULT_PROFILE_PATH = Path('.cache') / 'profile' / 'lecture-tools.trace.json'
+
+
+def parse_transforms(spec: str) -> List[str]:
+    """Validate a comma-separated transform list"""
+    names = [name.strip() for name in spec.split(',') if name.strip()]
+    unknown = [name for name in names if name not in TRANSFORMS]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(
+            f"unknown transform(s): {', '.join(unknown) or spec!r} "
+            f"(available: {', '.join(TRANSFORMS)})")
+    return names
+
+
+def collect_files(paths: List[str], pattern: str) -> List[Path]:
+    """Expand directories to their deck files; plain files are taken as given"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob(pattern)))
+        elif path.is_file():
+            files.append(path)
+        else:
+            print(f"Warning: {path} not found, skipping")
+    # Keep order, drop duplicates
+    return list(dict.fromkeys(files))
+
+
+def transforms_key(names: List[str]) -> str:
+    """
+    Key for the no-op runs recorded in the content database
+
+    Combines the transform names (in order) with a hash of the modules
+    that implement them, so editing a transform forgets its earlier runs.
+    """
+    sources = {sys.modules[TRANSFORMS[name][0].__module__].__file__ for name in names}
+    sources.add(sys.modules[parse_deck.__module__].__file__)
+    digest = hashlib.sha256()
+    for source in sorted(sources):
+        digest.update(Path(source).read_bytes())
+    return f"{','.join(names)}:{digest.hexdigest()[:16]}"
+
+
+def content_path(filepath: Path, slides_dir: Path) -> Optional[str]:
+    """Path of a deck file as the content database records it, or None outside slides_dir"""
+    try:
+        return filepath.resolve().relative_to(slides_dir.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def run_file(filepath: Path, names: List[str], dry_run: bool = False,
+             profile: bool = False) -> Dict[str, Any]:
+    """
+    Apply the transforms to one file: read once, transform in memory, write once
+
+    The write goes through the shared output layer (temp file + rename).
+
+    Args:
+        filepath: Deck file
+        names: Transform names, applied in order
+        dry_run: Report changes without writing
+        profile: Also return (step, start_us, end_us) timings for the trace
+
+    Returns:
+        Dictionary with the file path, whether it changed and the
+        modification messages per transform
+    """
+    timings = []
+    start = profiler.now_us()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        original = f.read()
+
+    deck = parse_deck(original)
+    if profile:
+        timings.append(('parse', start, profiler.now_us()))
+    mods = {}
+    for name in names:
+        process_deck = TRANSFORMS[name][0]
+        step_start = profiler.now_us()
+        mods[name] = process_deck(deck)
+        if profile:
+            timings.append((name, step_start, profiler.now_us()))
+
+    content = deck.text()
+    changed = content != original
+    if changed and not dry_run:
+        write_start = profiler.now_us()
+        write_text(filepath, content)
+        if profile:
+            timings.append(('write', write_start, profiler.now_us()))
+    result = {'path': str(filepath), 'changed': changed, 'mods': mods}
+    if profile:
+        result['timings'] = [('file', start, profiler.now_us())] + timings
+        result['pid'] = os.getpid()
+    return result
+
+
+def _run_file_args(args: Tuple[Path, List[str], bool, bool]) -> Dict[str, Any]:
+    return run_file(*args)
+
+
+def run_pipeline(files: List[Path], names: List[str], jobs: int = 1,
+                 dry_run: bool = False, profile: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the transforms over all files, in a process pool when jobs > 1
+
+    Returns:
+        Per-file results in input order
+    """
+    work = [(path, names, dry_run, profile) for path in files]
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(work) // (jobs * 4))
+            return list(pool.map(_run_file_args, work, chunksize=chunksize))
+    return [run_file(*args) for args in work]
+
+
+def record_timings(results: List[Dict[str, Any]]):
+    """Turn the per-file timings returned by run_file into trace events"""
+    for result in results:
+        for step, start, end in result.get('timings', []):
+            if step == 'file':
+                profiler.record(result['path'], start, end, 'file', pid=result['pid'], tid=result['pid'])
+            else:
+                profiler.record(step, start, end, 'transform', pid=result['pid'], tid=result['pid'],
+                                file=result['path'])
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    with profiler.span('collect'):
+        files = collect_files(args.paths, args.pattern)
+    if not files:
+        print("❌ No deck files found")
+        return 1
+
+    conn = None
+    key = transforms_key(args.transforms)
+    paths = {filepath: content_path(filepath, SLIDES_DIR) for filepath in files}
+    skipped = 0
+    if not args.no_cache:
+        with profiler.span('content db'):
+            try:
+                conn = content_db.connect()
+                content_db.refresh(conn, SLIDES_DIR)
+                clean = content_db.clean_paths(conn, key)
+            except sqlite3.Error as e:
+                print(f"Warning: content database unavailable ({e}), running every file")
+                conn = None
+            else:
+                todo = [filepath for filepath in files if paths[filepath] not in clean]
+                skipped = len(files) - len(todo)
+                files = todo
+
+    start = time.perf_counter()
+    with profiler.span('transforms', files=len(files), jobs=args.jobs):
+        results = run_pipeline(files, args.transforms, args.jobs, args.dry_run, profiler.enabled())
+    elapsed = time.perf_counter() - start
+    record_timings(results)
+
+    if conn is not None:
+        # Only unchanged files: a file that was rewritten may not be a fixed point yet
+        content_db.record_clean(conn, key, [paths[filepath] for filepath, result in zip(files, results)
+                                            if not result['changed'] and paths[filepath]])
+        conn.close()
+
+    totals = {name: 0 for name in args.transforms}
+    for result in results:
+        for name, mods in result['mods'].items():
+            totals[name] += len(mods)
+        if result['changed']:
+            action = 'Would update' if args.dry_run else 'Updated'
+            print(f"{action}: {result['path']}")
+            if args.verbose:
+                for name, mods in result['mods'].items():
+                    for mod in mods:
+                        print(f"  - [{name}] {mod}")
+
+    changed = sum(1 for result in results if result['changed'])
+    print(f"\n✅ {len(files)} file(s) processed, {changed} changed, "
+          f"{len(files) - changed} unchanged write(s) avoided ({elapsed:.2f} s, {args.jobs} job(s))")
+    if skipped:
+        print(f"   - {skipped} file(s) skipped: unchanged since these transforms last left them as they were")
+    for name, count in totals.items():
+        print(f"   - {name}: {count} modification(s)")
+    return 0
+
+
+def cmd_list(_args: argparse.Namespace) -> int:
+    for name, (_func, description) in TRANSFORMS.items():
+        print(f"{name:18} {description}")
+    return 0
+
+
+def load_metrics(args: argparse.Namespace):
+    """Build or refresh the per-week metrics tables, reporting how many were rebuilt"""
+    start = time.perf_counter()
+    cache_dir = None if args.no_cache else PROJECT_ROOT / slide_metrics.METRICS_DIR
+    tables, rebuilt = slide_metrics.build_index(Path(args.slides_dir), cache_dir)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return tables, rebuilt, elapsed_ms
+
+
+def cmd_slides_index(args: argparse.Namespace) -> int:
+    tables, rebuilt, elapsed_ms = load_metrics(args)
+    slides = sum(len(table['columns']['lines']) for table in tables.values())
+    print(f"🗂️  Slide metrics: {len(tables)} week(s), {slides} slides "
+          f"({len(tables) - rebuilt} cached, {rebuilt} rebuilt, {elapsed_ms:.1f} ms)")
+    return 0
+
+
+def cmd_report(args: argparse.Namespace) -> int:
+    tables, rebuilt, elapsed_ms = load_metrics(args)
+    overflows = slide_metrics.find_overflows(tables, args.max_lines, args.max_width)
+
+    # Where each slide shows up in the assembled deck (the viewer's #/h/v)
+    source_maps = {}
+    for record in overflows:
+        week = record['week']
+        if week not in source_maps:
+            source_maps[week] = load_source_map(Path(args.slides_dir) / week, PROJECT_ROOT / '.cache')
+        position = deck_position(source_maps[week], record['file'], record['line'] + 1) if source_maps[week] else None
+        record['deck'] = list(position) if position else None
+
+    if args.json:
+        print(json.dumps(overflows, ensure_ascii=False, indent=2))
+        return 0
+
+    week = None
+    for record in overflows:
+        if record['week'] != week:
+            week = record['week']
+            print(f"\n📁 {week}")
+        location = f"{record['file']}:{record['line'] + 1}"
+        heading = ' › '.join(record['heading']) or '(no heading)'
+        # Without a source map (slides.md drifted from the parts) only the part-relative position is known
+        position = '#{}/{}'.format(*record['deck']) if record['deck'] else f"part #{record['h']}/{record['v']}"
+        print(f"  {location:32} {position:11} {', '.join(record['problems'])}  {heading}")
+
+    print(f"\n{'⚠️ ' if overflows else '✅'} {len(overflows)} slide(s) over budget "
+          f"(>{args.max_lines} lines, or >{args.max_width} cols in a 2-column layout) in {len(tables)} week(s), "
+          f"{rebuilt} week(s) re-measured ({elapsed_ms:.1f} ms)")
+    return 0
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='lecture-tools',
+        description='Apply slide transforms to lecture decks in a single pass per file'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run transforms over deck files')
+    run_parser.add_argument(
+        'transforms',
+        type=parse_transforms,
+        help=f"Comma-separated transforms, applied in order ({', '.join(TRANSFORMS)})"
+    )
+    run_parser.add_argument('paths', nargs='+', help='Deck files or directories (e.g. slides/)')
+    run_parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes (default: CPU count)'
+    )
+    run_parser.add_argument(
+        '--pattern',
+        default=DEFAULT_PATTERN,
+        help=f'File pattern used inside directories (default: {DEFAULT_PATTERN})'
+    )
+    run_parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    run_parser.add_argument('--verbose', '-v', action='store_true', help='Print every modification')
+    run_parser.add_argument('--no-cache', action='store_true',
+                            help='Run every file without reading or recording no-op runs in .cache/content.db')
+    run_parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='TRACE_JSON',
+        help=f'Record per-file and per-transform timings as a Chrome trace (default path: {DEFAULT_PROFILE_PATH})'
+    )
+    run_parser.add_argument('--cprofile', action='store_true',
+                            help='With --profile, run each phase under cProfile and dump the slowest one')
+    run_parser.set_defaults(func=cmd_run)
+
+    list_parser = subparsers.add_parser('list', help='List available transforms')
+    list_parser.set_defaults(func=cmd_list)
+
+    index_parser = subparsers.add_parser('slides-index', help='Build or refresh the per-slide metrics index')
+    report_parser = subparsers.add_parser('report', help='List slides over the line/width budget')
+    for sub in (index_parser, report_parser):
+        sub.add_argument(
+            '--slides-dir',
+            default=str(SLIDES_DIR),
+            help='Directory holding the weekXX folders (default: slides/)'
+        )
+        sub.add_argument('--no-cache', action='store_true', help='Re-measure every week without reading or writing the cache')
+    index_parser.set_defaults(func=cmd_slides_index)
+    report_parser.add_argument('--max-lines', type=int, default=slide_metrics.MAX_LINES,
+                               help=f'Non-empty line budget (default: {slide_metrics.MAX_LINES})')
+    report_parser.add_argument('--max-width', type=int, default=slide_metrics.MAX_WIDTH,
+                               help=f'Width budget for text in 2-column layouts (default: {slide_metrics.MAX_WIDTH})')
+    report_parser.add_argument('--json', action='store_true', help='Print the matching slide records as JSON')
+    report_parser.set_defaults(func=cmd_report)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    profile = getattr(args, 'profile', None)
+    if getattr(args, 'cprofile', False) and profile is None:
+        profile = ''
+    if profile is None:
+        return args.func(args)
+
+    profiler.enable(cprofile=args.cprofile)
+    try:
+        return args.func(args)
+    finally:
+        trace_path = Path(profile) if profile else PROJECT_ROOT / DEFAULT_PROFILE_PATH
+        profiler.finish(trace_path, 'lecture-tools profile')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,13 +3,24 @@
 Restore CSS code blocks from original slides.md and add line numbers
 """
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+from output_writer import write_text
+
+if len(sys.argv) != 3:
+    print("Usage: python3 restore_css.py <original_slides.md> <target.md>")
+    sys.exit(1)
+
+original_path, target_path = sys.argv[1], sys.argv[2]
 
 # Read original file
-with open('/tmp/latest_slides.md', 'r', encoding='utf-8') as f:
+with open(original_path, 'r', encoding='utf-8') as f:
     original = f.read()
 
 # Read current file
-with open('/home/cbchoi/Projects/lecture-hmi/src/slides/week01-hci-hmi-theory/slides-05-practice3.md', 'r', encoding='utf-8') as f:
+with open(target_path, 'r', encoding='utf-8') as f:
     current = f.read()
 
 # Extract CSS code blocks from original
@@ -75,16 +86,6 @@ while i < len(lines):
 
 # Write result
 output = '\n'.join(result)
-with open('/home/cbchoi/Projects/lecture-hmi/src/slides/week01-hci-hmi-theory/slides-05-practice3.md', 'w', encoding='utf-8') as f:
-    f.write(output)
-
-print("Restored CSS blocks with line numbers")
-
-# Copy to slides folder
-import shutil
-dest = '/home/cbchoi/Projects/lecture-hmi/slides/week01-hci-hmi-theory/slides-05-practice3.md'
-shutil.copy(
-    '/home/cbchoi/Projects/lecture-hmi/src/slides/week01-hci-hmi-theory/slides-05-practice3.md',
-    dest
-)
-print(f"Copied to: {dest}")
+write_text(target_path, output)
+
+print(f"Restored CSS blocks with line numbers in: {target_path}")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Per-slide metrics index and overflow report
+
+Every week's deck (its slides.json parts, or slides.md) is measured once
+into a column table: one compact array per metric with a row per slide.
+Tables are cached in .cache/metrics/ keyed by the sha256 of the week's
+sources, so a report over the whole course only re-parses weeks that
+changed. The report applies the limits the transforms hard-code:
+split_long_slides.py splits slides over 40 non-empty lines and
+wrap_long_lines.py wraps text lines over 70 characters inside two-column
+layouts.
+"""
+
+import re
+import sys
+import json
+import hashlib
+from array import array
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+
+from slide_model import iter_blocks, parse_deck, display_width
+from wrap_long_lines import wrap_candidates
+from output_writer import write_json
+from deck_index import read_parts
+from week_metadata import WEEK_PATTERN
+
+METRICS_VERSION = 2
+METRICS_DIR = Path('.cache') / 'metrics'
+
+# Limits hard-coded in split_long_slides.py and wrap_long_lines.py
+MAX_LINES = 40
+MAX_WIDTH = 70
+
+# Column name → array typecode. Row n of every column describes slide n.
+COLUMNS = {
+    'part': 'H',         # Index into 'files'
+    'h': 'I',            # Reveal position within the part
+    'v': 'H',
+    'line': 'I',         # First line of the slide in its file (0-based)
+    'lines': 'I',        # Non-empty lines
+    'code_lines': 'I',   # Lines inside fences
+    'widest': 'I',       # Widest text line in display cells (code and table rows excluded)
+    'widest_code': 'I',  # Widest code line in display cells
+    'widest_wrap': 'I',  # Widest line wrap_long_lines may wrap, in characters as it counts them
+    'columns': 'B',      # 1 if the slide uses a column layout
+    'images': 'H',
+    'heading': 'I',      # Index into 'paths'
+}
+# Sparse per-language code line counts: one row per (slide, language)
+CODE_COLUMNS = {'slide': 'I', 'lang': 'H', 'lines': 'I'}
+
+IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(|<img\b', re.IGNORECASE)
+
+
+def week_sources(week_path: Path) -> List[Tuple[str, str]]:
+    """The files the viewer renders for a week: slides.json parts, else slides.md"""
+    parts = read_parts(week_path)
+    if parts:
+        return parts
+    slides_file = week_path / 'slides.md'
+    if slides_file.exists():
+        return [('slides.md', slides_file.read_text(encoding='utf-8'))]
+    return []
+
+
+def sources_hash(sources: List[Tuple[str, str]]) -> str:
+    digest = hashlib.sha256()
+    for name, text in sources:
+        digest.update(name.encode('utf-8') + b'\0' + text.encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+
+def new_table(files: List[str]) -> Dict[str, Any]:
+    return {
+        'files': files,
+        'languages': [],
+        'paths': [],
+        'columns': {name: array(code) for name, code in COLUMNS.items()},
+        'code': {name: array(code) for name, code in CODE_COLUMNS.items()},
+    }
+
+
+def _intern(table: Dict[str, Any], key: str, value, lookup: Dict) -> int:
+    if value not in lookup:
+        lookup[value] = len(table[key])
+        table[key].append(list(value) if isinstance(value, tuple) else value)
+    return lookup[value]
+
+
+def measure_week(sources: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Build the metrics table for one week
+
+    Args:
+        sources: (file name, content) pairs from week_sources
+
+    Returns:
+        Table dict with string tables ('files', 'languages', 'paths') and
+        array columns ('columns', plus the sparse 'code' table)
+    """
+    table = new_table([name for name, _text in sources])
+    columns = table['columns']
+    code = table['code']
+    languages: Dict[str, int] = {}
+    paths: Dict[Tuple[str, ...], int] = {}
+
+    for part, (_name, text) in enumerate(sources):
+        # Heading stack carried from slide to slide within a file
+        stack: List[Tuple[int, str]] = []
+        for slide in parse_deck(text).slides:
+            row = len(columns['part'])
+            lines = slide.lines
+            code_lines = set()
+            per_language: Dict[str, int] = {}
+            widest_code = 0
+            has_columns = 0
+            path = None
+
+            for block in iter_blocks(slide.blocks):
+                if block.kind == 'fence':
+                    end = block.end - 1 if block.closed else block.end
+                    body = range(block.start + 1, end)
+                    code_lines.update(range(block.start, block.end))
+                    language = block.lang or 'text'
+                    per_language[language] = per_language.get(language, 0) + len(body)
+                    for i in body:
+                        widest_code = max(widest_code, display_width(lines[i].rstrip()))
+                elif block.kind == 'columns':
+                    has_columns = 1
+                elif block.kind == 'heading':
+                    title = re.sub(r'^#+\s*', '', lines[block.start].strip()).rstrip('#').strip()
+                    while stack and stack[-1][0] >= block.level:
+                        stack.pop()
+                    stack.append((block.level, title))
+                    if path is None:
+                        path = tuple(title for _level, title in stack)
+
+            if path is None:
+                path = tuple(title for _level, title in stack)
+
+            widest = 0
+            images = 0
+            for i, line in enumerate(lines):
+                if i in code_lines:
+                    continue
+                if not line.lstrip().startswith('|'):
+                    widest = max(widest, display_width(line.rstrip()))
+                images += len(IMAGE_PATTERN.findall(line))
+
+            columns['part'].append(part)
+            columns['h'].append(slide.h)
+            columns['v'].append(slide.v)
+            columns['line'].append(slide.source_line)
+            columns['lines'].append(slide.content_line_count())
+            columns['code_lines'].append(sum(per_language.values()))
+            columns['widest'].append(widest)
+            columns['widest_code'].append(widest_code)
+            columns['widest_wrap'].append(max((len(lines[i]) for i in wrap_candidates(slide)), default=0))
+            columns['columns'].append(has_columns)
+            columns['images'].append(images)
+            columns['heading'].append(_intern(table, 'paths', path, paths))
+            for language, count in per_language.items():
+                code['slide'].append(row)
+                code['lang'].append(_intern(table, 'languages', language, languages))
+                code['lines'].append(count)
+
+    return table
+
+
+def table_to_json(table: Dict[str, Any], digest: str) -> Dict[str, Any]:
+    return {
+        'version': METRICS_VERSION,
+        'hash': digest,
+        'files': table['files'],
+        'languages': table['languages'],
+        'paths': table['paths'],
+        'columns': {name: column.tolist() for name, column in table['columns'].items()},
+        'code': {name: column.tolist() for name, column in table['code'].items()},
+    }
+
+
+def table_from_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    table = new_table(data['files'])
+    table['languages'] = data['languages']
+    table['paths'] = data['paths']
+    for name, code in COLUMNS.items():
+        table['columns'][name] = array(code, data['columns'][name])
+    for name, code in CODE_COLUMNS.items():
+        table['code'][name] = array(code, data['code'][name])
+    return table
+
+
+def load_week_table(week_path: Path, cache_dir: Optional[Path]) -> Tuple[Dict[str, Any], bool]:
+    """
+    Return a week's metrics table, from the cache when its sources are unchanged
+
+    Returns:
+        Tuple of (table, whether it was rebuilt)
+    """
+    sources = week_sources(week_path)
+    digest = sources_hash(sources)
+    cache_path = cache_dir / f'{week_path.name}.json' if cache_dir is not None else None
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == METRICS_VERSION and data.get('hash') == digest:
+                return table_from_json(data), False
+        except (OSError, ValueError, KeyError):
+            pass
+
+    table = measure_week(sources)
+    if cache_path is not None:
+        write_json(cache_path, table_to_json(table, digest), ensure_ascii=False, separators=(',', ':'))
+    return table, True
+
+
+def build_index(slides_dir: Path, cache_dir: Optional[Path]) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Load or build the metrics table of every weekXX folder
+
+    Returns:
+        Tuple of ({week folder: table}, number of weeks rebuilt)
+    """
+    tables = {}
+    rebuilt = 0
+    for week_path in sorted(slides_dir.iterdir()):
+        if week_path.is_dir() and WEEK_PATTERN.match(week_path.name):
+            tables[week_path.name], fresh = load_week_table(week_path, cache_dir)
+            rebuilt += fresh
+    return tables, rebuilt
+
+
+def slide_record(table: Dict[str, Any], row: int) -> Dict[str, Any]:
+    """Materialize one row of a table as a dict"""
+    record = {name: column[row] for name, column in table['columns'].items()}
+    record['file'] = table['files'][record.pop('part')]
+    record['heading'] = table['paths'][record['heading']]
+    record['columns'] = bool(record['columns'])
+    record['code'] = {}
+    return record
+
+
+def find_overflows(tables: Dict[str, Dict[str, Any]], max_lines: int = MAX_LINES,
+                   max_width: int = MAX_WIDTH) -> List[Dict[str, Any]]:
+    """
+    List slides over the line or width budget
+
+    The width budget is wrap_long_lines.py's rule: text lines in two-column
+    layouts, measured in characters. Only the 'lines' and 'widest_wrap'
+    columns are scanned; full records are built for the matching rows alone.
+
+    Returns:
+        Records (see slide_record) with 'week' and 'problems' added
+    """
+    results = []
+    for week, table in tables.items():
+        lines = table['columns']['lines']
+        widest = table['columns']['widest_wrap']
+        rows = [row for row in range(len(lines)) if lines[row] > max_lines or widest[row] > max_width]
+        if not rows:
+            continue
+        wanted = set(rows)
+        languages = {}
+        code = table['code']
+        for slide, lang, count in zip(code['slide'], code['lang'], code['lines']):
+            if slide in wanted:
+                languages.setdefault(slide, {})[table['languages'][lang]] = count
+        for row in rows:
+            record = slide_record(table, row)
+            record['week'] = week
+            record['code'] = languages.get(row, {})
+            record['problems'] = []
+            if record['lines'] > max_lines:
+                record['problems'].append(f"{record['lines']} lines > {max_lines}")
+            if record['widest_wrap'] > max_width:
+                record['problems'].append(f"{record['widest_wrap']} cols > {max_width} in 2-column layout")
+            results.append(record)
+    return results
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Shared markdown slide model for the slide transform scripts
+
+A deck is parsed once into slides, and each slide into blocks (fenced
+code, column containers, headings, lists, tables, paragraphs, ...) with
+their line offsets. Slides are split exactly as the viewer's Reveal markdown
+plugin splits them, with deck_index.SEPARATOR_PATTERN: a '---' (or '--' for
+vertical slides) line between two empty lines, even inside a code fence.
+Fences are only tracked within a slide, as the renderer sees them.
+"""
+
+import re
+import unicodedata
+from typing import List, Optional, Iterator, Iterable
+
+# tools/ must be on sys.path; every script that imports this module puts it there
+from deck_index import SEPARATOR_PATTERN
+from fences import fence_close_index, fence_open
+from output_writer import write_text
+
+LINE_NUMBERS = re.compile(r'[{\[]([^}\]]*)[}\]]')
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+LIST_ITEM = re.compile(r'^(\s*)([-*+]|\d{1,9}[.)])\s+')
+COLUMNS_OPEN = re.compile(r'<div class="(?:grid\b[^"]*|columns)"')
+DIV_OPEN = re.compile(r'<div\b')
+DIV_CLOSE = re.compile(r'</div\s*>')
+
+SEPARATORS = ('---', '--')
+
+
+class Block:
+    """
+    One block of a slide
+
+    start/end are line indices into the owning slide's lines (end is
+    exclusive). Fences carry lang/info/line_numbers; 'columns' blocks hold
+    'column' children, which in turn hold the blocks inside each column,
+    and 'list' blocks hold the fences indented inside their items.
+    """
+
+    def __init__(self, kind: str, start: int, end: int):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.level = 0
+        self.lang = ''
+        self.info = ''
+        self.line_numbers: Optional[str] = None
+        self.closed = True
+        self.children: List['Block'] = []
+
+    def __repr__(self) -> str:
+        return f'Block({self.kind!r}, {self.start}, {self.end})'
+
+
+def parse_fence(lines: List[str], start: int, end: int) -> Block:
+    match = fence_open(lines[start])
+    close = fence_close_index(lines, start, end)
+    block = Block('fence', start, close + 1 if close >= 0 else end)
+    block.closed = close >= 0
+    block.lang = match.group(3)
+    block.info = match.group(4)
+    numbers = LINE_NUMBERS.search(block.info)
+    if numbers:
+        block.line_numbers = numbers.group(1).strip()
+    return block
+
+
+def parse_columns(lines: List[str], start: int, end: int) -> Block:
+    """Parse a <div class="grid ..."> / <div class="columns"> container and its columns"""
+    container = Block('columns', start, end)
+    depth = 0
+    column_start = None
+    i = start
+    while i < end:
+        line = lines[i]
+        if depth >= 1 and fence_open(line):
+            close = fence_close_index(lines, i, end)
+            i = close + 1 if close >= 0 else end
+            continue
+
+        before = depth
+        opens = len(DIV_OPEN.findall(line))
+        depth += opens - len(DIV_CLOSE.findall(line))
+        if column_start is None and i > start and before == 1 and opens:
+            column_start = i
+        if column_start is not None and depth <= 1:
+            column = Block('column', column_start, i + 1)
+            column.children = parse_blocks(lines, column_start + 1, i)
+            container.children.append(column)
+            column_start = None
+        if depth <= 0:
+            container.end = i + 1
+            return container
+        i += 1
+
+    # Unclosed container: the open column runs to the end of the range
+    if column_start is not None:
+        column = Block('column', column_start, end)
+        column.children = parse_blocks(lines, column_start + 1, end)
+        container.children.append(column)
+    return container
+
+
+def starts_block(line: str) -> bool:
+    """Check whether a line interrupts a paragraph"""
+    stripped = line.lstrip()
+    return (not stripped or fence_open(line) is not None or HEADING.match(stripped) is not None
+            or LIST_ITEM.match(line) is not None or stripped.startswith(('|', '>', '<')))
+
+
+def parse_blocks(lines: List[str], start: int = 0, end: Optional[int] = None) -> List[Block]:
+    """
+    Parse lines[start:end] into a flat list of top-level blocks
+
+    Args:
+        lines: Slide lines
+        start: First line to parse
+        end: Line index to stop at (exclusive), default len(lines)
+
+    Returns:
+        Blocks covering every line of the range, in order
+    """
+    end = len(lines) if end is None else end
+    blocks = []
+    i = start
+    while i < end:
+        line = lines[i]
+        stripped = line.strip()
+        heading = HEADING.match(stripped)
+
+        if not stripped:
+            j = i + 1
+            while j < end and not lines[j].strip():
+                j += 1
+            block = Block('blank', i, j)
+        elif fence_open(line):
+            block = parse_fence(lines, i, end)
+        elif COLUMNS_OPEN.search(line):
+            block = parse_columns(lines, i, end)
+        elif heading and not line.startswith('    '):
+            block = Block('heading', i, i + 1)
+            block.level = len(heading.group(1))
+        elif stripped.startswith('|'):
+            j = i + 1
+            while j < end and lines[j].strip().startswith('|'):
+                j += 1
+            block = Block('table', i, j)
+        elif stripped.startswith('>'):
+            j = i + 1
+            while j < end and lines[j].strip().startswith('>'):
+                j += 1
+            block = Block('quote', i, j)
+        elif LIST_ITEM.match(line):
+            block = parse_list(lines, i, end)
+        elif stripped.startswith('<'):
+            j = i + 1
+            while j < end and lines[j].strip() and not COLUMNS_OPEN.search(lines[j]) \
+                    and not fence_open(lines[j]):
+                j += 1
+            block = Block('html', i, j)
+        else:
+            j = i + 1
+            while j < end and not starts_block(lines[j]):
+                j += 1
+            block = Block('paragraph', i, j)
+
+        blocks.append(block)
+        i = block.end
+    return blocks
+
+
+def parse_list(lines: List[str], start: int, end: int) -> Block:
+    """
+    Parse the list starting at lines[start]
+
+    Items, continuation lines and indented fences belong to the list; the
+    fences are kept as the list block's children.
+    """
+    block = Block('list', start, end)
+    i = start + 1
+    while i < end:
+        line = lines[i]
+        if not line.strip():
+            # A blank line continues the list only if an item or indented text follows
+            j = i + 1
+            while j < end and not lines[j].strip():
+                j += 1
+            if j < end and (LIST_ITEM.match(lines[j]) or lines[j].startswith((' ', '\t'))):
+                i = j
+                continue
+            break
+        if fence_open(line):
+            if not line.startswith((' ', '\t')):
+                break
+            fence = parse_fence(lines, i, end)
+            block.children.append(fence)
+            i = fence.end
+            continue
+        if LIST_ITEM.match(line) or line.startswith((' ', '\t')):
+            i += 1
+            continue
+        if starts_block(line):
+            break
+        i += 1  # lazy paragraph continuation
+    block.end = i
+    return block
+
+
+def iter_blocks(blocks: Iterable[Block], kinds: Optional[Iterable[str]] = None) -> Iterator[Block]:
+    """Walk blocks depth-first, including the contents of columns"""
+    kinds = set(kinds) if kinds is not None else None
+    for block in blocks:
+        if kinds is None or block.kind in kinds:
+            yield block
+        if block.children:
+            yield from iter_blocks(block.children, kinds)
+
+
+class Slide:
+    """
+    One slide of a deck
+
+    lines are the slide's own lines (without the separator line before it),
+    including the blank lines that surround separators. Blocks are parsed
+    on first access and re-parsed only after lines are replaced.
+    """
+
+    def __init__(self, lines: List[str], separator: Optional[str] = None, source_line: int = 0):
+        self._lines = lines
+        self._blocks: Optional[List[Block]] = None
+        self.separator = separator
+        self.source_line = source_line
+        self.h = 0
+        self.v = 0
+
+    @property
+    def lines(self) -> List[str]:
+        return self._lines
+
+    @lines.setter
+    def lines(self, lines: List[str]):
+        self._lines = lines
+        self._blocks = None
+
+    @property
+    def blocks(self) -> List[Block]:
+        if self._blocks is None:
+            self._blocks = parse_blocks(self._lines)
+        return self._blocks
+
+    def replace_line(self, index: int, text: str):
+        """
+        Replace one line in place
+
+        Block offsets stay valid, so callers may keep iterating the current
+        blocks; the next access to .blocks re-parses.
+        """
+        self._lines[index] = text
+        self._blocks = None
+
+    def block_lines(self, block: Block) -> List[str]:
+        return self._lines[block.start:block.end]
+
+    def text(self) -> str:
+        return '\n'.join(self._lines)
+
+    def content_line_count(self) -> int:
+        """Number of non-empty lines"""
+        return sum(1 for line in self._lines if line.strip())
+
+    def find_heading(self, text: str) -> Optional[Block]:
+        """Return the first heading block whose line is exactly text"""
+        for block in iter_blocks(self.blocks, ('heading',)):
+            if self._lines[block.start].strip() == text:
+                return block
+        return None
+
+
+class Deck:
+    """A parsed markdown deck: an ordered list of slides"""
+
+    def __init__(self, slides: List[Slide]):
+        self.slides = slides
+        self.renumber()
+
+    def renumber(self):
+        """Recompute each slide's h/v position after slides were added or removed"""
+        h, v = 0, 0
+        for i, slide in enumerate(self.slides):
+            if i > 0:
+                if slide.separator == '--':
+                    v += 1
+                else:
+                    h, v = h + 1, 0
+            slide.h, slide.v = h, v
+
+    def text(self) -> str:
+        lines: List[str] = []
+        for slide in self.slides:
+            if slide.separator:
+                lines.append(slide.separator)
+            lines.extend(slide.lines)
+        return '\n'.join(lines)
+
+    def split_slide(self, index: int, cuts: List[int]) -> List[Slide]:
+        """
+        Replace slide index with several slides cut at the given line indices
+
+        Continuation slides keep the slide's separator ('--' inside a vertical
+        stack, '---' otherwise), and blank lines are added where needed so
+        every separator is recognized by the viewer.
+
+        Args:
+            index: Slide index in self.slides
+            cuts: Increasing line indices (into the slide's lines) where new slides start
+
+        Returns:
+            The new slides
+        """
+        slide = self.slides[index]
+        bounds = [0] + [c for c in cuts if 0 < c < len(slide.lines)] + [len(slide.lines)]
+        pieces = []
+        for n, (a, b) in enumerate(zip(bounds, bounds[1:])):
+            lines = slide.lines[a:b]
+            if n > 0:
+                while lines and not lines[0].strip():
+                    lines.pop(0)
+                lines.insert(0, '')
+            if n < len(bounds) - 2:
+                while lines and not lines[-1].strip():
+                    lines.pop()
+                lines.append('')
+            separator = slide.separator if n == 0 else slide.separator or '---'
+            pieces.append(Slide(lines, separator, slide.source_line + a))
+        self.slides[index:index + 1] = pieces
+        self.renumber()
+        return pieces
+
+
+def is_safe_cut(lines: List[str], cut: int) -> bool:
+    """
+    Check that a cut does not border a stray '---'/'--' line
+
+    Such lines are plain content today, but the blank lines added around
+    the new separator would turn them into separators too.
+    """
+    after = cut
+    while after < len(lines) and not lines[after].strip():
+        after += 1
+    before = cut - 1
+    while before >= 0 and not lines[before].strip():
+        before -= 1
+    return not ((after < len(lines) and lines[after] in SEPARATORS)
+                or (before >= 0 and lines[before] in SEPARATORS))
+
+
+def parse_deck(text: str) -> Deck:
+    """
+    Parse markdown into a Deck
+
+    Each file is parsed on its own, the way the viewer renders every
+    slides.json part as a separate markdown section. A fence left open
+    runs to the end of its slide, since the separator regex cuts through
+    it. deck.text() reproduces the input exactly as long as nothing is
+    modified.
+    """
+    lines = text.split('\n')
+    slides = []
+    start = 0
+    separator = None
+    line, offset = 0, 0
+    for match in SEPARATOR_PATTERN.finditer(text):
+        line += text.count('\n', offset, match.start(1))
+        offset = match.start(1)
+        slides.append(Slide(lines[start:line], separator, start))
+        separator = match.group(1)
+        start = line + 1
+    slides.append(Slide(lines[start:], separator, start))
+    return Deck(slides)
+
+
+def load_deck(filepath) -> Deck:
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return parse_deck(f.read())
+
+
+def save_deck(filepath, deck: Deck) -> bool:
+    """
+    Write a deck back, atomically and only if its text changed
+
+    Returns:
+        True if the file was written
+    """
+    return write_text(filepath, deck.text())
+
+
+def display_width(text: str) -> int:
+    """Columns a string occupies, counting East Asian wide/fullwidth characters as two"""
+    width = 0
+    for ch in text:
+        if ord(ch) < 0x1100:
+            width += 1
+        elif unicodedata.east_asian_width(ch) in ('W', 'F'):
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+def count_fence_lines(slide: Slide, block: Block) -> int:
+    """Count non-empty code lines inside a fence block"""
+    end = block.end - 1 if block.closed else block.end
+    return sum(1 for line in slide.lines[block.start + 1:end] if line.strip())
+
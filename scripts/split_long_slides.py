@@ -4,91 +4,95 @@ Split slides that exceed 40 lines into multiple slides.
 Preserves 2-column layouts and code blocks.
 """
 
-import re
 import sys
-
-def count_lines(text):
-    """Count non-empty lines in text"""
-    return len([line for line in text.split('\n') if line.strip()])
-
-def split_slide_content(content, max_lines=40):
-    """Split slide content into chunks of max_lines"""
-    lines = content.split('\n')
-
-    # If already under limit, return as-is
-    if len(lines) <= max_lines:
-        return [content]
-
-    chunks = []
-    current_chunk = []
-    in_code_block = False
-    in_columns = False
-    code_fence_count = 0
-
-    for i, line in enumerate(lines):
-        # Track code blocks
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            code_fence_count += 1
-
-        # Track column divs
-        if '<div class="column' in line or '<div class="grid' in line:
-            in_columns = True
-        if in_columns and '</div>' in line:
-            # Check if this closes the columns
-            remaining = '\n'.join(lines[i+1:])
-            if '</div>' not in remaining[:100]:  # Heuristic
-                in_columns = False
-
-        current_chunk.append(line)
-
-        # Split point: when we hit max_lines and not in code/columns
-        if len(current_chunk) >= max_lines and not in_code_block and not in_columns:
-            # Try to find a good break point (empty line or header)
-            for j in range(len(current_chunk) - 1, max(0, len(current_chunk) - 10), -1):
-                if current_chunk[j].strip() == '' or current_chunk[j].startswith('#'):
-                    chunks.append('\n'.join(current_chunk[:j+1]))
-                    current_chunk = current_chunk[j+1:]
-                    break
-            else:
-                # No good break point found, just split
-                chunks.append('\n'.join(current_chunk))
-                current_chunk = []
-
-    # Add remaining content
-    if current_chunk:
-        chunks.append('\n'.join(current_chunk))
-
-    return chunks
-
-def process_file(filepath):
-    """Process a markdown file and split long slides"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Split by slide separator
-    slides = content.split('\n---\n')
-
-    new_slides = []
+from typing import List, Tuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+
+from slide_model import Slide, Deck, is_safe_cut, load_deck, save_deck
+
+def split_units(slide: Slide) -> List[Tuple[int, int]]:
+    """
+    Group a slide's top-level blocks into units that are never cut apart
+
+    A unit is one content block together with the headings right above it,
+    so a heading stays with what it introduces and blank lines never make
+    up a unit of their own.
+
+    Returns:
+        List of (first line index, non-empty line count) per unit
+    """
+    units = []
+    start, count = None, 0
+    for block in slide.blocks:
+        if block.kind == 'blank':
+            continue
+        if start is None:
+            start = block.start
+        count += sum(1 for line in slide.block_lines(block) if line.strip())
+        if block.kind != 'heading':
+            units.append((start, count))
+            start, count = None, 0
+    if start is not None:
+        # Trailing headings stay on the last slide
+        if units:
+            units[-1] = (units[-1][0], units[-1][1] + count)
+        else:
+            units.append((start, count))
+    return units
+
+def find_split_points(slide: Slide, max_lines=35):
+    """
+    Choose line indices where a long slide should be cut
+
+    Units (see split_units) are packed greedily so every piece has at most
+    max_lines non-empty lines; code blocks and column layouts are never
+    split, and a unit that is too long on its own becomes a slide by itself.
+    Cuts next to a stray '---'/'--' line are skipped (see is_safe_cut).
+    Every piece therefore has content, and since max_lines is below the
+    split threshold, running the split again leaves the deck unchanged.
+    """
+    if slide.content_line_count() <= max_lines:
+        return []
+
+    cuts = []
+    size = 0
+    for start, count in split_units(slide):
+        if size and size + count > max_lines and is_safe_cut(slide.lines, start):
+            cuts.append(start)
+            size = 0
+        size += count
+    return cuts
+
+def process_deck(deck: Deck, threshold=40, max_lines=35):
+    """
+    Split every slide with more than threshold non-empty lines
+
+    Returns:
+        List of modification messages
+    """
     modifications = []
+    for i, slide in reversed(list(enumerate(deck.slides))):
+        line_count = slide.content_line_count()
 
-    for i, slide in enumerate(slides):
-        line_count = count_lines(slide)
-
-        if line_count > 40:
+        if line_count > threshold:
             # Split this slide
-            sub_slides = split_slide_content(slide, max_lines=35)
-            new_slides.extend(sub_slides)
-            modifications.append(f"Slide {i+1}: Split from {line_count} lines into {len(sub_slides)} slides")
-        else:
-            new_slides.append(slide)
+            cuts = find_split_points(slide, max_lines=max_lines)
+            if cuts:
+                sub_slides = deck.split_slide(i, cuts)
+                modifications.append(f"Slide {i+1}: Split from {line_count} lines into {len(sub_slides)} slides")
+
+    modifications.reverse()
+    return modifications
 
-    # Rejoin with separators
-    new_content = '\n---\n'.join(new_slides)
+def process_file(filepath):
+    """Process a markdown file and split long slides"""
+    deck = load_deck(filepath)
+    modifications = process_deck(deck)
 
     # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    save_deck(filepath, deck)
 
     return modifications
 
@@ -4,6 +4,11 @@ Wrap long lines in two-column layouts to prevent horizontal scrolling
 """
 import re
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+
+from slide_model import Slide, Deck, iter_blocks, load_deck, save_deck
 
 def wrap_line(line, max_width=70):
     """Wrap a line if it's too long, respecting markdown formatting"""
@@ -46,44 +51,55 @@ def wrap_line(line, max_width=70):
 
     return line
 
-def process_file(filepath):
-    """Process a markdown file to wrap long lines in two-column layouts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    lines = content.split('\n')
-    result = []
-    in_two_column = False
-    in_code_block = False
-
-    for i, line in enumerate(lines):
-        # Track if we're in a two-column layout
-        if '<div class="grid grid-cols-2 gap-8">' in line:
-            in_two_column = True
-            result.append(line)
-            continue
+def wrap_candidates(slide: Slide):
+    """
+    Yield the indices of the lines process_deck may wrap
 
-        if in_two_column and '</div>' in line and '</div>' in lines[i-1] if i > 0 else False:
-            in_two_column = False
-            result.append(line)
+    Text lines inside two-column layouts, outside code blocks.
+    """
+    for container in iter_blocks(slide.blocks, ('columns',)):
+        if '<div class="grid grid-cols-2 gap-8">' not in slide.lines[container.start]:
             continue
+        code_lines = set()
+        for fence in iter_blocks(container.children, ('fence',)):
+            code_lines.update(range(fence.start, fence.end))
+        for block in iter_blocks(container.children):
+            if block.kind in ('fence', 'columns', 'column', 'blank'):
+                continue
+            for i in range(block.start, block.end):
+                if i not in code_lines:
+                    yield i
+
+def process_deck(deck: Deck, max_width=70):
+    """
+    Wrap long lines inside two-column layouts, outside code blocks
+
+    Returns:
+        List of modification messages
+    """
+    mods = []
+    for slide in deck.slides:
+        wrapped_lines = {}
+        for i in wrap_candidates(slide):
+            wrapped = wrap_line(slide.lines[i], max_width=max_width)
+            if wrapped != slide.lines[i]:
+                wrapped_lines[i] = wrapped
+
+        if wrapped_lines:
+            result = []
+            for i, line in enumerate(slide.lines):
+                result.extend(wrapped_lines.get(i, line).split('\n'))
+            slide.lines = result
+            mods.append(f"Slide {slide.h}: wrapped {len(wrapped_lines)} line(s)")
+    return mods
 
-        # Track code blocks
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            result.append(line)
-            continue
-
-        # Only wrap lines inside two-column layouts, outside code blocks
-        if in_two_column and not in_code_block:
-            wrapped = wrap_line(line, max_width=70)
-            result.append(wrapped)
-        else:
-            result.append(line)
+def process_file(filepath):
+    """Process a markdown file to wrap long lines in two-column layouts"""
+    deck = load_deck(filepath)
+    process_deck(deck)
 
     # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(result))
+    save_deck(filepath, deck)
 
     print(f"Processed: {filepath}")
 
@@ -0,0 +1,161 @@
+// Cross-week search over the shards written by tools/search_index.py.
+// Loaded by the index page on first use; the shards are fetched once, on the
+// first query, through /generated/manifest.json.
+// The tokenizer mirrors search_index.tokenize().
+
+const WORD = /[A-Za-z_][A-Za-z0-9_]*|[0-9]+/g;
+const HANGUL = /[가-힣]+/g;
+const IDENTIFIER_PART = /[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+/g;
+
+export function identifierParts(word) {
+    const parts = (word.match(IDENTIFIER_PART) || [])
+        .filter(part => part.length >= 2)
+        .map(part => part.toLowerCase());
+    return parts.length > 1 ? parts : [];
+}
+
+// Terms every hit must contain: the parts of multi-part identifiers (so
+// PropertyChanged also finds INotifyPropertyChanged), other words as they
+// are, and Hangul runs as bigrams
+export function queryTokens(query) {
+    const tokens = new Set();
+    for (const [word] of query.matchAll(WORD)) {
+        const parts = identifierParts(word);
+        if (parts.length) {
+            parts.forEach(part => tokens.add(part));
+        } else if (word.length >= 2) {
+            tokens.add(word.toLowerCase());
+        }
+    }
+    for (const [run] of query.matchAll(HANGUL)) {
+        if (run.length === 1) {
+            tokens.add(run);
+        }
+        for (let i = 0; i < run.length - 1; i++) {
+            tokens.add(run.slice(i, i + 2));
+        }
+    }
+    return [...tokens];
+}
+
+// Whole multi-part identifiers of the query; hits containing them rank higher
+function exactTokens(query) {
+    return [...query.matchAll(WORD)]
+        .map(([word]) => word)
+        .filter(word => identifierParts(word).length)
+        .map(word => word.toLowerCase());
+}
+
+let shardsPromise = null;
+
+function loadShards() {
+    if (!shardsPromise) {
+        shardsPromise = fetch('/generated/manifest.json', { cache: 'no-cache' })
+            .then(response => response.ok ? response.json() : { weeks: {} })
+            .then(manifest => Promise.all(Object.values(manifest.weeks)
+                .filter(entry => entry.search)
+                .map(entry => fetch(entry.search)
+                    .then(response => response.ok ? response.json() : null)
+                    .catch(() => null))))
+            .then(shards => shards.filter(Boolean));
+    }
+    return shardsPromise;
+}
+
+// Slide ordinal → summed frequency for slides containing every token
+function matchShard(shard, tokens) {
+    let scores = null;
+    for (const token of tokens) {
+        const postings = shard.terms[token];
+        if (!postings) {
+            return null;
+        }
+        const next = new Map();
+        for (let i = 0; i < postings.length; i += 2) {
+            const ordinal = postings[i];
+            if (scores === null) {
+                next.set(ordinal, postings[i + 1]);
+            } else if (scores.has(ordinal)) {
+                next.set(ordinal, scores.get(ordinal) + postings[i + 1]);
+            }
+        }
+        if (!next.size) {
+            return null;
+        }
+        scores = next;
+    }
+    return scores;
+}
+
+function addExactBonus(shard, scores, exact) {
+    for (const token of exact) {
+        const postings = shard.terms[token] || [];
+        for (let i = 0; i < postings.length; i += 2) {
+            if (scores.has(postings[i])) {
+                scores.set(postings[i], scores.get(postings[i]) + 2 * postings[i + 1]);
+            }
+        }
+    }
+}
+
+export async function search(query, limit = 30) {
+    const tokens = queryTokens(query);
+    if (!tokens.length) {
+        return [];
+    }
+    const exact = exactTokens(query);
+    const shards = await loadShards();
+    const hits = [];
+    for (const shard of shards) {
+        const scores = matchShard(shard, tokens);
+        if (!scores) {
+            continue;
+        }
+        addExactBonus(shard, scores, exact);
+        for (const [ordinal, score] of scores) {
+            const [h, v, title, part, line] = shard.slides[ordinal];
+            hits.push({ week: shard.week, folder: shard.folder, h, v, title, part, line, score });
+        }
+    }
+    hits.sort((a, b) => b.score - a.score || a.week.localeCompare(b.week) || a.h - b.h);
+    return hits.slice(0, limit);
+}
+
+function escapeHtml(text) {
+    return text.replace(/[&<>"]/g, ch => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' })[ch]);
+}
+
+export function initCourseSearch(input, results) {
+    let pending = 0;
+
+    async function update() {
+        const query = input.value.trim();
+        const ticket = ++pending;
+        if (!query) {
+            results.innerHTML = '';
+            return;
+        }
+        const start = performance.now();
+        const hits = await search(query);
+        if (ticket !== pending) {
+            return;
+        }
+        const elapsed = (performance.now() - start).toFixed(1);
+        results.innerHTML = hits.length
+            ? `<div class="search-meta">${hits.length}개 결과 (${elapsed} ms)</div>` + hits.map(hit => `
+                <a class="search-hit" href="?week=${hit.week}#/${hit.h}${hit.v ? '/' + hit.v : ''}">
+                    <span class="search-week">Week ${hit.week}</span>
+                    <span class="search-title">${escapeHtml(hit.title || `슬라이드 ${hit.h + 1}`)}</span>
+                    ${hit.part ? `<span class="search-source">${escapeHtml(hit.part)}:${hit.line}</span>` : ''}
+                </a>`).join('')
+            : `<div class="search-meta">결과 없음 (${elapsed} ms)</div>`;
+    }
+
+    let timer = null;
+    input.addEventListener('input', () => {
+        clearTimeout(timer);
+        timer = setTimeout(update, 80);
+    });
+    loadShards();
+    update();
+}
@@ -0,0 +1,37 @@
+/**
+ * Regenerate the golden HTML for tests/test_deck_render.py
+ *
+ * Renders every tests/golden/*.md with the marked instance bundled in the
+ * Reveal markdown plugin, set up the way the viewer sets it up (the
+ * plugin's own code renderer, smartypants and breaks), and writes the
+ * result next to it as *.html.
+ *
+ * Usage:
+ *   npm run golden
+ *   node tests/golden/render_marked.mjs [path/to/plugin/markdown/markdown.esm.js]
+ */
+
+import { readdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { dirname, join, resolve } from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+
+const goldenDir = dirname(fileURLToPath(import.meta.url));
+const pluginPath = process.argv[2]
+    ? resolve(process.argv[2])
+    : join(goldenDir, '..', '..', 'node_modules', 'reveal.js', 'plugin', 'markdown', 'markdown.esm.js');
+
+const { default: RevealMarkdown } = await import(pathToFileURL(pluginPath).href);
+const plugin = RevealMarkdown();
+
+// init() installs the code renderer and options; no slides to convert here
+const emptyDeck = { querySelectorAll: () => [] };
+await plugin.init({
+    getConfig: () => ({ markdown: { smartypants: true, breaks: true } }),
+    getRevealElement: () => emptyDeck
+});
+
+for (const name of readdirSync(goldenDir).filter(name => name.endsWith('.md')).sort()) {
+    const markdown = readFileSync(join(goldenDir, name), 'utf8');
+    writeFileSync(join(goldenDir, name.replace(/\.md$/, '.html')), plugin.marked(markdown));
+    console.log(`✅ ${name.replace(/\.md$/, '.html')}`);
+}
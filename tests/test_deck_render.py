@@ -0,0 +1,119 @@
+"""
+Golden tests: deck_render against the marked output of the Reveal markdown plugin
+Each tests/golden/*.md is a slide taken from the corpus; the *.html next
+to it was rendered by marked as the viewer configures it (regenerate with
+`npm run golden`). Both sides are compared as parsed HTML, so escaping
+and whitespace between block tags do not matter.
+"""
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+import deck_render
+
+GOLDEN_DIR = Path(__file__).resolve().parent / 'golden'
+
+# Whitespace next to these tags does not render
+BLOCK_TAGS = {
+    'aside', 'blockquote', 'br', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'li',
+    'ol', 'p', 'pre', 'section', 'table', 'tbody', 'td', 'th', 'thead', 'tr', 'ul'
+}
+# marked leaves `{1-N}` in the class (the plugin only reads `[1-N]`);
+# deck_render turns both forms into data-line-numbers
+BRACE_LINE_NUMBERS = re.compile(r'^(\S*)\s*\{\s*(?:(\d+)\s*:)?\s*([\d\s,|-]*?)\s*\}$')
+
+
+class CanonicalHTML(HTMLParser):
+    """
+    Parse HTML into comparable tokens
+
+    Differences deck_render makes on purpose are normalized away: heading
+    ids (marked's headerIds), class="undefined" on fences without a
+    language, and `{1-N}` line numbers left in the class by marked.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tokens: List[Tuple] = []
+        self.in_pre = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value or '' for name, value in attrs}
+        if re.fullmatch(r'h[1-6]', tag):
+            attrs.pop('id', None)
+        if tag == 'code':
+            if attrs.get('class') == 'undefined':
+                attrs['class'] = ''
+            match = BRACE_LINE_NUMBERS.match(attrs.get('class', ''))
+            if match:
+                attrs['class'] = match.group(1)
+                attrs['data-line-numbers'] = match.group(3).replace(' ', '')
+                if match.group(2):
+                    attrs['data-ln-start-from'] = match.group(2)
+        self.tokens.append(('start', tag, tuple(sorted(attrs.items()))))
+        if tag == 'pre':
+            self.in_pre += 1
+
+    def handle_endtag(self, tag):
+        self.tokens.append(('end', tag))
+        if tag == 'pre':
+            self.in_pre -= 1
+
+    def handle_data(self, data):
+        if not self.in_pre:
+            data = re.sub(r'\s+', ' ', data)
+        if self.tokens and self.tokens[-1][0] == 'text':
+            data = self.tokens.pop()[1] + data
+        self.tokens.append(('text', data))
+
+    def handle_comment(self, data):
+        self.tokens.append(('comment', data.strip()))
+
+
+def canonical(markup: str) -> List[Tuple]:
+    """Tokens of markup with whitespace-only differences removed"""
+    parser = CanonicalHTML()
+    parser.feed(markup)
+    parser.close()
+    tokens = parser.tokens
+    result = []
+    in_pre = 0
+    for i, token in enumerate(tokens):
+        if token[0] == 'start' and token[1] == 'pre':
+            in_pre += 1
+        elif token[0] == 'end' and token[1] == 'pre':
+            in_pre -= 1
+        elif token[0] == 'text' and not in_pre:
+            text = token[1]
+            if i == 0 or (tokens[i - 1][0] != 'text' and tokens[i - 1][1] in BLOCK_TAGS):
+                text = text.lstrip()
+            if i == len(tokens) - 1 or (tokens[i + 1][0] != 'text' and tokens[i + 1][1] in BLOCK_TAGS):
+                text = text.rstrip()
+            if not text:
+                continue
+            token = ('text', text)
+        result.append(token)
+    return result
+
+
+@pytest.fixture
+def no_highlighting(monkeypatch):
+    """Render fences as plain escaped code, the way marked does"""
+    monkeypatch.setattr(deck_render, 'highlight_code', lambda code, lang: None)
+
+
+@pytest.mark.parametrize('name', sorted(path.stem for path in GOLDEN_DIR.glob('*.md')))
+def test_matches_marked(name, no_highlighting):
+    markdown = (GOLDEN_DIR / f'{name}.md').read_text(encoding='utf-8')
+    expected = (GOLDEN_DIR / f'{name}.html').read_text(encoding='utf-8')
+    assert canonical(deck_render.render_markdown(markdown)) == canonical(expected)
+
+
+def test_canonical_keeps_code_whitespace():
+    assert canonical('<pre><code>a\n  b</code></pre>') != canonical('<pre><code>a\n b</code></pre>')
+    assert canonical('<p>a\n<strong>b</strong></p>\n<ul>\n<li>c</li>\n</ul>') == \
+        canonical('<p>a <strong>b</strong></p><ul><li>c</li></ul>')
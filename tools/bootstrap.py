@@ -5,178 +5,141 @@ Dynamically generates index.html based on available weeks in slides/ directory
 """
 
 import os
-import re
 import json
+import time
+import asyncio
 import shutil
+import hashlib
+import argparse
 from pathlib import Path
-from typing import List, Dict, Any
-
-def scan_weeks_directory(slides_path: Path) -> List[Dict[str, Any]]:
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from watcher import create_watcher
+from deck_index import build_slide_indexes
+from deck_assemble import assemble_weeks, note_drift, format_results as format_assembly
+from deck_pages import REVEAL_CDN
+from week_metadata import WEEK_PATTERN, scan_weeks_directory, extract_week_info, write_course_structure
+from output_writer import write_text, write_json, copy_file, reset_write_stats, format_write_stats
+from preview_server import PreviewServer, run as run_preview_server
+import profiler
+
+# Manifest of synced slide files, stored next to src/slides
+MANIFEST_NAME = '.slides-manifest.json'
+MANIFEST_VERSION = 1
+
+# Strategies for publishing slides/ into src/slides
+SYNC_MODES = ('copy', 'hardlink', 'symlink', 'alias')
+# Written into config/ for --mode alias; read by config/vite.config.ts
+ALIAS_CONFIG_NAME = 'slides-alias.json'
+# `serve` listens here unless --host/--port say otherwise
+DEFAULT_SERVE_HOST = '127.0.0.1'
+DEFAULT_SERVE_PORT = 8000
+# --profile output, relative to the project root
+DEFAULT_PROFILE_PATH = Path('.cache') / 'profile' / 'bootstrap.trace.json'
+# Reveal plugins of the ?week= viewer. 'eager' ones are fetched in parallel
+# with the core (and modulepreloaded); 'lazy' ones are imported on first use
+# of their trigger: a key (with an action to run once loaded), or 'modifier'
+# for the Alt/Ctrl key that precedes a zoom click
+REVEAL_PLUGINS = [
+    {'name': 'markdown', 'src': f'{REVEAL_CDN}/plugin/markdown/markdown.esm.js', 'load': 'eager'},
+    {'name': 'highlight', 'src': f'{REVEAL_CDN}/plugin/highlight/highlight.esm.js', 'load': 'eager'},
+    {'name': 'notes', 'src': f'{REVEAL_CDN}/plugin/notes/notes.esm.js', 'load': 'lazy',
+     'trigger': {'key': 's', 'action': 'open'}},
+    {'name': 'search', 'src': f'{REVEAL_CDN}/plugin/search/search.esm.js', 'load': 'lazy',
+     'trigger': {'key': 'f', 'ctrl': True, 'shift': True, 'action': 'open'}},
+    {'name': 'zoom', 'src': f'{REVEAL_CDN}/plugin/zoom/zoom.esm.js', 'load': 'lazy',
+     'trigger': {'modifier': True}},
+]
+
+def render_lecture_card(week: Dict[str, Any]) -> str:
     """
-    Scan slides directory for weekXX folders and extract week information
+    Render the index.html lecture card for one week
 
     Args:
-        slides_path: Path to slides directory
+        week: Week dictionary from extract_week_info
 
     Returns:
-        List of week dictionaries with metadata
+        Card HTML fragment
     """
-    weeks = []
+    week_num = week['number']
+    title = week['title']
+    description = week['description']
 
-    if not slides_path.exists():
-        print(f"Warning: slides directory not found at {slides_path}")
-        return weeks
+    # Generate status indicators
+    indicators = []
+    if week['has_slides']:
+        indicators.append('<span class="status-indicator slides">📄 Slides</span>')
+    if week['has_code']:
+        indicators.append('<span class="status-indicator code">💻 Code</span>')
+    if week['has_images']:
+        indicators.append('<span class="status-indicator images">🖼️ Images</span>')
 
-    # Pattern to match weekXX or weekXX-description directories
-    week_pattern = re.compile(r'^week(\d{2})(?:-.*)?$')
+    indicators_html = ''.join(indicators) if indicators else '<span class="status-indicator none">📋 준비중</span>'
 
-    for item in slides_path.iterdir():
-        if item.is_dir():
-            match = week_pattern.match(item.name)
-            if match:
-                week_num = match.group(1)
-                week_info = extract_week_info(item, week_num)
-                if week_info:
-                    weeks.append(week_info)
 
-    # Sort weeks by number
-    weeks.sort(key=lambda x: x['number'])
-    return weeks
+    return f'''
+            <div class="lecture-card">
+                <div class="week-number">Week {week_num}</div>
+                <h3>{title}</h3>
+                <div class="description">
+                    {description}
+                </div>
+                <div class="status-indicators">
+                    {indicators_html}
+                </div>
+                <div class="actions">
+                    <a href="?week={week_num}" class="view-link">강의 보기</a>
+                    <a href="?week={week_num}" data-deck-page="{week_num}" class="view-link viewer-link" title="필기 도구 없이 이 주차의 파트만 불러오는 단독 페이지">단독 페이지</a>
+                    <button onclick="generatePDF('{week_num}')" class="pdf-button">PDF 생성</button>
+                </div>
+            </div>'''
 
-def extract_week_info(week_path: Path, week_num: str) -> Dict[str, Any]:
+def select_plugins(names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
     """
-    Extract week information from week directory
+    Pick the viewer's Reveal plugins from REVEAL_PLUGINS
 
     Args:
-        week_path: Path to weekXX directory
-        week_num: Week number string (e.g., "03")
+        names: Plugin names to keep (None keeps all); markdown is always kept
 
     Returns:
-        Dictionary with week metadata
+        Plugin entries in REVEAL_PLUGINS order
     """
-    week_info = {
-        'number': week_num,
-        'title': f'Week {week_num}',
-        'description': 'No description available',
-        'has_slides': False,
-        'has_code': False,
-        'has_images': False
-    }
-
-    # Check for slides.md
-    slides_file = week_path / 'slides.md'
-    if slides_file.exists():
-        week_info['has_slides'] = True
-        # Try to extract title from slides.md
-        title = extract_title_from_slides(slides_file)
-        if title:
-            week_info['title'] = title
-
-    # Check for summary.md
-    summary_file = week_path / 'summary.md'
-    if summary_file.exists():
-        summary_info = extract_summary_info(summary_file)
-        week_info.update(summary_info)
-
-    # Check for code directory
-    code_dir = week_path / 'code'
-    if code_dir.exists() and any(code_dir.iterdir()):
-        week_info['has_code'] = True
-
-    # Check for images directory
-    images_dir = week_path / 'images'
-    if images_dir.exists() and any(images_dir.iterdir()):
-        week_info['has_images'] = True
-
-    return week_info
-
-def extract_title_from_slides(slides_file: Path) -> str:
-    """Extract title from slides.md file"""
-    try:
-        with open(slides_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('# '):
-                    return line[2:].strip()
-                # Stop after first few lines to avoid performance issues
-                if len(line) > 0 and not line.startswith('#'):
-                    break
-    except Exception as e:
-        print(f"Warning: Could not read {slides_file}: {e}")
-    return ""
-
-def extract_summary_info(summary_file: Path) -> Dict[str, Any]:
-    """Extract information from summary.md file"""
-    info = {}
-
-    try:
-        with open(summary_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-            # Extract title (first h1)
-            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-            if title_match:
-                info['title'] = title_match.group(1).strip()
-
-            # Extract learning objectives (첫 번째 ## 🎯 학습 목표 섹션)
-            objective_match = re.search(
-                r'## 🎯 학습 목표\s*\n(.+?)(?=\n##|\n$)',
-                content,
-                re.DOTALL
-            )
-            if objective_match:
-                info['description'] = objective_match.group(1).strip()
-
-    except Exception as e:
-        print(f"Warning: Could not read {summary_file}: {e}")
-
-    return info
-
-def generate_index_html(weeks: List[Dict[str, Any]]) -> str:
+    if names is None:
+        return list(REVEAL_PLUGINS)
+    unknown = set(names) - {plugin['name'] for plugin in REVEAL_PLUGINS}
+    if unknown:
+        raise ValueError(f"Unknown Reveal plugin(s): {', '.join(sorted(unknown))}")
+    return [plugin for plugin in REVEAL_PLUGINS if plugin['name'] in names or plugin['name'] == 'markdown']
+
+def generate_index_html(weeks: List[Dict[str, Any]],
+                        rendered_cards: Optional[Dict[str, str]] = None,
+                        plugins: Optional[List[str]] = None) -> str:
     """
     Generate complete index.html content
 
     Args:
         weeks: List of week dictionaries
+        rendered_cards: Optional cache of card HTML by week number; cards
+            missing from it are rendered and stored, so the watch loop only
+            re-renders weeks it has evicted
+        plugins: Reveal plugin names for the viewer (default: all of REVEAL_PLUGINS)
 
     Returns:
         Complete HTML content as string
     """
+    reveal_plugins = select_plugins(plugins)
+    reveal_core = f'{REVEAL_CDN}/dist/reveal.esm.js'
+    preload_urls = [reveal_core] + [p['src'] for p in reveal_plugins if p['load'] == 'eager']
 
     # Generate lecture cards HTML
+    if rendered_cards is None:
+        rendered_cards = {}
     lecture_cards = []
     for week in weeks:
-        week_num = week['number']
-        title = week['title']
-        description = week['description']
-
-        # Generate status indicators
-        indicators = []
-        if week['has_slides']:
-            indicators.append('<span class="status-indicator slides">📄 Slides</span>')
-        if week['has_code']:
-            indicators.append('<span class="status-indicator code">💻 Code</span>')
-        if week['has_images']:
-            indicators.append('<span class="status-indicator images">🖼️ Images</span>')
-
-        indicators_html = ''.join(indicators) if indicators else '<span class="status-indicator none">📋 준비중</span>'
-
-        card_html = f'''
-            <div class="lecture-card">
-                <div class="week-number">Week {week_num}</div>
-                <h3>{title}</h3>
-                <div class="description">
-                    {description}
-                </div>
-                <div class="status-indicators">
-                    {indicators_html}
-                </div>
-                <div class="actions">
-                    <a href="?week={week_num}" class="view-link">강의 보기</a>
-                    <button onclick="generatePDF('{week_num}')" class="pdf-button">PDF 생성</button>
-                </div>
-            </div>'''
-
+        card_html = rendered_cards.get(week['number'])
+        if card_html is None:
+            card_html = render_lecture_card(week)
+            rendered_cards[week['number']] = card_html
         lecture_cards.append(card_html)
 
     cards_html = '\n'.join(lecture_cards)
@@ -194,6 +157,18 @@ def generate_index_html(weeks: List[Dict[str, Any]]) -> str:
     <link rel="stylesheet" href="/themes/custom.css">
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/reveal.js@5.0.4/plugin/highlight/monokai.css">
     <link rel="stylesheet" href="/css/main.css">
+    <script>
+        // Presentation view: fetch the Reveal core and eager plugins while the page loads
+        if (new URLSearchParams(window.location.search).has('week')) {{
+            {json.dumps(preload_urls)}.forEach(href => {{
+                const link = document.createElement('link');
+                link.rel = 'modulepreload';
+                link.href = href;
+                link.crossOrigin = 'anonymous';
+                document.head.appendChild(link);
+            }});
+        }}
+    </script>
 </head>
 
 <body class="theme-custom">
@@ -207,6 +182,11 @@ def generate_index_html(weeks: List[Dict[str, Any]]) -> str:
                 <span class="stat-item">💻 {sum(1 for w in weeks if w.get("has_code"))}개 코드 예제</span>
                 <span class="stat-item">📄 {sum(1 for w in weeks if w.get("has_slides"))}개 슬라이드</span>
             </div>
+            <div class="course-search">
+                <input id="course-search-input" type="search" autocomplete="off"
+                       placeholder="🔍 전체 강의 검색 (예: INotifyPropertyChanged, 데이터 바인딩)">
+                <div id="course-search-results" class="search-results"></div>
+            </div>
         </div>
 
         <div class="lectures-grid">
@@ -318,6 +298,13 @@ def generate_index_html(weeks: List[Dict[str, Any]]) -> str:
             }}
         }}
 
+        // Cross-week search: the module and the week shards load on first focus
+        const searchInput = document.getElementById('course-search-input');
+        searchInput.addEventListener('focus', async () => {{
+            const {{ initCourseSearch }} = await import('/js/course-search.js');
+            initCourseSearch(searchInput, document.getElementById('course-search-results'));
+        }}, {{ once: true }});
+
         // Check if we should show presentation or main page
         if (weekParam) {{
             showPresentation();
@@ -330,24 +317,105 @@ def generate_index_html(weeks: List[Dict[str, Any]]) -> str:
             presentationView.classList.add('hidden');
             document.title = 'HCI/HMI Lecture';
             updateTheme(currentTheme);
+            linkDeckPages();
+        }}
+
+        // Point the cards' secondary link at the fingerprinted standalone
+        // deck page (deck_pages.py); it stays on ?week= until the manifest has one
+        async function linkDeckPages() {{
+            const manifest = await loadManifest();
+            document.querySelectorAll('a[data-deck-page]').forEach(link => {{
+                const entry = manifest.weeks[link.dataset.deckPage];
+                if (entry && entry.page) {{
+                    link.href = entry.page;
+                }}
+            }});
+        }}
+
+        // Week → folder and fingerprinted deck URLs, written by bootstrap
+        // (the manifest is revalidated; everything it points to is immutable)
+        async function loadManifest() {{
+            try {{
+                const response = await fetch('/generated/manifest.json', {{ cache: 'no-cache' }});
+                return response.ok ? await response.json() : {{ weeks: {{}} }};
+            }} catch (error) {{
+                return {{ weeks: {{}} }};
+            }}
+        }}
+
+        // Reveal core and plugins, from REVEAL_PLUGINS in bootstrap.py
+        const revealCore = '{reveal_core}';
+        const revealPlugins = {json.dumps(reveal_plugins)};
+
+        async function importDefault(src) {{
+            return (await import(src)).default;
+        }}
+
+        function installLazyPlugins(deck) {{
+            revealPlugins.filter(plugin => plugin.load === 'lazy').forEach(plugin => {{
+                const trigger = plugin.trigger || {{}};
+                let loading = null;
+                const load = () => loading || (loading = importDefault(plugin.src).then(factory => {{
+                    deck.registerPlugin(factory);
+                    return deck.getPlugin(plugin.name);
+                }}));
+
+                const onKeydown = (event) => {{
+                    if (trigger.modifier) {{
+                        // Load on the Alt/Ctrl press so the plugin is ready for the click
+                        if (event.altKey || event.ctrlKey) {{
+                            document.removeEventListener('keydown', onKeydown, true);
+                            load();
+                        }}
+                        return;
+                    }}
+                    if (['INPUT', 'TEXTAREA'].includes(event.target.tagName) ||
+                        event.key.toLowerCase() !== trigger.key ||
+                        event.ctrlKey !== Boolean(trigger.ctrl) ||
+                        event.shiftKey !== Boolean(trigger.shift)) {{
+                        return;
+                    }}
+                    event.preventDefault();
+                    event.stopPropagation();
+                    document.removeEventListener('keydown', onKeydown, true);
+                    load().then(instance => {{
+                        if (trigger.action && instance && instance[trigger.action]) {{
+                            instance[trigger.action]();
+                        }}
+                    }}).catch(error => console.warn(`Could not load ${{plugin.name}} plugin:`, error));
+                }};
+                document.addEventListener('keydown', onKeydown, true);
+            }});
         }}
 
         async function showPresentation() {{
             try {{
-                // Import reveal.js modules
-                const Reveal = (await import('https://cdn.jsdelivr.net/npm/reveal.js@5.0.4/dist/reveal.esm.js')).default;
-                const Markdown = (await import('https://cdn.jsdelivr.net/npm/reveal.js@5.0.4/plugin/markdown/markdown.esm.js')).default;
-                const Highlight = (await import('https://cdn.jsdelivr.net/npm/reveal.js@5.0.4/plugin/highlight/highlight.esm.js')).default;
-                const Notes = (await import('https://cdn.jsdelivr.net/npm/reveal.js@5.0.4/plugin/notes/notes.esm.js')).default;
-                const Search = (await import('https://cdn.jsdelivr.net/npm/reveal.js@5.0.4/plugin/search/search.esm.js')).default;
-                const Zoom = (await import('https://cdn.jsdelivr.net/npm/reveal.js@5.0.4/plugin/zoom/zoom.esm.js')).default;
+                // Core and eager plugins in parallel (already modulepreloaded);
+                // the manifest is fetched alongside them
+                const eagerPlugins = revealPlugins.filter(plugin => plugin.load === 'eager');
+                const [Reveal, manifest, ...plugins] = await Promise.all([
+                    importDefault(revealCore),
+                    loadManifest(),
+                    ...eagerPlugins.map(plugin => importDefault(plugin.src))
+                ]);
 
                 mainPage.classList.add('hidden');
                 presentationView.classList.remove('hidden');
 
-                // Load content
-                const content = await loadWeekContent(weekParam);
-                document.getElementById('slide-content').textContent = content;
+                // Load content: only the chunk behind the current #/n first
+                // when bootstrap generated a slide index for this week
+                const entry = manifest.weeks[weekParam.padStart(2, '0')] || null;
+                const folderName = entry ? entry.folder : null;
+                const slideIndex = entry && entry.index ? await loadSlideIndex(entry.index) : null;
+                const prerendered = Boolean(slideIndex && slideIndex.format === 'html');
+                let firstChunk = 0;
+                if (slideIndex) {{
+                    firstChunk = chunkForLocation(slideIndex);
+                    await buildChunkedSlides(folderName, slideIndex, firstChunk);
+                }} else {{
+                    const content = await loadWeekContent(weekParam, entry);
+                    document.getElementById('slide-content').textContent = content;
+                }}
 
                 // Initialize reveal.js
                 const deck = new Reveal({{
@@ -367,20 +435,26 @@ def generate_index_html(weeks: List[Dict[str, Any]]) -> str:
                         breaks: true
                     }},
                     highlight: {{
-                        highlightOnLoad: true
+                        // Pre-rendered chunks carry build-time highlighting
+                        highlightOnLoad: !prerendered
                     }},
-                    plugins: [Markdown, Highlight, Notes, Search, Zoom]
+                    plugins
                 }});
 
                 await deck.initialize();
+                installLazyPlugins(deck);
+                if (prerendered) {{
+                    highlightCodeBlocks(deck.getPlugin('highlight'),
+                        deck.getRevealElement().querySelectorAll('.slides pre code'));
+                }}
 
                 // Apply theme
                 updateTheme(currentTheme);
 
-                // Apply custom styling
-                setTimeout(() => {{
-                    applyCustomStyling();
-                }}, 100);
+                // Centered title/agenda slides were classified at build time
+                if (slideIndex && !prerendered) {{
+                    applySlideLayouts(deck, slideIndex);
+                }}
 
                 // Update page title
                 document.title = `Week ${{weekParam}} - HCI/HMI Lecture`;
@@ -390,13 +464,136 @@ def generate_index_html(weeks: List[Dict[str, Any]]) -> str:
 
                 // Add drawing functionality
                 addDrawingFeature(deck);
+
+                // Stream the remaining chunks in the background
+                if (slideIndex) {{
+                    streamRemainingChunks(deck, folderName, slideIndex, firstChunk);
+                }}
             }} catch (error) {{
                 console.error('Error loading presentation:', error);
                 showMainPage();
             }}
         }}
 
-        async function loadWeekContent(week) {{
+        async function loadSlideIndex(indexUrl) {{
+            try {{
+                const response = await fetch(indexUrl);
+                return response.ok ? await response.json() : null;
+            }} catch (error) {{
+                return null;
+            }}
+        }}
+
+        async function fetchChunk(folderName, chunk) {{
+            // Pre-rendered HTML when bootstrap produced it, markdown otherwise
+            const file = chunk.html || chunk.file;
+            const response = await fetch(`/generated/${{folderName}}/${{file}}`);
+            if (!response.ok) {{
+                throw new Error(`Chunk ${{file}} not found`);
+            }}
+            return {{ html: Boolean(chunk.html), text: await response.text() }};
+        }}
+
+        function chunkForLocation(slideIndex) {{
+            const match = window.location.hash.match(/^#\/(\d+)/);
+            const h = match ? parseInt(match[1]) : 0;
+            const slide = slideIndex.slides.find(s => s.h === h);
+            return slide ? slide.chunk : 0;
+        }}
+
+        function createChunkSections(chunkNum, content) {{
+            if (content.html) {{
+                // Sections were rendered at build time; no markdown parsing needed
+                const template = document.createElement('template');
+                template.innerHTML = content.text;
+                return Array.from(template.content.children);
+            }}
+            const section = document.createElement('section');
+            section.setAttribute('data-markdown', '');
+            section.setAttribute('data-separator', '^\\n---\\n$');
+            section.setAttribute('data-separator-vertical', '^\\n--\\n$');
+            section.setAttribute('data-chunk', chunkNum);
+            const template = document.createElement('textarea');
+            template.setAttribute('data-template', '');
+            template.textContent = content.text;
+            section.appendChild(template);
+            return [section];
+        }}
+
+        async function buildChunkedSlides(folderName, slideIndex, firstChunk) {{
+            // Printing lays out every page at init, so load the whole deck then
+            const printing = /print-pdf/gi.test(window.location.search);
+            const contents = await Promise.all(slideIndex.chunks.map((chunk, i) =>
+                (printing || i === firstChunk) ? fetchChunk(folderName, chunk) : null));
+
+            const slidesEl = presentationView.querySelector('.slides');
+            slidesEl.innerHTML = '';
+            slideIndex.chunks.forEach((chunk, i) => {{
+                if (contents[i] !== null) {{
+                    slidesEl.append(...createChunkSections(i, contents[i]));
+                    return;
+                }}
+                // Empty placeholders keep #/n slide numbers stable until the chunk arrives
+                for (let n = 0; n < chunk.count; n++) {{
+                    const placeholder = document.createElement('section');
+                    placeholder.setAttribute('data-chunk-placeholder', i);
+                    slidesEl.appendChild(placeholder);
+                }}
+            }});
+        }}
+
+        function highlightCodeBlocks(highlightPlugin, blocks) {{
+            if (!highlightPlugin) return;
+            // Blocks highlighted at build time (data-highlighted) are not re-tokenized;
+            // the plugin still adds their line numbers and {{1-N}} steps
+            const hljs = highlightPlugin.hljs;
+            if (hljs && !hljs.skipsPrehighlighted) {{
+                const highlightElement = hljs.highlightElement.bind(hljs);
+                hljs.highlightElement = block => {{
+                    if (!block.hasAttribute('data-highlighted')) highlightElement(block);
+                }};
+                hljs.skipsPrehighlighted = true;
+            }}
+            blocks.forEach(block => {{
+                if (!block.hasAttribute('data-highlighted') || block.hasAttribute('data-line-numbers')) {{
+                    highlightPlugin.highlightBlock(block);
+                }}
+            }});
+        }}
+
+        async function streamRemainingChunks(deck, folderName, slideIndex, firstChunk) {{
+            const markdownPlugin = deck.getPlugin('markdown');
+            const highlightPlugin = deck.getPlugin('highlight');
+            const slidesEl = deck.getRevealElement().querySelector('.slides');
+            const pending = slideIndex.chunks
+                .map((chunk, i) => ({{ i, content: slidesEl.querySelector(`[data-chunk-placeholder="${{i}}"]`)
+                    ? fetchChunk(folderName, chunk) : null }}))
+                .filter(entry => entry.content !== null);
+
+            for (const {{ i, content }} of pending) {{
+                try {{
+                    const loaded = await content;
+                    const placeholders = slidesEl.querySelectorAll(`[data-chunk-placeholder="${{i}}"]`);
+                    placeholders[0].replaceWith(...createChunkSections(i, loaded));
+                    placeholders.forEach((placeholder, n) => n > 0 && placeholder.remove());
+
+                    if (!loaded.html) {{
+                        await markdownPlugin.processSlides(slidesEl);
+                        await markdownPlugin.convertSlides();
+                    }}
+                    highlightCodeBlocks(highlightPlugin,
+                        slidesEl.querySelectorAll(`section[data-chunk="${{i}}"] pre code`));
+                    if (!loaded.html) {{
+                        applySlideLayouts(deck, slideIndex, i);
+                    }}
+                    deck.sync();
+                }} catch (error) {{
+                    console.warn(`Could not load slide chunk ${{i}}:`, error);
+                }}
+            }}
+        }}
+
+        async function loadWeekContent(week, entry) {{
             if (!week) {{
                 return `# HCI/HMI Lecture
 
@@ -411,32 +608,12 @@ Welcome to HCI/HMI Lecture slides.
 Please go back to select a week.`;
             }}
 
-            // Mapping for actual folder names
-            const weekFolders = {{
-                '01': 'week01-hci-hmi-theory',
-                '02': 'week02-csharp-wpf-basics',
-                '03': 'week03-csharp-realtime-data',
-                '04': 'week04-csharp-advanced-ui',
-                '05': 'week05-csharp-test-deploy',
-                '06': 'week06-python-pyside6-basics',
-                '07': 'week07-python-realtime-data',
-                '08': 'week08-python-advanced-features',
-                '09': 'week09-python-deployment',
-                '10': 'week10-imgui-basics',
-                '11': 'week11-imgui-advanced',
-                '12': 'week12-imgui-advanced-features',
-                '13': 'week13-imgui-integrated-project'
-            }};
-
             try {{
-                const paddedWeek = week.padStart(2, '0');
-                const folderName = weekFolders[paddedWeek];
-
-                if (!folderName) {{
+                if (!entry || !entry.slides) {{
                     throw new Error(`Week ${{week}} not found`);
                 }}
 
-                const response = await fetch(`/slides/${{folderName}}/slides.md`);
+                const response = await fetch(entry.slides);
                 if (!response.ok) {{
                     throw new Error(`Week ${{week}} slides not found`);
                 }}
@@ -462,30 +639,15 @@ Please check back later or contact the instructor.
             }}
         }}
 
-        function applyCustomStyling() {{
-            const slides = document.querySelectorAll('.reveal .slides section');
-
-            slides.forEach((slide, index) => {{
-                const slideContent = slide.textContent.trim();
-
-                if (
-                    slideContent.startsWith('목차') ||
-                    slideContent.includes('Table of Contents') ||
-                    slideContent.includes('다음 주차 예고') ||
-                    slideContent.includes('정리') ||
-                    slideContent.includes('Q&A') ||
-                    slide.querySelector('h1:only-child') ||
-                    (slide.children.length === 1 && slide.children[0].tagName === 'H1') ||
-                    // 섹션 제목 슬라이드 - H1 태그만 있는 경우
-                    (slide.children.length === 1 && slide.querySelector('h1') &&
-                     slide.querySelector('h1').textContent.trim().length > 0 &&
-                     !slide.querySelector('h2, h3, p, ul, ol, div, img, pre, code'))
-                ) {{
-                    slide.style.textAlign = 'center';
-                    slide.style.display = 'flex';
-                    slide.style.flexDirection = 'column';
-                    slide.style.justifyContent = 'center';
-                    slide.style.height = '100%';
+        function applySlideLayouts(deck, slideIndex, chunkNum) {{
+            // Pre-rendered sections carry data-layout already; markdown chunks are
+            // converted in the browser, so copy it over from the slide index
+            slideIndex.slides.forEach(slide => {{
+                if (slide.layout && (chunkNum === undefined || slide.chunk === chunkNum)) {{
+                    const section = deck.getSlide(slide.h, slide.v);
+                    if (section) {{
+                        section.setAttribute('data-layout', slide.layout);
+                    }}
                 }}
             }});
         }}
@@ -541,7 +703,21 @@ Please check back later or contact the instructor.
             let currentColor = '#ff0000';
             let currentSize = 3;
             let canvas, ctx;
-            let drawingData = new Map(); // Store drawings per slide
+            // Strokes per slide: {{ tool, color, size, points }} where points is a
+            // Float32Array of x,y pairs normalized to the canvas (0..1)
+            const slideStrokes = new Map();
+            // Slides cleared this session, so the initial load does not bring their strokes back
+            const clearedSlides = new Set();
+            const drawingStore = openDrawingStore();
+            const drawingWeek = (weekParam || '').padStart(2, '0');
+            let currentStroke = null;
+            // Canvas position, refreshed on resize/scroll instead of per event
+            let canvasRect = null;
+            let frameRequested = false;
+            // Oldest input event not yet drawn, for the event → pixel metric
+            let pendingSince = null;
+            const latencySamples = new Float32Array(240);
+            let latencyCount = 0;
 
             // Create canvas overlay
             function createCanvas() {{
@@ -555,25 +731,45 @@ Please check back later or contact the instructor.
                     height: 100%;
                     z-index: 100;
                     pointer-events: none;
+                    touch-action: none;
                     display: none;
                 `;
 
                 const presentationDiv = document.querySelector('.reveal');
                 presentationDiv.appendChild(canvas);
 
-                ctx = canvas.getContext('2d');
+                ctx = canvas.getContext('2d', {{ desynchronized: true }});
 
-                // Set canvas size
+                // Reallocate only when the size really changed; strokes are
+                // vectors, so the slide is redrawn instead of being lost
+                // (the canvas covers .reveal, whose box is valid even while the canvas is hidden)
                 function resizeCanvas() {{
-                    const rect = presentationDiv.getBoundingClientRect();
-                    canvas.width = rect.width;
-                    canvas.height = rect.height;
-                    ctx.lineCap = 'round';
-                    ctx.lineJoin = 'round';
+                    canvasRect = presentationDiv.getBoundingClientRect();
+                    const width = Math.round(canvasRect.width);
+                    const height = Math.round(canvasRect.height);
+                    if (width !== canvas.width || height !== canvas.height) {{
+                        canvas.width = width;
+                        canvas.height = height;
+                        ctx.lineCap = 'round';
+                        ctx.lineJoin = 'round';
+                        redrawCurrentSlide();
+                    }}
                 }}
 
+                let resizePending = false;
+                const scheduleResize = () => {{
+                    if (resizePending) return;
+                    resizePending = true;
+                    requestAnimationFrame(() => {{
+                        resizePending = false;
+                        resizeCanvas();
+                    }});
+                }};
+
+                canvas.width = 0;
                 resizeCanvas();
-                window.addEventListener('resize', resizeCanvas);
+                new ResizeObserver(scheduleResize).observe(presentationDiv);
+                window.addEventListener('scroll', () => {{ canvasRect = presentationDiv.getBoundingClientRect(); }}, {{ passive: true }});
 
                 return canvas;
             }}
@@ -707,13 +903,12 @@ Please check back later or contact the instructor.
                     canvas.style.pointerEvents = 'all';
                     toolbar.toggleBtn.style.background = '#ff4444';
                     toolbar.toggleBtn.innerHTML = '❌';
-                    loadCurrentSlideDrawing();
+                    redrawCurrentSlide();
                 }} else {{
                     canvas.style.display = 'none';
                     canvas.style.pointerEvents = 'none';
                     toolbar.toggleBtn.style.background = '#4CAF50';
                     toolbar.toggleBtn.innerHTML = '✏️';
-                    saveCurrentSlideDrawing();
                 }}
                 updateToolbarVisibility();
             }}
@@ -733,106 +928,234 @@ Please check back later or contact the instructor.
                 return deck.getState().indexh + '-' + deck.getState().indexv;
             }}
 
-            function saveCurrentSlideDrawing() {{
-                const slideIndex = getCurrentSlideIndex();
-                const imageData = canvas.toDataURL();
-                drawingData.set(slideIndex, imageData);
+            // IndexedDB persistence, keyed by week and slide; every call is
+            // asynchronous so slide transitions never wait for storage
+            function openDrawingStore() {{
+                if (!window.indexedDB) {{
+                    return Promise.resolve(null);
+                }}
+                return new Promise(resolve => {{
+                    const request = indexedDB.open('lecture-drawings', 1);
+                    request.onupgradeneeded = () => request.result.createObjectStore('strokes');
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => resolve(null);
+                }});
             }}
 
-            function loadCurrentSlideDrawing() {{
-                const slideIndex = getCurrentSlideIndex();
-                ctx.clearRect(0, 0, canvas.width, canvas.height);
+            function storeKey(slideIndex) {{
+                return `${{drawingWeek}}:${{slideIndex}}`;
+            }}
 
-                if (drawingData.has(slideIndex)) {{
-                    const img = new Image();
-                    img.onload = () => {{
-                        ctx.drawImage(img, 0, 0);
+            function persistSlide(slideIndex) {{
+                // Wait until the stored strokes are merged in, or the put would
+                // overwrite them with only the strokes drawn since the page opened
+                strokesLoaded.then(db => {{
+                    if (!db) return;
+                    const strokes = slideStrokes.get(slideIndex) || [];
+                    const store = db.transaction('strokes', 'readwrite').objectStore('strokes');
+                    if (strokes.length) {{
+                        store.put(strokes, storeKey(slideIndex));
+                    }} else {{
+                        store.delete(storeKey(slideIndex));
+                    }}
+                }});
+            }}
+
+            // Resolves with the database (or null) once the week's strokes are in slideStrokes
+            function loadWeekStrokes() {{
+                return drawingStore.then(db => new Promise(resolve => {{
+                    if (!db) {{
+                        resolve(null);
+                        return;
+                    }}
+                    const range = IDBKeyRange.bound(`${{drawingWeek}}:`, `${{drawingWeek}}:\\uffff`);
+                    const request = db.transaction('strokes').objectStore('strokes').openCursor(range);
+                    request.onsuccess = () => {{
+                        const cursor = request.result;
+                        if (!cursor) {{
+                            if (drawingMode) redrawCurrentSlide();
+                            resolve(db);
+                            return;
+                        }}
+                        const slideIndex = cursor.key.slice(drawingWeek.length + 1);
+                        // Strokes drawn before the load finished stay on top; a slide
+                        // cleared in the meantime stays cleared
+                        if (!clearedSlides.has(slideIndex)) {{
+                            slideStrokes.set(slideIndex, cursor.value.concat(slideStrokes.get(slideIndex) || []));
+                        }}
+                        cursor.continue();
                     }};
-                    img.src = drawingData.get(slideIndex);
+                    request.onerror = () => resolve(db);
+                }}));
+            }}
+
+            function applyStrokeStyle(stroke) {{
+                if (stroke.tool === 'eraser') {{
+                    ctx.globalCompositeOperation = 'destination-out';
+                    ctx.lineWidth = stroke.size * 3;
+                }} else {{
+                    ctx.globalCompositeOperation = 'source-over';
+                    ctx.strokeStyle = stroke.color;
+                    ctx.lineWidth = stroke.size;
                 }}
             }}
 
+            function drawStroke(stroke, count) {{
+                const points = stroke.points;
+                const n = count === undefined ? points.length : count;
+                if (n < 2) return;
+                applyStrokeStyle(stroke);
+                ctx.beginPath();
+                ctx.moveTo(points[0] * canvas.width, points[1] * canvas.height);
+                for (let i = 2; i < n; i += 2) {{
+                    ctx.lineTo(points[i] * canvas.width, points[i + 1] * canvas.height);
+                }}
+                if (n === 2) {{
+                    ctx.lineTo(points[0] * canvas.width, points[1] * canvas.height);
+                }}
+                ctx.stroke();
+            }}
+
+            function redrawCurrentSlide() {{
+                ctx.clearRect(0, 0, canvas.width, canvas.height);
+                (slideStrokes.get(getCurrentSlideIndex()) || []).forEach(stroke => drawStroke(stroke));
+                ctx.globalCompositeOperation = 'source-over';
+            }}
+
             function clearCurrentSlide() {{
                 ctx.clearRect(0, 0, canvas.width, canvas.height);
                 const slideIndex = getCurrentSlideIndex();
-                drawingData.delete(slideIndex);
+                slideStrokes.delete(slideIndex);
+                clearedSlides.add(slideIndex);
+                persistSlide(slideIndex);
             }}
 
             // Drawing functions
-            function startDrawing(e) {{
-                if (!drawingMode) return;
-                isDrawing = true;
+            function canvasPoint(e) {{
+                return [(e.clientX - canvasRect.left) / canvasRect.width,
+                        (e.clientY - canvasRect.top) / canvasRect.height];
+            }}
 
-                const rect = canvas.getBoundingClientRect();
-                const x = e.clientX - rect.left;
-                const y = e.clientY - rect.top;
+            function addPoint(stroke, x, y) {{
+                if (stroke.count + 2 > stroke.points.length) {{
+                    const grown = new Float32Array(stroke.points.length * 2);
+                    grown.set(stroke.points);
+                    stroke.points = grown;
+                }}
+                stroke.points[stroke.count++] = x;
+                stroke.points[stroke.count++] = y;
+            }}
 
+            function recordLatency(ms) {{
+                latencySamples[latencyCount % latencySamples.length] = ms;
+                latencyCount++;
+            }}
+
+            // Event → pixel latency of the last samples, e.g. drawingLatency() in the console
+            window.drawingLatency = () => {{
+                const n = Math.min(latencyCount, latencySamples.length);
+                const sorted = Array.from(latencySamples.subarray(0, n)).sort((a, b) => a - b);
+                const pick = q => n ? Math.round(sorted[Math.min(n - 1, Math.floor(q * n))] * 10) / 10 : null;
+                return {{ samples: n, p50: pick(0.5), p95: pick(0.95), max: pick(1) }};
+            }};
+
+            // Draw every point gathered since the last frame as one path
+            function flushStroke(frameTime) {{
+                frameRequested = false;
+                const stroke = currentStroke;
+                if (!stroke || stroke.drawn >= stroke.count) return;
+
+                const points = stroke.points;
+                const start = Math.max(0, stroke.drawn - 2);
+                applyStrokeStyle(stroke);
                 ctx.beginPath();
-                ctx.moveTo(x, y);
+                ctx.moveTo(points[start] * canvas.width, points[start + 1] * canvas.height);
+                for (let i = start + 2; i < stroke.count; i += 2) {{
+                    ctx.lineTo(points[i] * canvas.width, points[i + 1] * canvas.height);
+                }}
+                ctx.stroke();
+                stroke.drawn = stroke.count;
 
-                if (currentTool === 'eraser') {{
-                    ctx.globalCompositeOperation = 'destination-out';
-                    ctx.lineWidth = currentSize * 3;
-                }} else {{
-                    ctx.globalCompositeOperation = 'source-over';
-                    ctx.strokeStyle = currentColor;
-                    ctx.lineWidth = currentSize;
+                if (pendingSince !== null) {{
+                    recordLatency(performance.now() - pendingSince);
+                    pendingSince = null;
                 }}
             }}
 
+            function requestFlush(e) {{
+                if (pendingSince === null) {{
+                    pendingSince = e.timeStamp;
+                }}
+                if (!frameRequested) {{
+                    frameRequested = true;
+                    requestAnimationFrame(flushStroke);
+                }}
+            }}
+
+            function startDrawing(e) {{
+                if (!drawingMode || (e.pointerType === 'mouse' && e.button !== 0)) return;
+                isDrawing = true;
+                canvas.setPointerCapture(e.pointerId);
+
+                const [x, y] = canvasPoint(e);
+                currentStroke = {{
+                    tool: currentTool,
+                    color: currentColor,
+                    size: currentSize,
+                    points: new Float32Array(256),
+                    count: 0,
+                    drawn: 0
+                }};
+                addPoint(currentStroke, x, y);
+            }}
+
             function draw(e) {{
                 if (!drawingMode || !isDrawing) return;
 
-                const rect = canvas.getBoundingClientRect();
-                const x = e.clientX - rect.left;
-                const y = e.clientY - rect.top;
-
-                ctx.lineTo(x, y);
-                ctx.stroke();
+                // Pen and touch panels deliver several samples per event
+                const samples = e.getCoalescedEvents ? e.getCoalescedEvents() : [];
+                for (const sample of (samples.length ? samples : [e])) {{
+                    const [x, y] = canvasPoint(sample);
+                    addPoint(currentStroke, x, y);
+                }}
+                requestFlush(e);
             }}
 
             function stopDrawing() {{
-                if (!drawingMode) return;
+                if (!drawingMode || !isDrawing) return;
                 isDrawing = false;
-                ctx.beginPath();
+                flushStroke();
+
+                // Keep only the used part of the point buffer
+                const stroke = {{
+                    tool: currentStroke.tool,
+                    color: currentStroke.color,
+                    size: currentStroke.size,
+                    points: currentStroke.points.slice(0, currentStroke.count)
+                }};
+                currentStroke = null;
+                if (stroke.points.length === 2) {{
+                    drawStroke(stroke);
+                }}
+
+                const slideIndex = getCurrentSlideIndex();
+                if (!slideStrokes.has(slideIndex)) {{
+                    slideStrokes.set(slideIndex, []);
+                }}
+                slideStrokes.get(slideIndex).push(stroke);
+                persistSlide(slideIndex);
             }}
 
             // Initialize components
             createCanvas();
             const toolbar = createToolbar();
+            const strokesLoaded = loadWeekStrokes();
 
-            // Add event listeners
-            canvas.addEventListener('mousedown', startDrawing);
-            canvas.addEventListener('mousemove', draw);
-            canvas.addEventListener('mouseup', stopDrawing);
-            canvas.addEventListener('mouseout', stopDrawing);
-
-            // Touch events for mobile
-            canvas.addEventListener('touchstart', (e) => {{
-                e.preventDefault();
-                const touch = e.touches[0];
-                const mouseEvent = new MouseEvent('mousedown', {{
-                    clientX: touch.clientX,
-                    clientY: touch.clientY
-                }});
-                canvas.dispatchEvent(mouseEvent);
-            }});
-
-            canvas.addEventListener('touchmove', (e) => {{
-                e.preventDefault();
-                const touch = e.touches[0];
-                const mouseEvent = new MouseEvent('mousemove', {{
-                    clientX: touch.clientX,
-                    clientY: touch.clientY
-                }});
-                canvas.dispatchEvent(mouseEvent);
-            }});
-
-            canvas.addEventListener('touchend', (e) => {{
-                e.preventDefault();
-                const mouseEvent = new MouseEvent('mouseup', {{}});
-                canvas.dispatchEvent(mouseEvent);
-            }});
+            // Pointer events cover mouse, pen and touch alike
+            canvas.addEventListener('pointerdown', startDrawing);
+            canvas.addEventListener('pointermove', draw);
+            canvas.addEventListener('pointerup', stopDrawing);
+            canvas.addEventListener('pointercancel', stopDrawing);
 
             // Keyboard shortcuts
             document.addEventListener('keydown', (e) => {{
@@ -864,18 +1187,10 @@ Please check back later or contact the instructor.
                 }}
             }});
 
-            // Handle slide changes
-            deck.on('slidechanged', (event) => {{
+            // Strokes are persisted as each one ends, so a slide change only redraws
+            deck.on('slidechanged', () => {{
                 if (drawingMode) {{
-                    saveCurrentSlideDrawing();
-                    setTimeout(() => loadCurrentSlideDrawing(), 100);
-                }}
-            }});
-
-            // Save drawings before leaving
-            window.addEventListener('beforeunload', () => {{
-                if (drawingMode) {{
-                    saveCurrentSlideDrawing();
+                    redrawCurrentSlide();
                 }}
             }});
         }}
@@ -885,53 +1200,541 @@ Please check back later or contact the instructor.
 
     return html_content
 
-def copy_slides_to_src(project_root: Path):
+def hash_file(file_path: Path) -> str:
+    """Return the sha256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def scan_tree(root: Path) -> Dict[str, os.stat_result]:
+    """
+    Walk a directory tree and stat every regular file
+
+    Args:
+        root: Directory to walk
+
+    Returns:
+        Mapping of POSIX-style relative path to stat result
+    """
+    files = {}
+    if not root.is_dir():
+        return files
+
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            full_path = os.path.join(dirpath, name)
+            rel_path = os.path.relpath(full_path, root).replace(os.sep, '/')
+            files[rel_path] = os.stat(full_path)
+    return files
+
+def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """Load the slide sync manifest, returning an empty one if missing or corrupt"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'files': {}}
+
+def save_manifest(manifest_path: Path, manifest: Dict[str, Any]):
+    """Write the slide sync manifest"""
+    write_json(manifest_path, manifest, indent=1, sort_keys=True)
+
+def prune_empty_dirs(root: Path):
+    """Remove directories left empty under root (root itself is kept)"""
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        if Path(dirpath) != root and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+def remove_path(path: Path):
+    """Remove a file, symlink or directory tree if it exists"""
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+def write_alias_config(project_root: Path, source_slides: Path):
+    """Point the Vite slides-alias middleware at the slides directory"""
+    alias_path = project_root / "config" / ALIAS_CONFIG_NAME
+    config = {'slidesRoot': os.path.relpath(source_slides, alias_path.parent).replace(os.sep, '/')}
+    write_text(alias_path, json.dumps(config, indent=2) + '\n')
+
+def remove_alias_config(project_root: Path):
+    """Drop the Vite alias config so src/slides is served again"""
+    alias_path = project_root / "config" / ALIAS_CONFIG_NAME
+    if alias_path.exists():
+        alias_path.unlink()
+
+def link_slides_dir(source_slides: Path, dest_slides: Path) -> bool:
+    """
+    Replace src/slides with a directory symlink to slides/
+
+    Returns:
+        True if the symlink is in place, False if the platform refused it
+    """
+    target = os.path.relpath(source_slides, dest_slides.parent)
+    if dest_slides.is_symlink() and os.readlink(dest_slides) == target:
+        return True
+
+    remove_path(dest_slides)
+    try:
+        os.symlink(target, dest_slides, target_is_directory=True)
+    except (OSError, NotImplementedError) as e:
+        print(f"⚠️  Symlinks not supported here ({e}), falling back to hardlinks")
+        return False
+    return True
+
+def place_file(source_file: Path, dest_file: Path, mode: str) -> str:
     """
-    Copy slides directory to src directory for Vite to serve
+    Publish one file into src/slides
+
+    Args:
+        source_file: File under slides/
+        dest_file: Target path under src/slides
+        mode: 'hardlink' or 'copy'
+
+    Returns:
+        The mode actually used ('copy' when hardlinking failed)
+    """
+    dest_file.parent.mkdir(parents=True, exist_ok=True)
+    if mode == 'hardlink':
+        if dest_file.exists() or dest_file.is_symlink():
+            dest_file.unlink()
+        try:
+            os.link(source_file, dest_file)
+            return 'hardlink'
+        except OSError as e:
+            print(f"⚠️  Hardlinks not supported here ({e}), falling back to copying")
+    copy_file(source_file, dest_file)
+    return 'copy'
+
+def sync_file_entry(source_slides: Path, dest_slides: Path, rel_path: str,
+                    src_stat: os.stat_result, dest_stat: Optional[os.stat_result],
+                    entry: Optional[Dict[str, Any]], mode: str,
+                    stats: Dict[str, int]) -> Tuple[Dict[str, Any], str]:
+    """
+    Bring one file in src/slides up to date with slides/
+
+    Args:
+        source_slides: slides/ directory
+        dest_slides: src/slides directory
+        rel_path: POSIX path relative to both directories
+        src_stat: stat of the source file
+        dest_stat: stat of the published file, None if missing
+        entry: Manifest entry from the previous sync, None if unknown
+        mode: 'hardlink' or 'copy'
+        stats: Counters updated in place
+
+    Returns:
+        Tuple of (new manifest entry, mode actually in effect)
+    """
+    dest_ok = dest_stat is not None and dest_stat.st_size == src_stat.st_size
+    if mode == 'hardlink':
+        dest_ok = dest_ok and os.path.samestat(src_stat, dest_stat)
+
+    # Fast path: size and mtime match the manifest, nothing is read
+    if (entry and dest_ok
+            and entry['size'] == src_stat.st_size
+            and entry['mtime_ns'] == src_stat.st_mtime_ns):
+        stats['unchanged'] += 1
+        return entry, mode
+
+    digest = hash_file(source_slides / rel_path)
+    if dest_ok:
+        known_digest = entry['sha256'] if entry else hash_file(dest_slides / rel_path)
+        needs_copy = known_digest != digest
+    else:
+        needs_copy = True
+
+    if needs_copy:
+        mode = place_file(source_slides / rel_path, dest_slides / rel_path, mode)
+        stats['added' if dest_stat is None else 'updated'] += 1
+    else:
+        stats['unchanged'] += 1
+
+    new_entry = {
+        'size': src_stat.st_size,
+        'mtime_ns': src_stat.st_mtime_ns,
+        'sha256': digest
+    }
+    return new_entry, mode
+
+def sync_slide_file(project_root: Path, rel_path: str) -> Dict[str, int]:
+    """
+    Sync a single changed file into src/slides using the existing manifest
+
+    Used by the watch loop so an edit re-publishes just that file. Does
+    nothing in symlink/alias modes, where src/slides already is slides/.
 
     Args:
         project_root: Path to project root directory
+        rel_path: POSIX path relative to slides/
+
+    Returns:
+        Dictionary with added/updated/deleted/unchanged file counts
     """
     source_slides = project_root / "slides"
     dest_slides = project_root / "src" / "slides"
+    manifest_path = project_root / "src" / MANIFEST_NAME
+    stats = {'added': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
 
-    print(f"📁 Copying slides from {source_slides} to {dest_slides}")
+    manifest = load_manifest(manifest_path)
+    mode = manifest.get('mode', 'copy')
+    if mode in ('symlink', 'alias'):
+        return stats
 
-    # Remove existing slides directory in src if it exists
-    if dest_slides.exists():
-        shutil.rmtree(dest_slides)
-        print(f"🗑️  Removed existing {dest_slides}")
+    files = manifest['files']
+    source_file = source_slides / rel_path
+    dest_file = dest_slides / rel_path
+    try:
+        dest_stat = os.stat(dest_file)
+    except OSError:
+        dest_stat = None
+
+    if source_file.is_file():
+        entry, effective_mode = sync_file_entry(
+            source_slides, dest_slides, rel_path, os.stat(source_file),
+            dest_stat, files.get(rel_path), manifest.get('effective', mode), stats
+        )
+        manifest['effective'] = effective_mode
+        changed = files.get(rel_path) != entry
+        files[rel_path] = entry
+    else:
+        if dest_stat is not None:
+            dest_file.unlink()
+            stats['deleted'] += 1
+        changed = files.pop(rel_path, None) is not None
 
-    # Copy slides directory
-    if source_slides.exists():
-        shutil.copytree(source_slides, dest_slides)
-        print(f"✅ Successfully copied slides to src directory")
+    if changed:
+        save_manifest(manifest_path, manifest)
+    return stats
 
-        # Count copied files
-        slide_files = list(dest_slides.glob("*/slides.md"))
-        print(f"📄 Copied {len(slide_files)} slide files")
-    else:
+def copy_slides_to_src(project_root: Path, mode: str = 'copy') -> Dict[str, int]:
+    """
+    Incrementally publish slides directory into src directory for Vite to serve
+
+    A content-hash manifest stored next to src/slides records the size,
+    mtime and sha256 of every synced file. Files whose size and mtime are
+    unchanged are skipped without being read; otherwise the hash decides
+    whether the destination really needs rewriting. Files that disappeared
+    from slides/ are removed from src/slides.
+
+    Modes:
+        copy     - byte copies (default)
+        hardlink - per-file hardlinks, no extra disk space
+        symlink  - src/slides becomes a symlink to slides/
+        alias    - no src/slides at all; Vite serves /slides from slides/
+                   through config/slides-alias.json
+    Links fall back to the next strategy (symlink → hardlink → copy)
+    when the filesystem refuses them, so every mode serves the same files.
+
+    Args:
+        project_root: Path to project root directory
+        mode: One of SYNC_MODES
+
+    Returns:
+        Dictionary with added/updated/deleted/unchanged file counts
+    """
+    source_slides = project_root / "slides"
+    dest_slides = project_root / "src" / "slides"
+    manifest_path = project_root / "src" / MANIFEST_NAME
+    stats = {'added': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+
+    print(f"📁 Publishing slides from {source_slides} to {dest_slides} ({mode})")
+
+    if not source_slides.exists():
         print(f"❌ Source slides directory not found at {source_slides}")
+        return stats
+
+    start = time.perf_counter()
+    manifest = load_manifest(manifest_path)
+
+    if mode == 'alias':
+        remove_path(dest_slides)
+        write_alias_config(project_root, source_slides)
+        if manifest.get('mode') != 'alias':
+            save_manifest(manifest_path, {'version': MANIFEST_VERSION, 'mode': 'alias', 'files': {}})
+        print(f"✅ Vite serves /slides directly from {source_slides}")
+        return stats
+
+    remove_alias_config(project_root)
+
+    if mode == 'symlink':
+        if link_slides_dir(source_slides, dest_slides):
+            if manifest.get('mode') != 'symlink':
+                save_manifest(manifest_path, {'version': MANIFEST_VERSION, 'mode': 'symlink', 'files': {}})
+            print(f"✅ {dest_slides} links to {source_slides}")
+            return stats
+        mode = 'hardlink'
+
+    if dest_slides.is_symlink():
+        dest_slides.unlink()
+
+    # A mode switch invalidates what the manifest says about src/slides
+    if manifest.get('mode', 'copy') == mode:
+        old_entries = manifest['files']
+        effective_mode = manifest.get('effective', mode)
+    else:
+        old_entries = {}
+        effective_mode = mode
+    new_entries = {}
+
+    source_files = scan_tree(source_slides)
+    dest_files = scan_tree(dest_slides)
+
+    for rel_path, src_stat in source_files.items():
+        new_entries[rel_path], effective_mode = sync_file_entry(
+            source_slides, dest_slides, rel_path, src_stat,
+            dest_files.get(rel_path), old_entries.get(rel_path), effective_mode, stats
+        )
+
+    # Mirror deletions so src/slides never serves removed lectures
+    stale_files = set(dest_files) - set(source_files)
+    for rel_path in stale_files:
+        (dest_slides / rel_path).unlink()
+        stats['deleted'] += 1
+    if stale_files:
+        prune_empty_dirs(dest_slides)
+
+    if (new_entries != old_entries or manifest.get('mode', 'copy') != mode
+            or manifest.get('effective', mode) != effective_mode):
+        save_manifest(manifest_path, {
+            'version': MANIFEST_VERSION,
+            'mode': mode,
+            'effective': effective_mode,
+            'files': new_entries
+        })
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if stats['added'] or stats['updated'] or stats['deleted']:
+        print(f"✅ Synced slides: {stats['added']} added, {stats['updated']} updated, "
+              f"{stats['deleted']} deleted, {stats['unchanged']} unchanged ({elapsed_ms:.1f} ms)")
+    else:
+        print(f"✅ Slides already up to date: {stats['unchanged']} files unchanged ({elapsed_ms:.1f} ms)")
 
-def main():
-    """Main function to generate index.html and copy slides"""
+    return stats
 
-    # Get script directory and project root
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+def write_index(project_root: Path, html_content: str) -> bool:
+    """Write src/index.html, skipping the write when the content is unchanged"""
+    return write_text(project_root / "src" / "index.html", html_content)
+
+def apply_slide_changes(project_root: Path, weeks: List[Dict[str, Any]],
+                        rendered_cards: Dict[str, str], changes: Optional[Set[str]],
+                        mode: str, prerender: bool = True, plugins: Optional[List[str]] = None):
+    """
+    Regenerate only what a batch of changes under slides/ affects
+
+    Part edits first re-assemble that week's slides.md. File edits re-sync
+    just that file and, for slides.md, summary.md, code/ or images/,
+    re-extract that week and drop its cached card.
+    Deck edits (slides.md, parts, slides.json) rebuild that week's
+    slide index and chunks.
+    Directory-level changes (new, renamed or removed weeks) and watcher
+    overflows fall back to a full incremental sync and rescan.
+
+    Args:
+        project_root: Path to project root directory
+        weeks: Current week list, updated in place
+        rendered_cards: Card cache shared with generate_index_html
+        changes: Relative paths from the watcher, None to rescan everything
+        mode: Sync mode for full resyncs
+        prerender: Pre-render rebuilt chunks to HTML
+        plugins: Reveal plugin names for the viewer (None for all)
+    """
     slides_dir = project_root / "slides"
+    start = time.perf_counter()
+    reset_write_stats()
+
+    if changes is None or any(path.endswith('/') for path in changes):
+        copy_slides_to_src(project_root, mode)
+        weeks[:] = scan_weeks_directory(slides_dir, project_root / '.cache')
+        build_slide_indexes(project_root, weeks, prerender=prerender)
+        rendered_cards.clear()
+        touched = 'all weeks'
+    else:
+        # Edited parts re-assemble their slides.md, which is then synced too
+        part_folders = {path.partition('/')[0] for path in changes
+                        if path.count('/') == 1 and path.endswith(('.md', '/slides.json'))
+                        and not path.endswith(('/slides.md', '/summary.md'))}
+        if part_folders:
+            assembly = assemble_weeks(slides_dir, project_root / '.cache', sorted(part_folders))
+            changes = set(changes) | {f'{folder}/slides.md' for folder in assembly['written']}
+        dirty_folders = set()
+        deck_folders = set()
+        for rel_path in sorted(changes):
+            sync_slide_file(project_root, rel_path)
+            folder, _, rest = rel_path.partition('/')
+            if rest in ('slides.md', 'summary.md') or rest.startswith(('code/', 'images/')):
+                dirty_folders.add(folder)
+            if rest == 'slides.json' or ('/' not in rest and rest.endswith('.md')):
+                deck_folders.add(folder)
+
+        for folder in sorted(dirty_folders):
+            match = WEEK_PATTERN.match(folder)
+            if not match:
+                continue
+            week_info = extract_week_info(slides_dir / folder, match.group(1))
+            weeks[:] = [w for w in weeks if w['number'] != week_info['number']] + [week_info]
+            weeks.sort(key=lambda x: int(x['number']))
+            rendered_cards.pop(week_info['number'], None)
+        if deck_folders:
+            build_slide_indexes(project_root, weeks, sorted(deck_folders), prerender)
+        touched = ', '.join(sorted(dirty_folders)) or 'no cards'
+
+    rewritten = write_index(project_root, generate_index_html(weeks, rendered_cards, plugins))
+    write_course_structure(project_root, weeks)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    index_note = 'index.html updated' if rewritten else 'index.html unchanged'
+    print(f"🔄 {len(changes) if changes else 'all'} change(s): re-rendered {touched}, "
+          f"{index_note}, {format_write_stats()} ({elapsed_ms:.1f} ms)")
+
+def watch_slides(project_root: Path, weeks: List[Dict[str, Any]],
+                 rendered_cards: Dict[str, str], mode: str, force_polling: bool = False,
+                 prerender: bool = True, plugins: Optional[List[str]] = None):
+    """
+    Watch slides/ and apply targeted regeneration until interrupted
 
-    # Copy slides to src directory first
-    copy_slides_to_src(project_root)
+    Args:
+        project_root: Path to project root directory
+        weeks: Week list from the initial build
+        rendered_cards: Card cache from the initial build
+        mode: Sync mode passed to full resyncs
+        force_polling: Use the polling watcher even where inotify works
+        prerender: Pre-render rebuilt chunks to HTML
+        plugins: Reveal plugin names for the viewer (None for all)
+    """
+    slides_dir = project_root / "slides"
+    watcher = create_watcher(slides_dir, force_polling)
+    print(f"\n👀 Watching {slides_dir} ({watcher.name}), press Ctrl+C to stop")
+
+    try:
+        while True:
+            changes = watcher.read_changes()
+            if changes is not None and not changes:
+                continue
+            try:
+                apply_slide_changes(project_root, weeks, rendered_cards, changes, mode, prerender, plugins)
+            except OSError as e:
+                # Files can vanish mid-save; the next event settles it
+                print(f"⚠️  Could not apply changes: {e}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='Generate src/index.html and publish slides/ for the dev server'
+    )
+    parser.add_argument(
+        'command',
+        nargs='?',
+        choices=('build', 'serve'),
+        default='build',
+        help='build (default) writes src/; serve runs the in-memory preview server with live reload'
+    )
+    parser.add_argument(
+        '--host',
+        default=DEFAULT_SERVE_HOST,
+        help=f'Address for serve (default: {DEFAULT_SERVE_HOST})'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=DEFAULT_SERVE_PORT,
+        help=f'Port for serve (default: {DEFAULT_SERVE_PORT})'
+    )
+    parser.add_argument(
+        '--mode',
+        choices=SYNC_MODES,
+        default=os.environ.get('SLIDES_SYNC_MODE', 'copy'),
+        help='How slides/ is published into src/slides (default: copy, or $SLIDES_SYNC_MODE)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and regenerate only what changes under slides/'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='With --watch or serve, poll for changes instead of using inotify (e.g. WSL on /mnt/c)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for week metadata extraction (default: CPU count)'
+    )
+    parser.add_argument(
+        '--no-prerender',
+        action='store_true',
+        help='Skip build-time HTML rendering; the viewer parses markdown in the browser'
+    )
+    parser.add_argument(
+        '--plugins',
+        type=lambda value: [name.strip() for name in value.split(',') if name.strip()],
+        default=None,
+        help=f"Comma-separated Reveal plugins for the viewer (default: "
+             f"{','.join(plugin['name'] for plugin in REVEAL_PLUGINS)})"
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='TRACE_JSON',
+        help=f'Record phase timings as a Chrome trace (default path: {DEFAULT_PROFILE_PATH}) and print a summary'
+    )
+    parser.add_argument(
+        '--cprofile',
+        action='store_true',
+        help='With --profile, run each phase under cProfile and dump the slowest one'
+    )
+    args = parser.parse_args(argv)
+    if args.plugins is not None:
+        try:
+            select_plugins(args.plugins)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.cprofile and args.profile is None:
+        args.profile = ''
+    return args
+
+def build(args: argparse.Namespace, project_root: Path) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """
+    One full build: publish slides, scan weeks, write indexes and index.html
+
+    Returns:
+        Tuple of (weeks, rendered lecture cards); weeks is empty on failure
+    """
+    slides_dir = project_root / "slides"
+    rendered_cards: Dict[str, str] = {}
+
+    # Regenerate slides.md of weeks whose slides.json parts changed
+    with profiler.span('assemble'):
+        assembly = assemble_weeks(slides_dir, project_root / '.cache')
+        # The drifted weeks are only named when the list changed since the last build
+        print(format_assembly(assembly, note_drift(project_root / '.cache', assembly['drift'])))
+
+    # Sync slides to src directory first
+    with profiler.span('copy'):
+        copy_slides_to_src(project_root, args.mode)
 
     print(f"🔍 Scanning weeks in: {slides_dir}")
 
-    # Scan for weeks
-    weeks = scan_weeks_directory(slides_dir)
+    # Scan for weeks (metadata is cached in .cache/ between runs)
+    with profiler.span('scan'):
+        weeks = scan_weeks_directory(slides_dir, project_root / '.cache', args.jobs)
 
     if not weeks:
         print("❌ No weeks found in slides directory!")
-        return
+        return [], rendered_cards
 
     print(f"✅ Found {len(weeks)} weeks:")
     for week in weeks:
@@ -945,20 +1748,34 @@ def main():
         status_str = "".join(status) if status else "📋"
         print(f"   Week {week['number']}: {week['title']} {status_str}")
 
+    with profiler.span('course-structure'):
+        if write_course_structure(project_root, weeks):
+            print("📚 Updated src/data/course-structure.json")
+
+    # Generate per-week slide indexes and (pre-rendered) chunks for the viewer
+    with profiler.span('slide-indexes'):
+        written, rendered = build_slide_indexes(project_root, weeks, prerender=not args.no_prerender)
+    print(f"🧩 Slide indexes up to date ({rendered} chunk(s) rendered, "
+          f"{written} file(s) written to src/generated)")
+
     # Generate index.html
     print(f"🏗️  Generating index.html...")
-    html_content = generate_index_html(weeks)
+    with profiler.span('html'):
+        html_content = generate_index_html(weeks, rendered_cards, args.plugins)
 
-    # Write index.html
+    # Write index.html (skipped when unchanged, so open tabs are not reloaded)
     index_path = project_root / "src" / "index.html"
     try:
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"✅ Successfully generated: {index_path}")
+        with profiler.span('write'):
+            changed = write_index(project_root, html_content)
+        if changed:
+            print(f"✅ Successfully generated: {index_path}")
+        else:
+            print(f"✅ Already up to date: {index_path}")
         print(f"📊 Generated {len(weeks)} lecture cards")
     except Exception as e:
         print(f"❌ Failed to write index.html: {e}")
-        return
+        return [], rendered_cards
 
     # Generate summary report
     print(f"\\n📋 Summary:")
@@ -966,7 +1783,61 @@ def main():
     print(f"   - Weeks with slides: {sum(1 for w in weeks if w['has_slides'])}")
     print(f"   - Weeks with code: {sum(1 for w in weeks if w['has_code'])}")
     print(f"   - Weeks with images: {sum(1 for w in weeks if w['has_images'])}")
+    print(f"   - Output: {format_write_stats()}")
     print(f"\\n🚀 Ready to serve at: http://localhost:5173")
+    return weeks, rendered_cards
+
+def serve(args: argparse.Namespace, project_root: Path):
+    """
+    Preview the site without writing src/ or starting Vite
+
+    Only week metadata is scanned up front (cached in .cache/); everything
+    else is read or generated in memory when first requested.
+    """
+    start = time.perf_counter()
+    weeks = scan_weeks_directory(project_root / "slides", project_root / '.cache', args.jobs)
+    if not weeks:
+        print("❌ No weeks found in slides directory!")
+        return
+
+    server = PreviewServer(project_root, weeks, lambda weeks: generate_index_html(weeks, {}, args.plugins))
+
+    def on_ready(url: str):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"🚀 Preview of {len(weeks)} weeks at {url} (ready in {elapsed_ms:.0f} ms), press Ctrl+C to stop")
+
+    try:
+        asyncio.run(run_preview_server(server, args.host, args.port, args.poll, on_ready))
+    except OSError as e:
+        print(f"❌ Could not start the preview server: {e}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped preview server")
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to generate index.html and copy slides"""
+    args = parse_args(argv)
+
+    # Get script directory and project root
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    if args.command == 'serve':
+        serve(args, project_root)
+        return
+
+    profiling = args.profile is not None
+    if profiling:
+        profiler.enable(cprofile=args.cprofile)
+    try:
+        weeks, rendered_cards = build(args, project_root)
+    finally:
+        if profiling:
+            trace_path = Path(args.profile) if args.profile else project_root / DEFAULT_PROFILE_PATH
+            profiler.finish(trace_path, 'bootstrap profile')
+
+    if weeks and args.watch:
+        watch_slides(project_root, weeks, rendered_cards, args.mode, args.poll, not args.no_prerender,
+                     args.plugins)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
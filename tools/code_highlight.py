@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Build-time syntax highlighting for code fences
+Tokenizes fences with Pygments and emits highlight.js class names
+(hljs-keyword, hljs-string, ...) so the monokai theme the viewer already
+loads styles them, and the Highlight plugin only has to add line numbers
+and `{1-N}` steps instead of re-tokenizing every block on load.
+
+Highlighted fences are cached in .cache/render/highlight.json by a hash
+of language and code, so an edited chunk only re-tokenizes the fences
+that actually changed. A full build rewrites the cache with only the
+fences its chunks use. Pygments is optional: without it fences are left
+to highlight.js in the browser, as before.
+"""
+
+import html
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Iterable
+
+from output_writer import write_json
+
+try:
+    import pygments
+    from pygments.lexers import get_lexer_by_name
+    from pygments.token import Token
+    from pygments.util import ClassNotFound
+except ImportError:
+    pygments = None
+
+# Bump when the emitted markup changes (e.g. TOKEN_CLASSES) so cached fences are dropped
+HIGHLIGHT_VERSION = 1
+# Identifies the tokenizer; part of the render cache version so installing
+# or upgrading Pygments re-renders cached chunks
+TOKENIZER = f'pygments-{pygments.__version__}' if pygments else 'none'
+HIGHLIGHTER = f'{HIGHLIGHT_VERSION}:{TOKENIZER}'
+FENCE_CACHE_NAME = 'highlight.json'
+
+# Fence languages Pygments knows under another name
+LANGUAGE_ALIASES = {
+    'xaml': 'xml',
+    'shell': 'bash',
+    'sh': 'bash',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'cs': 'csharp',
+    'c#': 'csharp',
+}
+# Fences that are not source code
+PLAIN_LANGUAGES = {'', 'text', 'plaintext', 'txt', 'mermaid', 'math'}
+
+# Pygments token type → highlight.js class; subtypes fall back to their parent
+TOKEN_CLASSES = {
+    'Keyword': 'hljs-keyword',
+    'Keyword.Constant': 'hljs-literal',
+    'Keyword.Type': 'hljs-type',
+    'Name.Builtin': 'hljs-built_in',
+    'Name.Builtin.Pseudo': 'hljs-variable language_',
+    'Name.Function': 'hljs-title function_',
+    'Name.Class': 'hljs-title class_',
+    'Name.Exception': 'hljs-title class_',
+    'Name.Decorator': 'hljs-meta',
+    'Name.Tag': 'hljs-name',
+    'Name.Attribute': 'hljs-attr',
+    'Name.Label': 'hljs-symbol',
+    'Name.Variable': 'hljs-variable',
+    'Name.Constant': 'hljs-variable constant_',
+    'Literal.String': 'hljs-string',
+    'Literal.String.Escape': 'hljs-char escape_',
+    'Literal.String.Interpol': 'hljs-subst',
+    'Literal.String.Regex': 'hljs-regexp',
+    'Literal.Number': 'hljs-number',
+    'Operator.Word': 'hljs-keyword',
+    'Comment': 'hljs-comment',
+    'Comment.Preproc': 'hljs-meta',
+    'Comment.PreprocFile': 'hljs-string',
+    'Generic.Deleted': 'hljs-deletion',
+    'Generic.Inserted': 'hljs-addition',
+    'Generic.Heading': 'hljs-section',
+    'Generic.Subheading': 'hljs-section',
+    'Generic.Emph': 'hljs-emphasis',
+    'Generic.Strong': 'hljs-strong',
+}
+
+_lexers: Dict[str, Optional[object]] = {}
+_fences: Dict[str, str] = {}
+_fences_path: Optional[Path] = None
+_fences_dirty = False
+# Fences used by the current build, and those highlighted since collect_fence_keys()
+_fences_used: Set[str] = set()
+_fences_recent: List[str] = []
+
+
+def get_lexer(lang: str):
+    """Pygments lexer for a fence language, or None if it cannot be highlighted"""
+    lang = lang.lower()
+    if lang not in _lexers:
+        lexer = None
+        if pygments and lang not in PLAIN_LANGUAGES:
+            try:
+                # Keep the code byte for byte: no newline stripping or tab expansion
+                lexer = get_lexer_by_name(LANGUAGE_ALIASES.get(lang, lang),
+                                          stripnl=False, ensurenl=False, tabsize=0)
+            except ClassNotFound:
+                lexer = None
+        _lexers[lang] = lexer
+    return _lexers[lang]
+
+
+def token_class(token_type) -> Optional[str]:
+    while token_type is not Token:
+        css_class = TOKEN_CLASSES.get(str(token_type)[len('Token.'):])
+        if css_class:
+            return css_class
+        token_type = token_type.parent
+    return None
+
+
+def tokenize(code: str, lexer) -> str:
+    """Escaped HTML of code with highlight.js spans around each token"""
+    out = []
+    pending_class, pending = None, []
+    for token_type, value in lexer.get_tokens(code):
+        css_class = token_class(token_type)
+        if css_class != pending_class and pending:
+            text = html.escape(''.join(pending), quote=False)
+            out.append(f'<span class="{pending_class}">{text}</span>' if pending_class else text)
+            pending = []
+        pending_class = css_class
+        pending.append(value)
+    if pending:
+        text = html.escape(''.join(pending), quote=False)
+        out.append(f'<span class="{pending_class}">{text}</span>' if pending_class else text)
+    return ''.join(out)
+
+
+def highlight_code(code: str, lang: str) -> Optional[str]:
+    """
+    Highlight one fence, reusing the fence cache when it is loaded
+
+    Args:
+        code: Fence body
+        lang: Fence language from the info string
+
+    Returns:
+        Highlighted inner HTML of the <code> element, or None when the
+        language is unknown, plain text, or Pygments is not installed
+    """
+    global _fences_dirty
+    lexer = get_lexer(lang)
+    if lexer is None or not code.strip():
+        return None
+    key = hashlib.sha256(f'{lang.lower()}\0{code}'.encode('utf-8')).hexdigest()
+    _fences_used.add(key)
+    _fences_recent.append(key)
+    highlighted = _fences.get(key)
+    if highlighted is None:
+        highlighted = tokenize(code, lexer)
+        _fences[key] = highlighted
+        _fences_dirty = True
+    return highlighted
+
+
+def load_fence_cache(cache_dir: Path):
+    """Load the fence cache from cache_dir once per process"""
+    global _fences_path
+    path = cache_dir / FENCE_CACHE_NAME
+    if _fences_path == path:
+        return
+    _fences.clear()
+    _fences_path = path
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('highlighter') == HIGHLIGHTER:
+            _fences.update(cache['fences'])
+    except (OSError, ValueError, KeyError):
+        pass
+
+
+def collect_fence_keys() -> List[str]:
+    """Cache keys of the fences highlighted since the last call, in order"""
+    keys = list(dict.fromkeys(_fences_recent))
+    _fences_recent.clear()
+    return keys
+
+
+def keep_fences(keys: Iterable[str]):
+    """Count fences of a chunk served from the render cache as used by this build"""
+    _fences_used.update(keys)
+
+
+def save_fence_cache(prune: bool = False):
+    """
+    Write the fence cache back if it changed
+
+    Args:
+        prune: Drop every fence this build did not use; only valid after
+            a build that rendered or kept every chunk of every week
+    """
+    global _fences_dirty
+    if _fences_path is None:
+        return
+    if prune:
+        unused = _fences.keys() - _fences_used
+        for key in unused:
+            del _fences[key]
+        _fences_dirty = _fences_dirty or bool(unused)
+        _fences_used.clear()
+    if not _fences_dirty:
+        return
+    write_json(_fences_path, {'highlighter': HIGHLIGHTER, 'fences': _fences},
+               ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    _fences_dirty = False
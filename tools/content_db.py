@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+SQLite content database for the whole slide corpus
+Loads every week's slides.md, slides.json parts and summary.md into
+.cache/content.db: one row per file, slide and code fence, with FTS5
+indexes over slide text and fence code. Refreshes only re-read files
+whose hash changed, so repeated queries do not re-parse the markdown.
+Slides are split with deck_index.split_slides, the same separator rule
+slide_model uses, so h/v numbers match the transforms and the viewer.
+
+lecture_tools.py run reads the database as a cache: it records which
+files a transform list left unchanged and skips them while their hash
+stays the same.
+
+Usage:
+    python3 tools/content_db.py refresh
+    python3 tools/content_db.py search QThread
+    python3 tools/content_db.py fences --lang csharp --min-lines 30
+    python3 tools/content_db.py missing-objectives
+    python3 tools/content_db.py sql "SELECT lang, COUNT(*) FROM fences GROUP BY lang"
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Iterable
+
+from deck_index import split_slides, slide_title
+from fences import fence_open, iter_fences
+from week_metadata import WEEK_PATTERN, extract_summary_info, extract_title_from_slides
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / '.cache' / 'content.db'
+
+# Bump when the schema or the extracted rows change; the database is rebuilt
+SCHEMA_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,          -- relative to slides/
+    folder TEXT NOT NULL,
+    week TEXT NOT NULL,
+    kind TEXT NOT NULL,                 -- 'deck' (slides.md), 'part' or 'summary'
+    part_order INTEGER,                 -- position in slides.json for parts
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX files_folder ON files(folder);
+
+CREATE TABLE weeks (
+    folder TEXT PRIMARY KEY,
+    week TEXT NOT NULL,
+    title TEXT NOT NULL,
+    objectives TEXT                     -- 🎯 학습 목표 section of summary.md
+);
+
+CREATE TABLE slides (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    h INTEGER NOT NULL,
+    v INTEGER NOT NULL,
+    line INTEGER NOT NULL,              -- 1-based line of the slide in its file
+    lines INTEGER NOT NULL,             -- non-blank lines
+    title TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX slides_file ON slides(file_id);
+
+CREATE TABLE fences (
+    id INTEGER PRIMARY KEY,
+    slide_id INTEGER NOT NULL REFERENCES slides(id) ON DELETE CASCADE,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    lang TEXT NOT NULL,
+    line INTEGER NOT NULL,              -- 1-based line of the opening fence
+    lines INTEGER NOT NULL,             -- code lines between the fences
+    code TEXT NOT NULL
+);
+CREATE INDEX fences_lang_lines ON fences(lang, lines);
+CREATE INDEX fences_file ON fences(file_id);
+
+-- External-content FTS tables, kept in sync by the triggers below.
+-- The trigram tokenizer matches substrings, which suits Korean text and
+-- identifiers alike (queries need at least three characters).
+CREATE VIRTUAL TABLE slides_fts USING fts5(title, body, content='slides', content_rowid='id', tokenize='trigram');
+CREATE VIRTUAL TABLE fences_fts USING fts5(code, content='fences', content_rowid='id', tokenize='trigram');
+
+CREATE TRIGGER slides_ai AFTER INSERT ON slides BEGIN
+    INSERT INTO slides_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER slides_ad AFTER DELETE ON slides BEGIN
+    INSERT INTO slides_fts(slides_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+END;
+CREATE TRIGGER fences_ai AFTER INSERT ON fences BEGIN
+    INSERT INTO fences_fts(rowid, code) VALUES (new.id, new.code);
+END;
+CREATE TRIGGER fences_ad AFTER DELETE ON fences BEGIN
+    INSERT INTO fences_fts(fences_fts, rowid, code) VALUES ('delete', old.id, old.code);
+END;
+
+-- One row per slide with its week, for queries and other tools
+CREATE VIEW slide_view AS
+    SELECT slides.id, files.folder, files.week, files.path, files.kind,
+           slides.h, slides.v, slides.line, slides.lines, slides.title, slides.body
+    FROM slides JOIN files ON files.id = slides.file_id;
+
+-- Files a transform list (with a hash of its code) left unchanged; the row
+-- goes away with its files row when the content changes
+CREATE TABLE transform_runs (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    transforms TEXT NOT NULL,
+    PRIMARY KEY (file_id, transforms)
+);
+
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+'''
+
+
+def connect(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """
+    Open the content database, (re)creating the schema when it is missing
+    or from another SCHEMA_VERSION
+
+    Returns:
+        Connection with foreign keys enabled and sqlite3.Row rows
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.execute('PRAGMA journal_mode = WAL')
+
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        version = int(row['value']) if row else None
+    except sqlite3.DatabaseError:
+        version = None
+    if version != SCHEMA_VERSION:
+        conn.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(f'{db_path}{suffix}').unlink(missing_ok=True)
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA foreign_keys = ON')
+        conn.execute('PRAGMA journal_mode = WAL')
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+    return conn
+
+
+def source_files(slides_dir: Path) -> List[Dict[str, Any]]:
+    """
+    List the files the database covers: each week's slides.md, the parts
+    named in its slides.json and summary.md
+
+    Returns:
+        List of dicts with path (relative to slides_dir), folder, week,
+        kind and part_order
+    """
+    files = []
+    for week_path in sorted(slides_dir.iterdir()):
+        match = WEEK_PATTERN.match(week_path.name)
+        if not match or not week_path.is_dir():
+            continue
+        folder, week = week_path.name, match.group(1)
+        entries = [('slides.md', 'deck', None), ('summary.md', 'summary', None)]
+        try:
+            with open(week_path / 'slides.json', 'r', encoding='utf-8') as f:
+                parts = json.load(f).get('files', [])
+            entries += [(name, 'part', order) for order, name in enumerate(parts) if isinstance(name, str)]
+        except (OSError, ValueError, AttributeError):
+            pass
+        for name, kind, order in entries:
+            if (week_path / name).is_file():
+                files.append({'path': f'{folder}/{name}', 'folder': folder, 'week': week,
+                              'kind': kind, 'part_order': order})
+    return files
+
+
+def extract_fences(body: str) -> List[Dict[str, Any]]:
+    """
+    Find the fenced code blocks of a slide body
+
+    Returns:
+        List of dicts with lang, line (0-based within the body), lines and code;
+        an unclosed fence runs to the end of the slide
+    """
+    fences = []
+    body_lines = body.split('\n')
+    for start, close in iter_fences(body_lines):
+        code = body_lines[start + 1:close]
+        lang = fence_open(body_lines[start]).group(3)
+        fences.append({'lang': lang.lower(), 'line': start, 'lines': len(code), 'code': '\n'.join(code)})
+    return fences
+
+
+def load_file(conn: sqlite3.Connection, entry: Dict[str, Any], data: bytes, st) -> int:
+    """Insert one file with its slides and fences; returns the file id"""
+    text = data.decode('utf-8', errors='replace')
+    cursor = conn.execute(
+        'INSERT INTO files (path, folder, week, kind, part_order, sha256, size, mtime_ns) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        (entry['path'], entry['folder'], entry['week'], entry['kind'], entry['part_order'],
+         hashlib.sha256(data).hexdigest(), st.st_size, st.st_mtime_ns))
+    file_id = cursor.lastrowid
+    if entry['kind'] == 'summary':
+        return file_id
+
+    for slide in split_slides(text):
+        body = text[slide['start']:slide['end']]
+        line = text.count('\n', 0, slide['start']) + 1
+        slide_id = conn.execute(
+            'INSERT INTO slides (file_id, h, v, line, lines, title, body) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (file_id, slide['h'], slide['v'], line, sum(1 for l in body.split('\n') if l.strip()),
+             slide_title(body), body)).lastrowid
+        conn.executemany(
+            'INSERT INTO fences (slide_id, file_id, lang, line, lines, code) VALUES (?, ?, ?, ?, ?, ?)',
+            [(slide_id, file_id, fence['lang'], line + fence['line'], fence['lines'], fence['code'])
+             for fence in extract_fences(body)])
+    return file_id
+
+
+def refresh_weeks(conn: sqlite3.Connection, slides_dir: Path, folders: List[str]):
+    """Recompute the weeks rows of the given folders from their slides.md and summary.md"""
+    for folder in folders:
+        conn.execute('DELETE FROM weeks WHERE folder = ?', (folder,))
+        match = WEEK_PATTERN.match(folder)
+        week_path = slides_dir / folder
+        if not match or not week_path.is_dir():
+            continue
+        title = f'Week {match.group(1)}'
+        objectives = None
+        try:
+            title = extract_title_from_slides((week_path / 'slides.md').read_text(encoding='utf-8')) or title
+        except OSError:
+            pass
+        try:
+            info = extract_summary_info((week_path / 'summary.md').read_text(encoding='utf-8'))
+            title = info.get('title', title)
+            objectives = info.get('description')
+        except OSError:
+            pass
+        conn.execute('INSERT INTO weeks (folder, week, title, objectives) VALUES (?, ?, ?, ?)',
+                     (folder, match.group(1), title, objectives))
+
+
+def refresh(conn: sqlite3.Connection, slides_dir: Path) -> Dict[str, int]:
+    """
+    Bring the database in line with slides_dir
+
+    Files whose size and mtime match their row are skipped without being
+    read; the rest are hashed and only reloaded when the hash changed.
+
+    Returns:
+        Counts of added, updated, removed and unchanged files
+    """
+    stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+    known = {row['path']: row for row in conn.execute('SELECT id, path, sha256, size, mtime_ns FROM files')}
+    dirty_folders = set()
+
+    with conn:
+        seen = set()
+        for entry in source_files(slides_dir):
+            path = slides_dir / entry['path']
+            seen.add(entry['path'])
+            st = path.stat()
+            row = known.get(entry['path'])
+            if row and row['size'] == st.st_size and row['mtime_ns'] == st.st_mtime_ns:
+                stats['unchanged'] += 1
+                continue
+            data = path.read_bytes()
+            if row and row['sha256'] == hashlib.sha256(data).hexdigest():
+                conn.execute('UPDATE files SET mtime_ns = ? WHERE id = ?', (st.st_mtime_ns, row['id']))
+                stats['unchanged'] += 1
+                continue
+            if row:
+                conn.execute('DELETE FROM files WHERE id = ?', (row['id'],))
+            load_file(conn, entry, data, st)
+            stats['updated' if row else 'added'] += 1
+            dirty_folders.add(entry['folder'])
+
+        for path, row in known.items():
+            if path not in seen:
+                conn.execute('DELETE FROM files WHERE id = ?', (row['id'],))
+                stats['removed'] += 1
+                dirty_folders.add(path.split('/', 1)[0])
+
+        refresh_weeks(conn, slides_dir, sorted(dirty_folders))
+    return stats
+
+
+def fts_query(text: str) -> str:
+    """Quote each word so FTS5 treats the input as plain phrases"""
+    return ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def search_slides(conn: sqlite3.Connection, text: str, kind: str = 'deck',
+                  limit: int = 50) -> List[sqlite3.Row]:
+    """
+    Slides whose title or body contains every word of text
+
+    Words shorter than three characters cannot use the trigram index and
+    fall back to a LIKE scan.
+
+    Args:
+        conn: Database connection
+        text: Words to look for
+        kind: 'deck' for slides.md, 'part' for the slides.json parts
+        limit: Maximum rows returned
+    """
+    words = text.split()
+    long_words = [word for word in words if len(word) >= 3]
+    short_words = [word for word in words if len(word) < 3]
+    sql = 'SELECT slide_view.* FROM slide_view'
+    where = ['slide_view.kind = ?']
+    params: List[Any] = [kind]
+    if long_words:
+        sql += ' JOIN slides_fts ON slides_fts.rowid = slide_view.id'
+        where.append('slides_fts MATCH ?')
+        params.append(fts_query(' '.join(long_words)))
+    for word in short_words:
+        where.append('(slide_view.title LIKE ? OR slide_view.body LIKE ?)')
+        params += [f'%{word}%', f'%{word}%']
+    sql += ' WHERE ' + ' AND '.join(where) + ' ORDER BY slide_view.folder, slide_view.h, slide_view.v LIMIT ?'
+    params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
+def find_fences(conn: sqlite3.Connection, lang: Optional[str] = None, min_lines: int = 0,
+                contains: Optional[str] = None, kind: str = 'deck') -> List[sqlite3.Row]:
+    """
+    Code fences by language, size and (substring) content
+
+    Returns:
+        Rows with folder, path, line, lang, lines and the slide title
+    """
+    sql = ('SELECT files.folder, files.path, fences.line, fences.lang, fences.lines, slides.title '
+           'FROM fences JOIN files ON files.id = fences.file_id JOIN slides ON slides.id = fences.slide_id')
+    where = ['files.kind = ?', 'fences.lines >= ?']
+    params: List[Any] = [kind, min_lines]
+    if lang:
+        where.append('fences.lang = ?')
+        params.append(lang.lower())
+    if contains:
+        sql += ' JOIN fences_fts ON fences_fts.rowid = fences.id'
+        where.append('fences_fts MATCH ?')
+        params.append(fts_query(contains))
+    sql += ' WHERE ' + ' AND '.join(where) + ' ORDER BY fences.lines DESC'
+    return conn.execute(sql, params).fetchall()
+
+
+def weeks_missing_objectives(conn: sqlite3.Connection) -> List[sqlite3.Row]:
+    """Weeks whose summary.md has no 🎯 학습 목표 section (or no summary.md)"""
+    return conn.execute('SELECT folder, week, title FROM weeks WHERE objectives IS NULL '
+                        'ORDER BY CAST(week AS INTEGER)').fetchall()
+
+
+def clean_paths(conn: sqlite3.Connection, transforms: str) -> Set[str]:
+    """
+    Files the given transforms already ran on without changing them
+
+    Args:
+        conn: Database connection, refreshed before the run
+        transforms: Key from the transform runner (names and code hash)
+
+    Returns:
+        Paths relative to slides/ whose current content is a no-op for transforms
+    """
+    return {row['path'] for row in conn.execute(
+        'SELECT files.path FROM transform_runs JOIN files ON files.id = transform_runs.file_id '
+        'WHERE transform_runs.transforms = ?', (transforms,))}
+
+
+def record_clean(conn: sqlite3.Connection, transforms: str, paths: Iterable[str]):
+    """
+    Remember that transforms left these files unchanged
+
+    The files rows must still describe the content the transforms read,
+    i.e. the database must not have been refreshed since.
+    """
+    with conn:
+        conn.executemany('INSERT OR IGNORE INTO transform_runs (file_id, transforms) '
+                         'SELECT id, ? FROM files WHERE path = ?',
+                         [(transforms, path) for path in paths])
+
+
+def print_rows(rows: List[sqlite3.Row], columns: Optional[List[str]] = None):
+    if not rows:
+        print("ℹ️  No results")
+        return
+    columns = columns or list(rows[0].keys())
+    for row in rows:
+        print('   ' + ' | '.join(str(row[column]) for column in columns))
+    print(f"   ({len(rows)} row(s))")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Query the SQLite content database of the slide corpus')
+    parser.add_argument('--db', default=str(DEFAULT_DB_PATH), help=f'Database path (default: {DEFAULT_DB_PATH})')
+    parser.add_argument('--slides-dir', default=str(PROJECT_ROOT / 'slides'), help='Slides directory')
+    parser.add_argument('--no-refresh', action='store_true', help='Query without refreshing first')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('refresh', help='Load changed files into the database')
+
+    search_parser = subparsers.add_parser('search', help='Slides containing all given words')
+    search_parser.add_argument('words', nargs='+')
+    search_parser.add_argument('--parts', action='store_true', help='Search the slides.json parts instead of slides.md')
+    search_parser.add_argument('--limit', type=int, default=50)
+
+    fences_parser = subparsers.add_parser('fences', help='Code fences by language and size')
+    fences_parser.add_argument('--lang', help='Fence language, e.g. csharp')
+    fences_parser.add_argument('--min-lines', type=int, default=0, help='Only fences with at least this many lines')
+    fences_parser.add_argument('--contains', help='Substring the code must contain')
+    fences_parser.add_argument('--parts', action='store_true', help='Look in the slides.json parts instead of slides.md')
+
+    subparsers.add_parser('missing-objectives', help='Weeks without a 🎯 학습 목표 section')
+
+    sql_parser = subparsers.add_parser('sql', help='Run a read-only SQL query')
+    sql_parser.add_argument('query')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    conn = connect(Path(args.db))
+    try:
+        if args.command == 'refresh' or not args.no_refresh:
+            start = time.perf_counter()
+            stats = refresh(conn, Path(args.slides_dir))
+            if args.command == 'refresh' or stats['added'] + stats['updated'] + stats['removed']:
+                print(f"🗄️  Content DB: {stats['added']} added, {stats['updated']} updated, "
+                      f"{stats['removed']} removed, {stats['unchanged']} unchanged "
+                      f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+        if args.command == 'search':
+            kind = 'part' if args.parts else 'deck'
+            print_rows(search_slides(conn, ' '.join(args.words), kind, args.limit),
+                       ['folder', 'h', 'v', 'line', 'title'])
+        elif args.command == 'fences':
+            kind = 'part' if args.parts else 'deck'
+            print_rows(find_fences(conn, args.lang, args.min_lines, args.contains, kind),
+                       ['path', 'line', 'lang', 'lines', 'title'])
+        elif args.command == 'missing-objectives':
+            print_rows(weeks_missing_objectives(conn))
+        elif args.command == 'sql':
+            conn.execute('PRAGMA query_only = ON')
+            try:
+                print_rows(conn.execute(args.query).fetchall())
+            except sqlite3.Error as e:
+                print(f"❌ {e}")
+                return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
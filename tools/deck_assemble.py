@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Build stage that assembles each week's slides.md from its slides.json parts
+Parts are hashed on every run; only when a hash (or the parts list) changed
+is the deck re-assembled, and slides.md is rewritten only when the assembly
+differs. Once slides.md matches its parts the viewer chunks follow part
+boundaries, so an edited part re-renders just its own chunk. The stage also keeps
+a source map from rendered slide (h, v) to part file and line, stored in
+.cache/assemble/<week>.json, for tools that should point at the part to edit.
+
+A slides.md edited by hand (it no longer matches the last assembly, or it
+never matched the parts) is reported as drifted and left alone until the
+stage is run with --force, which replaces it with the assembled parts and
+so discards those edits. A drifted week has no source map; its state
+records the drifted slides.md and part hashes so later runs report it
+again without re-assembling.
+
+Usage:
+    python3 tools/deck_assemble.py                # assemble all weeks
+    python3 tools/deck_assemble.py --check        # list drifted weeks, write nothing
+    python3 tools/deck_assemble.py --force week03-csharp-realtime-data
+"""
+
+import sys
+import json
+import bisect
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from deck_index import assemble_parts, compose_source_map, read_parts
+from output_writer import write_json, write_text
+from week_metadata import WEEK_PATTERN
+
+ASSEMBLE_DIR = 'assemble'
+ASSEMBLE_VERSION = 3
+# Weeks reported as drifted by the last full run, so builds only repeat the warning when it changes
+DRIFT_NAME = 'drift.json'
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def state_path(cache_dir: Path, folder: str) -> Path:
+    return cache_dir / ASSEMBLE_DIR / f'{folder}.json'
+
+
+def load_state(cache_dir: Path, folder: str) -> Dict[str, Any]:
+    try:
+        with open(state_path(cache_dir, folder), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == ASSEMBLE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': ASSEMBLE_VERSION, 'order': [], 'hashes': [], 'deck': None, 'drift': None, 'map': []}
+
+
+def assemble_week(week_path: Path, cache_dir: Path, force: bool = False) -> str:
+    """
+    Regenerate one week's slides.md from its parts if any part changed
+
+    Args:
+        week_path: Week folder under slides/
+        cache_dir: Project .cache directory
+        force: Overwrite slides.md even if it was edited by hand
+
+    Returns:
+        'written', 'unchanged', 'drift' (slides.md left alone) or
+        'none' (the week has no slides.json parts)
+    """
+    parts = read_parts(week_path)
+    if not parts:
+        return 'none'
+
+    folder = week_path.name
+    state = load_state(cache_dir, folder)
+    slides_file = week_path / 'slides.md'
+    try:
+        current = slides_file.read_text(encoding='utf-8')
+    except OSError:
+        current = None
+    current_hash = sha256_text(current) if current is not None else None
+
+    hashes = [sha256_text(text) for _name, text in parts]
+    order = [name for name, _text in parts]
+    if order == state['order'] and hashes == state['hashes']:
+        if current_hash == state['deck']:
+            return 'unchanged'
+        if current_hash is not None and current_hash == state['drift'] and not force:
+            return 'drift'
+
+    assembled, starts = assemble_parts([text for _name, text in parts])
+    assembled_hash = sha256_text(assembled)
+    hand_edited = current is not None and current_hash not in (state['deck'], assembled_hash)
+    if hand_edited and not force:
+        # Keep the last assembly (deck, map) so slides.md can still be recognized as it
+        write_json(state_path(cache_dir, folder), dict(state, order=order, hashes=hashes, drift=current_hash),
+                   ensure_ascii=False, separators=(',', ':'))
+        return 'drift'
+
+    status = 'unchanged'
+    if current_hash != assembled_hash:
+        write_text(slides_file, assembled)
+        status = 'written'
+    write_json(state_path(cache_dir, folder), {
+        'version': ASSEMBLE_VERSION,
+        'order': order,
+        'hashes': hashes,
+        'deck': assembled_hash,
+        'drift': None,
+        'map': compose_source_map(assembled, starts, order)
+    }, ensure_ascii=False, separators=(',', ':'))
+    return status
+
+
+def assemble_weeks(slides_dir: Path, cache_dir: Path, folders: Optional[List[str]] = None,
+                   force: bool = False) -> Dict[str, List[str]]:
+    """
+    Run assemble_week over every week folder (or just the given ones)
+
+    Returns:
+        Week folders grouped by assemble_week status
+    """
+    results: Dict[str, List[str]] = {'written': [], 'unchanged': [], 'drift': [], 'none': []}
+    for week_path in sorted(slides_dir.iterdir()):
+        if not week_path.is_dir() or not WEEK_PATTERN.match(week_path.name):
+            continue
+        if folders is not None and week_path.name not in folders:
+            continue
+        results[assemble_week(week_path, cache_dir, force)].append(week_path.name)
+    return results
+
+
+def note_drift(cache_dir: Path, drifted: List[str]) -> bool:
+    """
+    Remember which weeks drifted in a full run
+
+    Returns:
+        True if the list differs from the one noted last time
+    """
+    path = cache_dir / ASSEMBLE_DIR / DRIFT_NAME
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if json.load(f) == drifted:
+                return False
+    except (OSError, ValueError):
+        pass
+    write_json(path, drifted)
+    return True
+
+
+def format_results(results: Dict[str, List[str]], list_drift: bool = True) -> str:
+    """
+    Summarize assemble_weeks results
+
+    Args:
+        results: Return value of assemble_weeks
+        list_drift: Name the drifted weeks (otherwise only count them)
+    """
+    line = (f"🧱 slides.md assembly: {len(results['written'])} written, "
+            f"{len(results['unchanged'])} unchanged")
+    if results['drift'] and list_drift:
+        line += (f"\n⚠️  slides.md differs from its parts in {', '.join(results['drift'])} and was left as is. "
+                 f"Compare with tools/deck_assemble.py --check; --force regenerates it from the parts "
+                 f"and discards any manual edits to slides.md")
+    elif results['drift']:
+        line += f", {len(results['drift'])} differing from their parts (see tools/deck_assemble.py --check)"
+    return line
+
+
+def load_source_map(week_path: Path, cache_dir: Path) -> Optional[List[Dict[str, Any]]]:
+    """
+    Source map of a week, if slides.md is still the assembly it describes
+
+    Returns:
+        Entries from compose_source_map, or None (no parts, never
+        assembled, or slides.md edited since)
+    """
+    state = load_state(cache_dir, week_path.name)
+    if not state['deck']:
+        return None
+    try:
+        current = (week_path / 'slides.md').read_text(encoding='utf-8')
+    except OSError:
+        return None
+    return state['map'] if sha256_text(current) == state['deck'] else None
+
+
+def slide_sources(source_map: List[Dict[str, Any]]) -> Dict[Tuple[int, int], Tuple[str, int]]:
+    """Rendered slide (h, v) → (part file, 1-based line)"""
+    return {(entry['h'], entry['v']): (entry['part'], entry['line']) for entry in source_map}
+
+
+def deck_position(source_map: List[Dict[str, Any]], part: str, line: int) -> Optional[Tuple[int, int]]:
+    """Rendered slide (h, v) containing a 1-based line of a part"""
+    entry = next((entry for entry in source_map if entry['part'] == part), None)
+    if entry is None:
+        return None
+    deck_line = entry['deck_line'] - entry['line'] + line
+    index = bisect.bisect_right([entry['deck_line'] for entry in source_map], deck_line) - 1
+    return (source_map[index]['h'], source_map[index]['v']) if index >= 0 else None
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Assemble slides.md from the slides.json parts')
+    parser.add_argument('folders', nargs='*', help='Week folders (default: all)')
+    parser.add_argument('--force', action='store_true', help='Overwrite slides.md even if it was edited by hand')
+    parser.add_argument('--check', action='store_true', help='Only list weeks whose slides.md drifted from the parts')
+    parser.add_argument('--slides-dir', default=str(Path(__file__).resolve().parent.parent / 'slides'))
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    slides_dir = Path(args.slides_dir)
+    cache_dir = slides_dir.parent / '.cache'
+    folders = args.folders or None
+
+    if args.check:
+        drifted = []
+        for week_path in sorted(slides_dir.iterdir()):
+            parts = read_parts(week_path) if WEEK_PATTERN.match(week_path.name) and week_path.is_dir() else []
+            if not parts or (folders is not None and week_path.name not in folders):
+                continue
+            slides_file = week_path / 'slides.md'
+            if not slides_file.exists():
+                # Nothing to lose: the next run simply writes it
+                print(f"   {week_path.name} (no slides.md yet, will be assembled)")
+                continue
+            assembled, _starts = assemble_parts([text for _name, text in parts])
+            if slides_file.read_text(encoding='utf-8') != assembled:
+                drifted.append(week_path.name)
+                print(f"   {week_path.name}")
+        print(f"{'⚠️ ' if drifted else '✅'} {len(drifted)} week(s) where slides.md differs from the parts")
+        return 1 if drifted else 0
+
+    results = assemble_weeks(slides_dir, cache_dir, folders, args.force)
+    if folders is None:
+        note_drift(cache_dir, results['drift'])
+    print(format_results(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
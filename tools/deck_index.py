@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Per-week slide index and chunked deck output for the viewer
+Splits each week's slides.md into independently loadable chunks so the
+first slides render before the whole deck has been fetched and parsed
+"""
+
+import os
+import re
+import json
+import bisect
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import profiler
+from code_highlight import save_fence_cache
+from deck_render import render_week_chunks
+from deck_pages import find_week_page, write_week_page
+from fences import line_roles, open_fence_at_end
+from search_index import SEARCH_DIR, write_week_shard, find_week_shard, prune_shards
+from output_writer import fingerprinted, write_text
+
+INDEX_STEM = 'slides.index'
+INDEX_VERSION = 3
+# Fingerprinted copy of slides.md for the viewer's fallback when no index loads
+SOURCE_STEM = 'slides'
+
+# Maps week numbers to their fingerprinted index files; the only
+# generated file that is not served as immutable
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Same separators the viewer hands to the Reveal markdown plugin
+# (data-separator="^\n---\n$", data-separator-vertical="^\n--\n$")
+SEPARATOR_PATTERN = re.compile(r'^\n(---|--)\n$', re.MULTILINE)
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$')
+H1_PATTERN = re.compile(r'^#\s+\S')
+MARKUP_PATTERN = re.compile(r'<!--.*?-->|<[^>]+>', re.DOTALL)
+NOTES_PATTERN = re.compile(r'^Note:', re.MULTILINE)
+
+# Slides centered by the viewer (data-layout="center"): section titles and
+# agenda/wrap-up slides. Text rules match the slide's visible text.
+CENTER_PREFIXES = ('목차',)
+CENTER_KEYWORDS = ('Table of Contents', '다음 주차 예고', '정리', 'Q&A')
+
+# Chunk size used when a week has no usable slides.json parts
+CHUNK_TARGET_BYTES = 24 * 1024
+
+
+def assemble_parts(part_texts: List[str]) -> Tuple[str, List[int]]:
+    """
+    Join slides.json parts into one deck the way slides.md is built
+
+    Parts are separated by a slide separator, except where a part ends
+    inside a code fence; then the next part continues the fence.
+
+    Args:
+        part_texts: Contents of the part files in slides.json order
+
+    Returns:
+        Tuple of (assembled markdown, start offset of each part)
+    """
+    pieces = []
+    starts = []
+    position = 0
+    opener = None
+    for i, text in enumerate(part_texts):
+        text = text.rstrip('\n')
+        if i > 0:
+            joiner = '\n' if opener else '\n\n---\n\n'
+            pieces.append(joiner)
+            position += len(joiner)
+        starts.append(position)
+        pieces.append(text)
+        position += len(text)
+        # Joiners hold no fence lines, so an open fence carries over part by part
+        opener = open_fence_at_end(text, opener)
+    return ''.join(pieces) + '\n', starts
+
+
+def read_parts(week_path: Path) -> List[Tuple[str, str]]:
+    """
+    Read the parts listed in a week's slides.json
+
+    Returns:
+        List of (file name, content); empty if slides.json is missing or invalid
+    """
+    parts_file = week_path / 'slides.json'
+    if not parts_file.exists():
+        return []
+    try:
+        with open(parts_file, 'r', encoding='utf-8') as f:
+            names = json.load(f).get('files', [])
+        return [(name, (week_path / name).read_text(encoding='utf-8')) for name in names]
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"Warning: Could not read parts of {week_path.name}: {e}")
+        return []
+
+
+def split_slides(markdown: str) -> List[Dict[str, Any]]:
+    """
+    Split a deck into slides using the viewer's separators
+
+    Returns:
+        List of dicts with 'start'/'end' character offsets of each slide
+        body and its 'h'/'v' position in the Reveal slide grid
+    """
+    slides = []
+    start = 0
+    h, v = 0, 0
+    for match in SEPARATOR_PATTERN.finditer(markdown):
+        slides.append({'start': start, 'end': match.start(), 'h': h, 'v': v})
+        if match.group(1) == '---':
+            h, v = h + 1, 0
+        else:
+            v += 1
+        start = match.end()
+    slides.append({'start': start, 'end': len(markdown), 'h': h, 'v': v})
+    return slides
+
+
+def compose_source_map(assembled: str, starts: List[int], names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Map every rendered slide of an assembled deck back to its part
+
+    Args:
+        assembled: slides.md text from assemble_parts
+        starts: Offset of each part in assembled, from assemble_parts
+        names: Part file names in slides.json order
+
+    Returns:
+        One entry per rendered slide: h, v, part, line (1-based in the part)
+        and deck_line (1-based in slides.md). A slide that starts in one
+        part and continues into the next maps to where it starts.
+    """
+    entries = []
+    for slide in split_slides(assembled):
+        k = bisect.bisect_right(starts, slide['start']) - 1
+        entries.append({
+            'h': slide['h'],
+            'v': slide['v'],
+            'part': names[k],
+            'line': assembled.count('\n', starts[k], slide['start']) + 1,
+            'deck_line': assembled.count('\n', 0, slide['start']) + 1
+        })
+    return entries
+
+
+def slide_layout(body: str) -> Optional[str]:
+    """
+    Classify a slide for the viewer's layout
+
+    Returns:
+        'center' for H1-only slides and slides whose text starts with 목차
+        or mentions Table of Contents, 정리, Q&A or 다음 주차 예고; else None
+    """
+    notes = NOTES_PATTERN.search(body)
+    if notes:
+        body = body[:notes.start()]
+    lines = [line.strip() for line in MARKUP_PATTERN.sub('', body).split('\n') if line.strip()]
+    if not lines:
+        return None
+    if all(H1_PATTERN.match(line) for line in lines):
+        return 'center'
+    text = '\n'.join(line.lstrip('#>*-_ ').strip() for line in lines)
+    if text.startswith(CENTER_PREFIXES) or any(keyword in text for keyword in CENTER_KEYWORDS):
+        return 'center'
+    return None
+
+
+def slide_title(body: str) -> str:
+    """Return the first heading of a slide outside code fences"""
+    for line, role in line_roles(body.split('\n')):
+        if role == 'text':
+            match = HEADING_PATTERN.match(line)
+            if match:
+                return re.sub(r'[*_`]', '', match.group(1)).strip()
+    return ''
+
+
+def plan_chunks(slides: List[Dict[str, Any]], part_starts: Optional[List[int]],
+                part_names: List[str], markdown: str) -> List[Dict[str, Any]]:
+    """
+    Group consecutive horizontal slides into chunks
+
+    Chunks follow the slides.json parts when given, otherwise they are
+    cut at slide boundaries once they reach CHUNK_TARGET_BYTES. Vertical
+    stacks are never split across chunks.
+    """
+    chunks: List[Dict[str, Any]] = []
+    for slide in slides:
+        if part_starts:
+            part = max(i for i, start in enumerate(part_starts) if start <= slide['start'])
+            key = part_names[part]
+        else:
+            key = None
+
+        current = chunks[-1] if chunks else None
+        starts_stack = slide['v'] == 0
+        if current is None or (starts_stack and (
+                (part_starts and current['part'] != key)
+                or (not part_starts and slide['start'] - current['start'] >= CHUNK_TARGET_BYTES))):
+            current = {'part': key, 'start': slide['start'], 'slides': []}
+            chunks.append(current)
+        current['slides'].append(slide)
+        current['end'] = slide['end']
+
+    for chunk in chunks:
+        chunk['text'] = markdown[chunk['start']:chunk['end']]
+    return chunks
+
+
+def build_week_index(week: Dict[str, Any], week_path: Path) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Compute the slide index and chunk contents for one week
+
+    Args:
+        week: Week dictionary from extract_week_info
+        week_path: Path to the week's folder under slides/
+
+    Returns:
+        Tuple of (index dictionary, list of chunk markdown texts)
+    """
+    markdown = (week_path / 'slides.md').read_text(encoding='utf-8')
+
+    parts = read_parts(week_path)
+    part_starts = None
+    part_names = [name for name, _text in parts]
+    if parts:
+        assembled, starts = assemble_parts([text for _name, text in parts])
+        if assembled == markdown:
+            part_starts = starts
+
+    slides = split_slides(markdown)
+    chunks = plan_chunks(slides, part_starts, part_names, markdown)
+    # Part file and line of each slide when slides.md is assembled from the parts
+    sources = ({(entry['h'], entry['v']): entry for entry in compose_source_map(markdown, part_starts, part_names)}
+               if part_starts else {})
+
+    line_of = _line_counter(markdown)
+    index_slides = []
+    index_chunks = []
+    texts = []
+    for chunk_num, chunk in enumerate(chunks):
+        name = fingerprinted(f'chunk-{chunk_num:02d}', '.md', chunk['text'])
+        encoded_start = len(markdown[:chunk['start']].encode('utf-8'))
+        for slide in chunk['slides']:
+            body = markdown[slide['start']:slide['end']]
+            offset = len(markdown[chunk['start']:slide['start']].encode('utf-8'))
+            index_slides.append({
+                'id': f"{slide['h']}" if slide['v'] == 0 else f"{slide['h']}/{slide['v']}",
+                'h': slide['h'],
+                'v': slide['v'],
+                'chunk': chunk_num,
+                'offset': offset,
+                'length': len(body.encode('utf-8')),
+                'line': line_of(slide['start']),
+                'title': slide_title(body),
+                'layout': slide_layout(body)
+            })
+            source = sources.get((slide['h'], slide['v']))
+            if source:
+                index_slides[-1]['part'] = source['part']
+                index_slides[-1]['part_line'] = source['line']
+        index_chunks.append({
+            'file': name,
+            'part': chunk['part'],
+            'first': chunk['slides'][0]['h'],
+            'count': sum(1 for s in chunk['slides'] if s['v'] == 0),
+            'offset': encoded_start,
+            'bytes': len(chunk['text'].encode('utf-8'))
+        })
+        texts.append(chunk['text'])
+
+    index = {
+        'version': INDEX_VERSION,
+        'week': week['number'],
+        'folder': week_path.name,
+        'source': 'parts' if part_starts else 'slides.md',
+        'slides': index_slides,
+        'chunks': index_chunks
+    }
+    return index, texts
+
+
+def _line_counter(text: str):
+    """Return a function mapping increasing character offsets to 1-based line numbers"""
+    state = {'offset': 0, 'line': 1}
+
+    def line_of(offset: int) -> int:
+        if offset < state['offset']:
+            state['offset'], state['line'] = 0, 1
+        state['line'] += text.count('\n', state['offset'], offset)
+        state['offset'] = offset
+        return state['line']
+    return line_of
+
+
+def write_week_index(week: Dict[str, Any], week_path: Path, out_dir: Path,
+                     cache_dir: Optional[Path] = None) -> Tuple[int, int]:
+    """
+    Build and write one week's index and chunks under out_dir/<folder>
+
+    Every file name carries a hash of its content, so the files can be
+    served as immutable; manifest.json points at the current index.
+    The week's search shard is written from the same chunks.
+
+    Args:
+        week: Week dictionary from extract_week_info
+        week_path: Path to the week's folder under slides/
+        out_dir: src/generated directory
+        cache_dir: Render cache directory; when given, every chunk is also
+            pre-rendered to chunk-NN.<hash>.html and the index format becomes 'html'
+
+    Returns:
+        Tuple of (files written, chunks rendered)
+    """
+    index, texts = build_week_index(week, week_path)
+    week_out = out_dir / week_path.name
+    written = 0
+    rendered = 0
+
+    markdown = (week_path / 'slides.md').read_text(encoding='utf-8')
+    source_name = fingerprinted(SOURCE_STEM, '.md', markdown)
+    written += write_text(week_out / source_name, markdown)
+
+    if cache_dir is not None:
+        htmls, rendered = render_week_chunks(week_path.name, index, texts, cache_dir)
+        index['format'] = 'html'
+    else:
+        htmls = []
+        index['format'] = 'markdown'
+
+    expected = {source_name}
+    for chunk_num, (chunk, text) in enumerate(zip(index['chunks'], texts)):
+        expected.add(chunk['file'])
+        written += write_text(week_out / chunk['file'], text)
+        if htmls:
+            chunk['html'] = fingerprinted(f'chunk-{chunk_num:02d}', '.html', htmls[chunk_num])
+            expected.add(chunk['html'])
+            written += write_text(week_out / chunk['html'], htmls[chunk_num])
+    written += write_week_shard(index, texts, out_dir / SEARCH_DIR)
+    index_text = json.dumps(index, ensure_ascii=False, indent=1) + '\n'
+    index_name = fingerprinted(INDEX_STEM, '.json', index_text)
+    expected.add(index_name)
+    written += write_text(week_out / index_name, index_text)
+
+    # Drop chunks and indexes superseded by this build
+    for pattern in ('chunk-*', f'{INDEX_STEM}*', f'{SOURCE_STEM}.*.md'):
+        for stale in week_out.glob(pattern):
+            if stale.name not in expected:
+                stale.unlink()
+    return written, rendered
+
+
+def find_week_index(week_out: Path) -> Optional[str]:
+    """Name of the fingerprinted index file in a week's output folder"""
+    names = sorted(path.name for path in week_out.glob(f'{INDEX_STEM}.*.json'))
+    return names[-1] if names else None
+
+
+def find_week_source(week_out: Path) -> Optional[str]:
+    """Name of the fingerprinted slides.md copy in a week's output folder"""
+    names = sorted(path.name for path in week_out.glob(f'{SOURCE_STEM}.*.md'))
+    return names[-1] if names else None
+
+
+def build_manifest(out_dir: Path, weeks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Map every week to its folder and the URLs the viewer loads
+
+    Every URL in it is fingerprinted, so only the manifest itself needs
+    revalidating.
+
+    Returns:
+        Manifest dictionary; 'index', 'page' and 'slides' are None for
+        weeks without generated output
+    """
+    entries = {}
+    for week in weeks:
+        folder = week['folder']
+        week_out = out_dir / folder
+        index_name = find_week_index(week_out) if week['has_slides'] else None
+        page_name = find_week_page(week_out) if week['has_slides'] else None
+        source_name = find_week_source(week_out) if week['has_slides'] else None
+        shard_name = find_week_shard(out_dir / SEARCH_DIR, folder) if week['has_slides'] else None
+        entries[week['number']] = {
+            'folder': folder,
+            'title': week['title'],
+            'index': f'/generated/{folder}/{index_name}' if index_name else None,
+            'page': f'/generated/{folder}/{page_name}' if page_name else None,
+            'slides': f'/generated/{folder}/{source_name}' if source_name else None,
+            'search': f'/generated/{SEARCH_DIR}/{shard_name}' if shard_name else None
+        }
+    return {'version': MANIFEST_VERSION, 'weeks': entries}
+
+
+def build_slide_indexes(project_root: Path, weeks: List[Dict[str, Any]],
+                        folders: Optional[List[str]] = None,
+                        prerender: bool = True) -> Tuple[int, int]:
+    """
+    Write slide indexes, chunks and deck pages for all weeks (or just the
+    given folders), then refresh manifest.json
+
+    Args:
+        project_root: Path to project root directory
+        weeks: Week list from scan_weeks_directory
+        folders: Restrict the rebuild to these week folders
+        prerender: Also pre-render chunks to HTML (cached in .cache/render)
+
+    Returns:
+        Tuple of (files written, chunks rendered)
+    """
+    slides_dir = project_root / 'slides'
+    out_dir = project_root / 'src' / 'generated'
+    cache_dir = project_root / '.cache' / 'render' if prerender else None
+    written = 0
+    rendered = 0
+
+    for week in weeks:
+        if not week['has_slides'] or (folders is not None and week['folder'] not in folders):
+            continue
+        with profiler.span(f"index {week['folder']}", 'week'):
+            week_written, week_rendered = write_week_index(week, slides_dir / week['folder'], out_dir, cache_dir)
+            week_written += write_week_page(week, slides_dir / week['folder'], out_dir)
+        written += week_written
+        rendered += week_rendered
+
+    # Remove output of weeks that no longer exist
+    if folders is None and out_dir.exists():
+        live = {week['folder'] for week in weeks if week['has_slides']}
+        for stale in out_dir.iterdir():
+            if stale.is_dir() and stale.name.startswith('week') and stale.name not in live:
+                for child in stale.iterdir():
+                    child.unlink()
+                os.rmdir(stale)
+        prune_shards(out_dir / SEARCH_DIR, live)
+    # Fences only drop out after a full build, when every chunk has been seen
+    save_fence_cache(prune=folders is None)
+
+    written += write_text(out_dir / MANIFEST_NAME,
+                          json.dumps(build_manifest(out_dir, weeks), ensure_ascii=False, indent=1) + '\n')
+    return written, rendered
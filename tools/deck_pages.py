@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Static per-week deck pages
+Writes src/generated/<week>/slides.<hash>.html, a standalone Reveal page
+that loads only that week's slides.json parts and the plugins its content
+needs, so opening a lecture skips the index page and its main-page JS.
+The parts are copied next to it as part-<name>.<hash>.md; manifest.json
+points at the current page.
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+from string import Template
+from typing import List, Dict, Any, Optional, Tuple
+
+from output_writer import fingerprinted, write_text
+
+# Name the preview server serves the page under; the built page is
+# fingerprinted as slides.<hash>.html
+PAGE_NAME = 'slides.html'
+PAGE_STEM = 'slides'
+PART_PREFIX = 'part-'
+
+REVEAL_CDN = 'https://cdn.jsdelivr.net/npm/reveal.js@5.0.4'
+PLUGINS_CDN = 'https://cdn.jsdelivr.net/npm/reveal.js-plugins@latest'
+
+# Plugin name → (scripts, stylesheets, Reveal.initialize() plugin expression)
+PLUGINS: Dict[str, Tuple[List[str], List[str], str]] = {
+    'markdown': ([f'{REVEAL_CDN}/plugin/markdown/markdown.js'], [], 'RevealMarkdown'),
+    'highlight': ([f'{REVEAL_CDN}/plugin/highlight/highlight.js'],
+                  [f'{REVEAL_CDN}/plugin/highlight/monokai.css'], 'RevealHighlight'),
+    'notes': ([f'{REVEAL_CDN}/plugin/notes/notes.js'], [], 'RevealNotes'),
+    'zoom': ([f'{REVEAL_CDN}/plugin/zoom/zoom.js'], [], 'RevealZoom'),
+    'math': ([f'{REVEAL_CDN}/plugin/math/math.js'], [], 'RevealMath.KaTeX'),
+    'chalkboard': ([f'{PLUGINS_CDN}/chalkboard/plugin.js'],
+                   [f'{PLUGINS_CDN}/chalkboard/style.css'], 'RevealChalkboard'),
+    'mermaid': (['https://cdn.jsdelivr.net/npm/mermaid@11.12.0/dist/mermaid.min.js',
+                 'https://cdn.jsdelivr.net/npm/reveal.js-mermaid-plugin@11.6.0/plugin/mermaid/mermaid.js'],
+                [], 'RevealMermaid'),
+}
+
+# Every page gets these; the rest are added when a part needs them
+BASE_PLUGINS = ('markdown', 'notes', 'zoom', 'chalkboard')
+
+PLUGIN_PATTERNS = {
+    'highlight': re.compile(r'^\s*(```|~~~)\s*\S', re.MULTILINE),
+    'mermaid': re.compile(r'^\s*(```|~~~)\s*mermaid\b', re.MULTILINE),
+    'math': re.compile(r'\$\$|\\\(|\\\['),
+}
+
+SECTION_TEMPLATE = Template('''            <section data-markdown="$src"
+                     data-separator="^\\n---\\n$$"
+                     data-separator-vertical="^\\n--\\n$$"
+                     data-separator-notes="^Note:"
+                     data-charset="utf-8">
+            </section>''')
+
+PAGE_TEMPLATE = Template('''<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="deck-page-key" content="$key">
+
+    <title>Week $week: $title - HCI/HMI Lecture</title>
+
+    <link rel="stylesheet" href="$reveal/dist/reveal.css">
+    <link rel="stylesheet" href="$reveal/dist/theme/white.css" id="theme">
+$stylesheets
+    <link rel="stylesheet" href="/themes/custom.css">
+</head>
+
+<body class="theme-custom">
+    <a href="/" title="메인으로 (Home)"
+       style="position: fixed; bottom: 20px; left: 20px; z-index: 1000; padding: 12px 24px;
+              background: rgba(42, 85, 153, 0.9); color: white; text-decoration: none;
+              border-radius: 30px; font-size: 16px; font-weight: 600; opacity: 0.3;">← 메인으로</a>
+
+    <div class="reveal">
+        <div class="slides">
+$sections
+        </div>
+    </div>
+
+    <script src="$reveal/dist/reveal.js"></script>
+$scripts
+
+    <script>
+        Reveal.initialize({
+            hash: true,
+            center: false,
+            slideNumber: 'c/t',
+            transition: 'slide',
+            width: 1400,
+            height: 900,
+            margin: 0.02,
+            markdown: {
+                smartypants: true,
+                breaks: true
+            },
+            chalkboard: {
+                storage: 'deck-chalkboard-$folder',
+                theme: 'whiteboard'
+            },
+            keyboard: {
+                // Home key - back to the lecture list
+                36: function() {
+                    window.location.href = '/';
+                }
+            },
+            plugins: [$plugins]
+        });
+    </script>
+</body>
+</html>
+''')
+
+
+def template_hash() -> str:
+    """Hash of everything in this module that shapes a page besides the week's data"""
+    source = PAGE_TEMPLATE.template + SECTION_TEMPLATE.template + json.dumps([PLUGINS, BASE_PLUGINS])
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def deck_part_names(week_path: Path) -> List[str]:
+    """
+    Part files the page loads: the slides.json list, or slides.md alone
+
+    Returns:
+        File names relative to the week folder
+    """
+    try:
+        with open(week_path / 'slides.json', 'r', encoding='utf-8') as f:
+            names = json.load(f).get('files', [])
+    except (OSError, ValueError, AttributeError):
+        names = []
+    names = [name for name in names if isinstance(name, str) and (week_path / name).is_file()]
+    return names or ['slides.md']
+
+
+def page_key(week: Dict[str, Any], part_names: List[str], plugins: List[str]) -> str:
+    """Cache key for a week's page: template, title, parts list and plugin set"""
+    digest = hashlib.sha256(template_hash().encode('utf-8'))
+    digest.update(json.dumps([week['number'], week['title'], part_names, plugins]).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def detect_plugins(texts: List[str]) -> List[str]:
+    """Plugins needed by the given part contents, in PLUGINS order"""
+    needed = set(BASE_PLUGINS)
+    for name, pattern in PLUGIN_PATTERNS.items():
+        if any(pattern.search(text) for text in texts):
+            needed.add(name)
+    return [name for name in PLUGINS if name in needed]
+
+
+def render_page(week: Dict[str, Any], folder: str, part_names: List[str],
+                plugins: List[str], key: str, part_urls: Optional[List[str]] = None) -> str:
+    """
+    Render one week's deck page
+
+    Args:
+        week: Week dictionary from extract_week_info
+        folder: Week folder name under slides/
+        part_names: Part files in load order
+        plugins: Plugin names from detect_plugins
+        key: Value of the deck-page-key meta tag
+        part_urls: URL of each part; defaults to the files under /slides/<folder>/
+
+    Returns:
+        Complete HTML page
+    """
+    if part_urls is None:
+        part_urls = [f'/slides/{folder}/{name}' for name in part_names]
+    sections = '\n'.join(SECTION_TEMPLATE.substitute(src=url) for url in part_urls)
+    scripts = [src for name in plugins for src in PLUGINS[name][0]]
+    stylesheets = [href for name in plugins for href in PLUGINS[name][1]]
+    return PAGE_TEMPLATE.substitute(
+        key=key,
+        week=week['number'],
+        title=week['title'].replace('&', '&amp;').replace('<', '&lt;'),
+        folder=folder,
+        reveal=REVEAL_CDN,
+        stylesheets='\n'.join(f'    <link rel="stylesheet" href="{href}">' for href in stylesheets),
+        sections=sections,
+        scripts='\n'.join(f'    <script src="{src}"></script>' for src in scripts),
+        plugins=', '.join(PLUGINS[name][2] for name in plugins),
+    )
+
+
+def find_week_page(week_out: Path) -> Optional[str]:
+    """Name of the fingerprinted deck page in a week's output folder"""
+    names = sorted(path.name for path in week_out.glob(f'{PAGE_STEM}.*.html'))
+    return names[-1] if names else None
+
+
+def write_week_page(week: Dict[str, Any], week_path: Path, out_dir: Path) -> int:
+    """
+    Write out_dir/<folder>/slides.<hash>.html and the part copies it loads
+
+    Every file name carries a hash of its content, so the page and its
+    parts can be served as immutable. Editing a part writes a new copy
+    and a new page pointing at it; the superseded files are removed.
+
+    Returns:
+        Number of files written
+    """
+    folder = week_path.name
+    week_out = out_dir / folder
+    part_names = deck_part_names(week_path)
+    texts = [(week_path / name).read_text(encoding='utf-8') for name in part_names]
+    plugins = detect_plugins(texts)
+    copies = [fingerprinted(PART_PREFIX + Path(name).stem, '.md', text) for name, text in zip(part_names, texts)]
+    html = render_page(week, folder, part_names, plugins, page_key(week, part_names, plugins),
+                       [f'/generated/{folder}/{copy}' for copy in copies])
+    page_name = fingerprinted(PAGE_STEM, '.html', html)
+
+    written = 0
+    for copy, text in zip(copies, texts):
+        written += write_text(week_out / copy, text)
+    written += write_text(week_out / page_name, html)
+
+    # Drop pages and part copies superseded by this build (and the old unhashed page)
+    expected = set(copies) | {page_name}
+    for pattern in (f'{PART_PREFIX}*.md', f'{PAGE_STEM}.*.html', PAGE_NAME):
+        for stale in week_out.glob(pattern):
+            if stale.name not in expected:
+                stale.unlink()
+    return written
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Build-time markdown to Reveal <section> HTML renderer
+Mirrors what the Reveal markdown plugin (marked with gfm, breaks and
+smartypants) produces for the subset of markdown used in the decks, so
+the viewer can insert ready-made slides instead of parsing markdown
+"""
+
+import re
+import html
+import json
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from code_highlight import HIGHLIGHTER, highlight_code, collect_fence_keys, keep_fences, load_fence_cache
+from fences import closes_fence, fence_open
+from output_writer import write_json
+
+# Bump whenever the generated HTML changes so cached renders are dropped
+RENDER_VERSION = 6
+
+LINE_NUMBERS = re.compile(r'^[{\[]\s*(?:(\d+)\s*:)?\s*([\d\s,|-]*?)\s*[}\]]$')
+HEADING = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+SETEXT = re.compile(r'^ {0,3}(=+|-+)[ \t]*$')
+HR = re.compile(r'^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+BLOCKQUOTE = re.compile(r'^ {0,3}> ?(.*)$')
+LIST_ITEM = re.compile(r'^( *)([-*+]|\d{1,9}[.)])(?:( +)(.*)|)$')
+TABLE_DELIM = re.compile(r'^ *\|? *:?-+:? *(\| *:?-+:? *)*\|? *$')
+INDENTED_CODE = re.compile(r'^(?: {4}|\t)(.*)$')
+SLIDE_ATTRIBUTES = re.compile(r'<!--\s*\.slide:\s*(.*?)\s*-->')
+
+HTML_RAW_START = re.compile(r'^ {0,3}<(script|pre|style|textarea)(\s|>|$)', re.IGNORECASE)
+HTML_COMMENT_START = re.compile(r'^ {0,3}<!--')
+HTML_BLOCK_START = re.compile(r'^ {0,3}</?([A-Za-z][\w-]*)(\s|/?>|$)')
+HTML_TAG_LINE = re.compile(r'^ {0,3}</?[A-Za-z][\w-]*(\s[^<>]*)?/?>\s*$')
+HTML_BLOCK_TAGS = {
+    'address', 'article', 'aside', 'base', 'blockquote', 'body', 'caption', 'center',
+    'col', 'colgroup', 'dd', 'details', 'dialog', 'dir', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'frame', 'frameset', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'head', 'header', 'hr', 'html', 'iframe', 'legend', 'li', 'link',
+    'main', 'menu', 'menuitem', 'nav', 'noframes', 'ol', 'optgroup', 'option', 'p',
+    'param', 'section', 'source', 'summary', 'table', 'tbody', 'td', 'tfoot', 'th',
+    'thead', 'title', 'tr', 'track', 'ul'
+}
+
+CODE_SPAN = re.compile(r'(`+)(.+?)(?<!`)\1(?!`)', re.DOTALL)
+ESCAPED_CHAR = re.compile(r'\\([\\`*_{}\[\]()#+\-.!|~<>"\'])')
+INLINE_HTML = re.compile(r'<!--.*?-->|</?[A-Za-z][\w-]*(?:\s+[^<>]*?)?/?>', re.DOTALL)
+ENTITY = re.compile(r'&(?:[A-Za-z][A-Za-z0-9]*|#\d+|#[xX][0-9A-Fa-f]+);')
+IMAGE = re.compile(r'!\[([^\]]*)\]\(\s*<?([^)\s>]*)>?(?:\s+"([^"]*)")?\s*\)')
+LINK = re.compile(r'\[([^\]]+)\]\(\s*<?([^)\s>]*)>?(?:\s+"([^"]*)")?\s*\)')
+AUTOLINK = re.compile(r'<((?:https?|ftp|mailto):[^\s<>]+)>')
+BARE_URL = re.compile(r'(?<![\w/"=])(https?://[^\s<\x00]*[^\s<\x00.,:;"\')\]!?])')
+STRONG = re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*|__(?=\S)(.+?)(?<=\S)__(?!\w)', re.DOTALL)
+EMPHASIS = re.compile(r'\*(?=[^\s*])(.+?)(?<=[^\s*])\*|(?<!\w)_(?=[^\s_])(.+?)(?<=[^\s_])_(?!\w)', re.DOTALL)
+STRIKE = re.compile(r'~~(?=\S)(.+?)(?<=\S)~~', re.DOTALL)
+PLACEHOLDER = re.compile(r'\x00(\d+)\x00')
+
+
+def escape_html(text: str) -> str:
+    """Escape text for HTML element content"""
+    return html.escape(text, quote=False)
+
+
+def escape_attr(text: str) -> str:
+    """Escape text for a double-quoted HTML attribute"""
+    return html.escape(text, quote=True)
+
+
+def smartypants(text: str) -> str:
+    """Typographic punctuation, ported from marked's smartypants option"""
+    text = text.replace('---', '\u2014').replace('--', '\u2013')
+    text = re.sub(r'(^|[-\u2014/(\[{"\s])\'', '\\1\u2018', text)
+    text = text.replace("'", '\u2019')
+    text = re.sub(r'(^|[-\u2014/(\[{\u2018\s])"', '\\1\u201c', text)
+    text = text.replace('"', '\u201d')
+    return text.replace('...', '\u2026')
+
+
+def render_inline(text: str) -> str:
+    """
+    Render inline markdown (code spans, links, images, emphasis, raw HTML)
+
+    Args:
+        text: Markdown text of a paragraph, heading or table cell
+
+    Returns:
+        HTML fragment
+    """
+    stash: List[str] = []
+
+    def keep(fragment: str) -> str:
+        stash.append(fragment)
+        return f'\x00{len(stash) - 1}\x00'
+
+    def code_span(match):
+        code = match.group(2).replace('\n', ' ')
+        if code.startswith(' ') and code.endswith(' ') and code.strip():
+            code = code[1:-1]
+        return keep(f'<code>{escape_html(code)}</code>')
+
+    def image(match):
+        title = f' title="{escape_attr(match.group(3))}"' if match.group(3) else ''
+        return keep(f'<img src="{escape_attr(match.group(2))}" alt="{escape_attr(match.group(1))}"{title}>')
+
+    def link(match):
+        title = f' title="{escape_attr(match.group(3))}"' if match.group(3) else ''
+        return keep(f'<a href="{escape_attr(match.group(2))}"{title}>') + match.group(1) + keep('</a>')
+
+    text = CODE_SPAN.sub(code_span, text)
+    text = ESCAPED_CHAR.sub(lambda m: keep(escape_html(m.group(1))), text)
+    text = INLINE_HTML.sub(lambda m: keep(m.group(0)), text)
+    text = ENTITY.sub(lambda m: keep(m.group(0)), text)
+    text = IMAGE.sub(image, text)
+    text = LINK.sub(link, text)
+    text = AUTOLINK.sub(lambda m: keep(f'<a href="{escape_attr(m.group(1))}">{escape_html(m.group(1))}</a>'), text)
+    text = BARE_URL.sub(lambda m: keep(f'<a href="{escape_attr(m.group(1))}">{escape_html(m.group(1))}</a>'), text)
+
+    text = escape_html(smartypants(text))
+    text = STRONG.sub(lambda m: f'<strong>{m.group(1) or m.group(2)}</strong>', text)
+    text = EMPHASIS.sub(lambda m: f'<em>{m.group(1) or m.group(2)}</em>', text)
+    text = STRIKE.sub(r'<del>\1</del>', text)
+
+    # breaks: true turns every soft line break into <br>
+    text = re.sub(r'(?: {2,}|\\)?\n', '<br>', text)
+
+    while PLACEHOLDER.search(text):
+        text = PLACEHOLDER.sub(lambda m: stash[int(m.group(1))], text)
+    return text
+
+
+def parse_fence_info(info: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Split a fence info string into language and line-number spec
+
+    Accepts both the `{1-N}` form emitted by scripts/add_line_numbers.py
+    and the Reveal `[offset: 1,4-8]` form.
+
+    Returns:
+        Tuple of (language, data-line-numbers value, data-ln-start-from value)
+    """
+    lang, _, rest = info.partition(' ')
+    rest = rest.strip()
+    if not rest and lang[-1:] in ('}', ']'):
+        brace = max(lang.find('{'), lang.find('['))
+        if brace > 0:
+            lang, rest = lang[:brace], lang[brace:]
+    match = LINE_NUMBERS.match(rest) if rest else None
+    if not match:
+        return lang, None, None
+    return lang, match.group(2).replace(' ', ''), match.group(1)
+
+
+def render_code_block(code: str, lang: str = '', line_numbers: Optional[str] = None,
+                      start_from: Optional[str] = None) -> str:
+    """
+    Render a code block the way the Reveal markdown plugin does
+
+    Fences of a language Pygments knows come out already highlighted,
+    marked data-highlighted (the viewer skips re-tokenizing them) and
+    data-noescape (the Highlight plugin would otherwise escape the spans).
+    """
+    attributes = ''
+    if line_numbers is not None:
+        attributes += f' data-line-numbers="{escape_attr(line_numbers)}"'
+    if start_from:
+        attributes += f' data-ln-start-from="{escape_attr(start_from)}"'
+    highlighted = highlight_code(code, lang) if lang else None
+    if highlighted is None:
+        return f'<pre><code{attributes} class="{escape_attr(lang)}">{escape_html(code)}</code></pre>'
+    return (f'<pre><code{attributes} class="{escape_attr(lang)} hljs" data-highlighted="yes" data-noescape>'
+            f'{highlighted}</code></pre>')
+
+
+def starts_block(line: str) -> bool:
+    """Check whether a line interrupts a paragraph"""
+    return bool(
+        fence_open(line, 3) or HEADING.match(line) or HR.match(line)
+        or BLOCKQUOTE.match(line) or LIST_ITEM.match(line)
+        or HTML_RAW_START.match(line) or HTML_COMMENT_START.match(line)
+        or (HTML_BLOCK_START.match(line)
+            and HTML_BLOCK_START.match(line).group(1).lower() in HTML_BLOCK_TAGS)
+    )
+
+
+def split_table_row(line: str) -> List[str]:
+    """Split a table row into cell texts, honoring escaped pipes"""
+    row = line.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', row)]
+
+
+class BlockRenderer:
+    """
+    Line-based block parser for one slide
+
+    Handles fences (with line-number specs), ATX/setext headings, rules,
+    raw HTML blocks (markdown resumes after a blank line, as in marked),
+    blockquotes, nested lists, GFM tables, indented code and paragraphs.
+    """
+
+    def __init__(self, lines: List[str], tight: bool = False):
+        self.lines = lines
+        self.tight = tight
+        self.pos = 0
+        self.out: List[str] = []
+
+    def render(self) -> str:
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            if not line.strip():
+                self.pos += 1
+            elif fence_open(line, 3):
+                self.fence(fence_open(line, 3))
+            elif HEADING.match(line):
+                match = HEADING.match(line)
+                level = len(match.group(1))
+                self.out.append(f'<h{level}>{render_inline(match.group(2) or "")}</h{level}>')
+                self.pos += 1
+            elif HR.match(line):
+                self.out.append('<hr>')
+                self.pos += 1
+            elif HTML_RAW_START.match(line) or HTML_COMMENT_START.match(line) or HTML_TAG_LINE.match(line) \
+                    or (HTML_BLOCK_START.match(line)
+                        and HTML_BLOCK_START.match(line).group(1).lower() in HTML_BLOCK_TAGS):
+                self.html_block(line)
+            elif BLOCKQUOTE.match(line):
+                self.blockquote()
+            elif LIST_ITEM.match(line):
+                self.list_block()
+            elif ('|' in line and self.pos + 1 < len(self.lines)
+                  and TABLE_DELIM.match(self.lines[self.pos + 1])
+                  and '-' in self.lines[self.pos + 1]):
+                self.table()
+            elif INDENTED_CODE.match(line) and not self.tight:
+                self.indented_code()
+            else:
+                self.paragraph()
+        return '\n'.join(self.out)
+
+    def fence(self, match):
+        indent, info = len(match.group(1)), (match.group(3) + ' ' + match.group(4)).strip()
+        lang, line_numbers, start_from = parse_fence_info(info)
+        body = []
+        self.pos += 1
+        while self.pos < len(self.lines) and not closes_fence(self.lines[self.pos], match):
+            line = self.lines[self.pos]
+            # Content is dedented by the opening fence's indentation
+            strip = min(indent, len(line) - len(line.lstrip(' ')))
+            body.append(line[strip:])
+            self.pos += 1
+        if self.pos >= len(self.lines) and body and not body[-1]:
+            # An unclosed fence runs to the end of the slide, minus its final newline
+            body.pop()
+        self.pos += 1
+        self.out.append(render_code_block('\n'.join(body), lang, line_numbers, start_from))
+
+    def html_block(self, line: str):
+        block = []
+        raw = HTML_RAW_START.match(line)
+        if raw or HTML_COMMENT_START.match(line):
+            end = re.compile(r'</' + raw.group(1) + '>', re.IGNORECASE) if raw else re.compile(r'-->')
+            while self.pos < len(self.lines):
+                block.append(self.lines[self.pos])
+                self.pos += 1
+                if end.search(block[-1]):
+                    break
+        else:
+            while self.pos < len(self.lines) and self.lines[self.pos].strip():
+                block.append(self.lines[self.pos])
+                self.pos += 1
+        self.out.append('\n'.join(block))
+
+    def blockquote(self):
+        inner = []
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            match = BLOCKQUOTE.match(line)
+            if match:
+                inner.append(match.group(1))
+            elif line.strip() and inner and inner[-1].strip() and not starts_block(line):
+                inner.append(line)  # lazy continuation
+            else:
+                break
+            self.pos += 1
+        self.out.append('<blockquote>\n' + BlockRenderer(inner).render() + '\n</blockquote>')
+
+    def list_block(self):
+        first = LIST_ITEM.match(self.lines[self.pos])
+        base_indent = len(first.group(1))
+        ordered = first.group(2)[0].isdigit()
+        items: List[List[str]] = []
+        loose = False
+
+        while self.pos < len(self.lines):
+            match = LIST_ITEM.match(self.lines[self.pos])
+            if (not match or len(match.group(1)) > base_indent + 1
+                    or match.group(2)[0].isdigit() != ordered):
+                break
+            content_offset = len(match.group(1)) + len(match.group(2)) + len(match.group(3) or ' ')
+            item = [match.group(4) or '']
+            self.pos += 1
+            blank = False
+            while self.pos < len(self.lines):
+                line = self.lines[self.pos]
+                if not line.strip():
+                    blank = True
+                    item.append('')
+                    self.pos += 1
+                    continue
+                indent = len(line) - len(line.lstrip(' '))
+                if indent > base_indent:
+                    if blank and not LIST_ITEM.match(line):
+                        loose = True
+                    item.append(line[min(indent, content_offset):])
+                    blank = False
+                    self.pos += 1
+                    continue
+                if blank or LIST_ITEM.match(line) or starts_block(line):
+                    break
+                item.append(line.strip())  # lazy continuation
+                self.pos += 1
+            while item and not item[-1].strip():
+                item.pop()
+            items.append(item)
+
+            # A blank line between items makes the whole list loose
+            if blank and self.pos < len(self.lines):
+                next_item = LIST_ITEM.match(self.lines[self.pos])
+                if (next_item and len(next_item.group(1)) <= base_indent + 1
+                        and next_item.group(2)[0].isdigit() == ordered):
+                    loose = True
+                else:
+                    break
+
+        start = int(first.group(2)[:-1]) if ordered else 1
+        tag = 'ol' if ordered else 'ul'
+        opening = f'<ol start="{start}">' if ordered and start != 1 else f'<{tag}>'
+        rendered = ['<li>' + BlockRenderer(item, tight=not loose).render() + '</li>' for item in items]
+        self.out.append(opening + '\n' + '\n'.join(rendered) + f'\n</{tag}>')
+
+    def table(self):
+        header = split_table_row(self.lines[self.pos])
+        aligns = []
+        for cell in split_table_row(self.lines[self.pos + 1]):
+            if cell.startswith(':') and cell.endswith(':'):
+                aligns.append(' align="center"')
+            elif cell.endswith(':'):
+                aligns.append(' align="right"')
+            elif cell.startswith(':'):
+                aligns.append(' align="left"')
+            else:
+                aligns.append('')
+        self.pos += 2
+
+        def row_html(cells, tag):
+            cells = (cells + [''] * len(header))[:len(header)]
+            return '<tr>' + ''.join(
+                f'<{tag}{aligns[i] if i < len(aligns) else ""}>{render_inline(cell)}</{tag}>'
+                for i, cell in enumerate(cells)) + '</tr>'
+
+        body = []
+        while self.pos < len(self.lines) and self.lines[self.pos].strip() and '|' in self.lines[self.pos]:
+            body.append(row_html(split_table_row(self.lines[self.pos]), 'td'))
+            self.pos += 1
+        tbody = f'<tbody>{"".join(body)}</tbody>' if body else ''
+        self.out.append(f'<table><thead>{row_html(header, "th")}</thead>{tbody}</table>')
+
+    def indented_code(self):
+        body = []
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            match = INDENTED_CODE.match(line)
+            if match:
+                body.append(match.group(1))
+            elif not line.strip():
+                body.append('')
+            else:
+                break
+            self.pos += 1
+        while body and not body[-1].strip():
+            body.pop()
+        self.out.append(render_code_block('\n'.join(body)))
+
+    def paragraph(self):
+        text = []
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            if not line.strip():
+                break
+            setext = SETEXT.match(line)
+            if text and setext:
+                level = 1 if setext.group(1)[0] == '=' else 2
+                self.out.append(f'<h{level}>{render_inline(chr(10).join(text))}</h{level}>')
+                self.pos += 1
+                return
+            if text and starts_block(line):
+                break
+            text.append(line.strip())
+            self.pos += 1
+        content = render_inline('\n'.join(text))
+        self.out.append(content if self.tight else f'<p>{content}</p>')
+
+
+def render_markdown(markdown: str) -> str:
+    """Render one slide's markdown to HTML"""
+    return BlockRenderer(markdown.split('\n')).render()
+
+
+def render_slide(markdown: str, extra_attributes: str = '') -> str:
+    """
+    Render one slide into a Reveal <section>
+
+    Honors the markdown plugin's <!-- .slide: ... --> attribute comments.
+
+    Args:
+        markdown: Slide body between separators
+        extra_attributes: Attributes added to the section tag
+
+    Returns:
+        Section HTML
+    """
+    attributes = extra_attributes
+    match = SLIDE_ATTRIBUTES.search(markdown)
+    if match:
+        attributes += ' ' + match.group(1)
+        markdown = markdown[:match.start()] + markdown[match.end():]
+    return f'<section{attributes}>\n{render_markdown(markdown)}\n</section>'
+
+
+def render_chunk(markdown: str, slides: List[Dict[str, Any]], chunk_num: int) -> str:
+    """
+    Render one deck chunk into Reveal sections
+
+    Args:
+        markdown: Chunk text as written to chunk-NN.md
+        slides: Index entries of the chunk's slides (offset/length in bytes,
+            layout from deck_index.slide_layout)
+        chunk_num: Chunk number, stored as data-chunk on every section
+
+    Returns:
+        HTML for the chunk's top-level sections
+    """
+    data = markdown.encode('utf-8')
+    sections = []
+    stack: List[str] = []
+
+    def close_stack():
+        if len(stack) == 1:
+            sections.append(stack[0])
+        elif stack:
+            sections.append(f'<section data-chunk="{chunk_num}">\n' + '\n'.join(stack) + '\n</section>')
+        stack.clear()
+
+    for slide in slides:
+        body = data[slide['offset']:slide['offset'] + slide['length']].decode('utf-8')
+        if slide['v'] == 0:
+            close_stack()
+        layout = f' data-layout="{slide["layout"]}"' if slide.get('layout') else ''
+        stack.append(render_slide(body, f' data-chunk="{chunk_num}"{layout}'))
+    close_stack()
+    return '\n'.join(sections) + '\n'
+
+
+def load_render_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load a week's render cache (chunk hash → {'html', 'fences'})"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == RENDER_VERSION and cache.get('highlighter') == HIGHLIGHTER:
+            return cache['chunks']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def render_week_chunks(folder: str, index: Dict[str, Any], texts: List[str],
+                       cache_dir: Path) -> Tuple[List[str], int]:
+    """
+    Render every chunk of a week, reusing cached HTML by content hash
+
+    Code fences of re-rendered chunks go through the shared fence cache
+    next to the per-week caches, so unchanged fences are not re-tokenized.
+    Each cached chunk records its fence keys, so a build that only reuses
+    chunks still tells the fence cache which fences are in use. The caller
+    saves the fence cache once all weeks are done.
+
+    Args:
+        folder: Week folder name, used as the cache file name
+        index: Slide index from deck_index.build_week_index
+        texts: Chunk markdown texts
+        cache_dir: Directory holding per-week render caches
+
+    Returns:
+        Tuple of (HTML per chunk, number of chunks actually rendered)
+    """
+    cache_path = cache_dir / f'{folder}.json'
+    cached = load_render_cache(cache_path)
+    load_fence_cache(cache_dir)
+    fresh = {}
+    rendered = 0
+    htmls = []
+
+    for chunk_num, text in enumerate(texts):
+        key = hashlib.sha256(f'{chunk_num}\0{text}'.encode('utf-8')).hexdigest()
+        entry = cached.get(key)
+        if entry is None:
+            slides = [s for s in index['slides'] if s['chunk'] == chunk_num]
+            collect_fence_keys()
+            entry = {'html': render_chunk(text, slides, chunk_num), 'fences': collect_fence_keys()}
+            rendered += 1
+        else:
+            keep_fences(entry['fences'])
+        fresh[key] = entry
+        htmls.append(entry['html'])
+
+    if fresh != cached:
+        write_json(cache_path, {'version': RENDER_VERSION, 'highlighter': HIGHLIGHTER, 'chunks': fresh},
+                   ensure_ascii=False)
+    return htmls, rendered
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Code fence scanning shared by every tool that reads slide markdown
+A fence opens with three or more backticks or tildes and closes with a
+run of the same character at least as long, with nothing after it, as
+marked does. Openers may be indented (fences inside list items), and a
+closer may sit up to three columns deeper than its opener.
+"""
+
+import re
+from typing import List, Optional, Iterator, Tuple
+
+FENCE_OPEN = re.compile(r'^(\s*)(`{3,}|~{3,})\s*([^\s`{\[]*)\s*(.*?)\s*$')
+FENCE_CLOSE = re.compile(r'^(\s*)(`{3,}|~{3,})\s*$')
+
+
+def fence_open(line: str, max_indent: Optional[int] = None) -> Optional[re.Match]:
+    """
+    Match a fence opening line
+
+    Args:
+        line: Line to check
+        max_indent: Most leading spaces allowed, or None for any indent
+
+    Returns:
+        Match with groups indent, marker, language and the rest of the
+        info string, or None if the line does not open a fence
+    """
+    match = FENCE_OPEN.match(line)
+    if not match:
+        return None
+    if max_indent is not None and len(match.group(1)) > max_indent:
+        return None
+    # A backtick fence's info string cannot hold backticks (```inline``` is code span)
+    if match.group(2)[0] == '`' and '`' in match.group(4):
+        return None
+    return match
+
+
+def closes_fence(line: str, opener: re.Match) -> bool:
+    """Check whether line closes the fence opened by opener"""
+    match = FENCE_CLOSE.match(line)
+    marker = opener.group(2)
+    return bool(match) and match.group(2)[0] == marker[0] and len(match.group(2)) >= len(marker) \
+        and len(match.group(1)) <= len(opener.group(1)) + 3
+
+
+def fence_close_index(lines: List[str], start: int, end: int) -> int:
+    """
+    Find the closing line of the fence opened at lines[start]
+
+    Returns:
+        Index of the closing fence line, or -1 if the fence runs to end
+    """
+    opener = fence_open(lines[start])
+    for i in range(start + 1, end):
+        if closes_fence(lines[i], opener):
+            return i
+    return -1
+
+
+def iter_fences(lines: List[str], start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Find the fences of lines[start:end]
+
+    Yields:
+        (opening index, closing index) pairs; an unclosed fence runs to
+        the end and has end as its closing index
+    """
+    end = len(lines) if end is None else end
+    i = start
+    while i < end:
+        if fence_open(lines[i]):
+            close = fence_close_index(lines, i, end)
+            yield i, close if close >= 0 else end
+            i = close + 1 if close >= 0 else end
+        else:
+            i += 1
+
+
+def line_roles(lines: List[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Classify each line as 'text', 'fence' (an opening or closing line) or 'code'
+
+    Yields:
+        (line, role) pairs in order
+    """
+    i = 0
+    for open_index, close_index in iter_fences(lines):
+        for line in lines[i:open_index]:
+            yield line, 'text'
+        yield lines[open_index], 'fence'
+        for line in lines[open_index + 1:close_index]:
+            yield line, 'code'
+        if close_index < len(lines):
+            yield lines[close_index], 'fence'
+        i = close_index + 1
+    for line in lines[i:]:
+        yield line, 'text'
+
+
+def open_fence_at_end(text: str, opener: Optional[re.Match] = None) -> Optional[re.Match]:
+    """
+    Find the fence that is still open at the end of text
+
+    Args:
+        text: Markdown to scan
+        opener: Fence already open where text starts, if any
+
+    Returns:
+        Opening match of the unclosed fence, or None
+    """
+    for line in text.split('\n'):
+        if opener is None:
+            opener = fence_open(line)
+        elif closes_fence(line, opener):
+            opener = None
+    return opener
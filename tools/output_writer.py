@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Shared output layer for generators and slide transforms
+
+Writes are skipped when the file already holds the same bytes, so the dev
+server does not reload every open tab for a no-op rebuild. Real writes go
+to a temporary file in the same directory that is then renamed over the
+target, so a half-written deck or index is never served.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+PathLike = Union[str, Path]
+
+# Per-process counters: files actually written vs. writes skipped as unchanged
+WRITE_STATS = {'written': 0, 'unchanged': 0}
+
+# Length of the content hash embedded in generated file names
+FINGERPRINT_LENGTH = 10
+
+
+def _target(path: PathLike) -> Path:
+    """Write through a symlinked file to its target instead of replacing the link"""
+    path = Path(path)
+    return path.resolve() if path.is_symlink() else path
+
+
+def _replace_with(path: Path, fill) -> None:
+    """Create a temp file next to path, let fill() populate it, then rename it over path"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            fill(f)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_bytes(path: PathLike, data: bytes) -> bool:
+    """
+    Atomically write data to path unless it already has exactly that content
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = _target(path)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            WRITE_STATS['unchanged'] += 1
+            return False
+    except FileNotFoundError:
+        pass
+
+    _replace_with(path, lambda f: f.write(data))
+    WRITE_STATS['written'] += 1
+    return True
+
+
+def write_text(path: PathLike, content: str, encoding: str = 'utf-8') -> bool:
+    """Text version of write_bytes"""
+    return write_bytes(path, content.encode(encoding))
+
+
+def write_json(path: PathLike, data: Any, **dump_kwargs) -> bool:
+    """Serialize data with json.dumps(**dump_kwargs) and write it if it changed"""
+    return write_text(path, json.dumps(data, **dump_kwargs))
+
+
+def copy_file(source: PathLike, dest: PathLike) -> None:
+    """
+    Atomically copy source to dest, keeping metadata like shutil.copy2
+
+    Callers decide beforehand whether the copy is needed (e.g. by hash),
+    so this always counts as a write.
+    """
+    dest = Path(dest)
+    _replace_with(dest, lambda f: _copy_contents(source, f))
+    shutil.copystat(source, dest)
+    WRITE_STATS['written'] += 1
+
+
+def _copy_contents(source: PathLike, f) -> None:
+    with open(source, 'rb') as src:
+        shutil.copyfileobj(src, f)
+
+
+def reset_write_stats() -> Dict[str, int]:
+    """Return the counters and start counting from zero"""
+    stats = dict(WRITE_STATS)
+    WRITE_STATS['written'] = 0
+    WRITE_STATS['unchanged'] = 0
+    return stats
+
+
+def format_write_stats(stats: Optional[Dict[str, int]] = None) -> str:
+    stats = stats if stats is not None else WRITE_STATS
+    return f"{stats['written']} file(s) written, {stats['unchanged']} unchanged write(s) avoided"
+
+
+def fingerprinted(stem: str, suffix: str, text: str) -> str:
+    """File name carrying a hash of its content, e.g. chunk-00.1a2b3c4d5e.md"""
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:FINGERPRINT_LENGTH]
+    return f'{stem}.{digest}{suffix}'
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Pure-Python preview server for `bootstrap.py serve`
+Serves src/ and the decks straight from slides/ through an in-memory cache
+validated by stat and content hash, so nothing is copied to src/ and no
+bundler runs. Week indexes, chunks, deck pages and search shards are built
+in memory on first request. slides/ is watched and reload events are pushed
+over Server-Sent Events only to the tabs viewing the changed week (the index
+page reloads when its HTML actually changed).
+"""
+
+import json
+import asyncio
+import hashlib
+import mimetypes
+from pathlib import Path
+from urllib.parse import unquote, urlsplit, parse_qs
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
+
+from watcher import create_watcher
+from deck_index import INDEX_STEM, MANIFEST_NAME, MANIFEST_VERSION, build_week_index
+from deck_pages import PAGE_NAME, deck_part_names, detect_plugins, page_key, render_page
+from search_index import SEARCH_DIR, build_week_shard
+from week_metadata import WEEK_PATTERN, scan_weeks_directory, extract_week_info
+
+EVENTS_PATH = '/__reload'
+# /generated/<week>/print/<part>.html: a deck page with just that part, for PDF export
+PRINT_DIR = 'print'
+# Keeps idle SSE connections (and proxies in between) alive
+HEARTBEAT_SECONDS = 15
+MAX_HEADER_BYTES = 64 * 1024
+
+CONTENT_TYPES = {
+    '.md': 'text/markdown; charset=utf-8',
+    '.html': 'text/html; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+    '.js': 'text/javascript; charset=utf-8',
+    '.mjs': 'text/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.svg': 'image/svg+xml',
+}
+
+STATUS_TEXT = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+# Appended to every served page with the week it shows ('' = take ?week= or index)
+RELOAD_SCRIPT = '''<script>
+(() => {
+    const week = '%s' || new URLSearchParams(location.search).get('week') || '';
+    const events = new EventSource('%s?week=' + encodeURIComponent(week));
+    events.addEventListener('reload', () => location.reload());
+})();
+</script>
+'''
+
+
+def normalize_week(value: str) -> str:
+    """Week number as used in week dictionaries ('7' → '07'); '' for the index"""
+    return value.zfill(2) if value.isdigit() else ''
+
+
+def inject_reload(html: str, week: str = '') -> str:
+    """Add the live-reload client before </body>"""
+    script = RELOAD_SCRIPT % (week, EVENTS_PATH)
+    position = html.rfind('</body>')
+    return html[:position] + script + html[position:] if position >= 0 else html + script
+
+
+def content_type(path: str) -> str:
+    suffix = Path(path).suffix.lower()
+    return CONTENT_TYPES.get(suffix) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+class PreviewServer:
+    """
+    In-memory preview of the site
+
+    Files are cached as (size, mtime_ns) → sha256 + bytes; a changed stat
+    re-reads the file, and the sha256 doubles as the ETag so browsers get
+    304s for content that did not really change. Generated week output is
+    cached per week under the ETags of its deck sources.
+    """
+
+    def __init__(self, project_root: Path, weeks: List[Dict[str, Any]],
+                 render_index: Callable[[List[Dict[str, Any]]], str]):
+        self.project_root = project_root
+        self.slides_dir = project_root / 'slides'
+        self.src_dir = project_root / 'src'
+        self.weeks = weeks
+        self.render_index = render_index
+        self.files: Dict[Path, Dict[str, Any]] = {}
+        self.decks: Dict[str, Dict[str, Any]] = {}
+        self.index_html = self._blob(inject_reload(render_index(weeks)), 'text/html; charset=utf-8')
+        self.clients: Set[Tuple[str, asyncio.Queue]] = set()
+
+    # -- cache ---------------------------------------------------------------
+
+    @staticmethod
+    def _blob(data, ctype: str) -> Dict[str, Any]:
+        body = data.encode('utf-8') if isinstance(data, str) else data
+        return {'body': body, 'etag': hashlib.sha256(body).hexdigest()[:20], 'type': ctype}
+
+    def read_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Cached file contents, re-read only when size or mtime changed"""
+        try:
+            st = path.stat()
+        except OSError:
+            self.files.pop(path, None)
+            return None
+        if not path.is_file():
+            return None
+        key = (st.st_size, st.st_mtime_ns)
+        entry = self.files.get(path)
+        if entry is None or entry['key'] != key:
+            entry = dict(self._blob(path.read_bytes(), content_type(path.name)), key=key)
+            self.files[path] = entry
+        return entry
+
+    def week_by_folder(self, folder: str) -> Optional[Dict[str, Any]]:
+        return next((week for week in self.weeks if week['folder'] == folder and week['has_slides']), None)
+
+    def deck(self, folder: str) -> Optional[Dict[str, Any]]:
+        """
+        Generated output of one week, rebuilt when a deck source's hash changed
+
+        Returns:
+            Dict with the slide index, chunk texts by file name and lazily
+            filled 'page'/'shard' blobs, or None for unknown weeks
+        """
+        week = self.week_by_folder(folder)
+        if week is None:
+            return None
+        week_path = self.slides_dir / folder
+        sources = ['slides.md', 'slides.json'] + deck_part_names(week_path)
+        etags = []
+        for name in sources:
+            entry = self.read_file(week_path / name)
+            etags.append(entry['etag'] if entry else None)
+        key = (week['title'], tuple(sources), tuple(etags))
+
+        deck = self.decks.get(folder)
+        if deck is None or deck['key'] != key:
+            index, texts = build_week_index(week, week_path)
+            index['format'] = 'markdown'
+            deck = {
+                'key': key,
+                'week': week,
+                'index': index,
+                'texts': texts,
+                'chunks': {chunk['file']: text for chunk, text in zip(index['chunks'], texts)},
+            }
+            self.decks[folder] = deck
+        return deck
+
+    def manifest(self) -> Dict[str, Any]:
+        """Same shape as deck_index.build_manifest, pointing at the lazy routes"""
+        entries = {}
+        for week in self.weeks:
+            folder = week['folder']
+            has_slides = week['has_slides']
+            entries[week['number']] = {
+                'folder': folder,
+                'title': week['title'],
+                'index': f'/generated/{folder}/{INDEX_STEM}.json' if has_slides else None,
+                'page': f'/generated/{folder}/{PAGE_NAME}' if has_slides else None,
+                'slides': f'/slides/{folder}/slides.md' if has_slides else None,
+                'search': f'/generated/{SEARCH_DIR}/{folder}.json' if has_slides else None
+            }
+        return {'version': MANIFEST_VERSION, 'weeks': entries}
+
+    def generated(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        """Resolve a /generated/ path from memory"""
+        if rel_path == MANIFEST_NAME:
+            return self._blob(json.dumps(self.manifest(), ensure_ascii=False), content_type(rel_path))
+
+        folder, _, name = rel_path.partition('/')
+        if folder == SEARCH_DIR:
+            deck = self.deck(name[:-len('.json')]) if name.endswith('.json') else None
+            if deck is None:
+                return None
+            if 'shard' not in deck:
+                shard = build_week_shard(deck['index'], deck['texts'])
+                deck['shard'] = self._blob(json.dumps(shard, ensure_ascii=False, separators=(',', ':')),
+                                           content_type(name))
+            return deck['shard']
+
+        deck = self.deck(folder)
+        if deck is None:
+            return None
+        if name == f'{INDEX_STEM}.json':
+            return self._blob(json.dumps(deck['index'], ensure_ascii=False), content_type(name))
+        if name == PAGE_NAME:
+            if 'page' not in deck:
+                week_path = self.slides_dir / folder
+                part_names = deck_part_names(week_path)
+                plugins = detect_plugins([(week_path / part).read_text(encoding='utf-8') for part in part_names])
+                html = render_page(deck['week'], folder, part_names, plugins,
+                                   page_key(deck['week'], part_names, plugins))
+                deck['page'] = self._blob(inject_reload(html, deck['week']['number']), content_type(name))
+            return deck['page']
+        if name.startswith(f'{PRINT_DIR}/') and name.endswith('.html'):
+            part = name[len(PRINT_DIR) + 1:-len('.html')] + '.md'
+            week_path = self.slides_dir / folder
+            if part not in deck_part_names(week_path):
+                return None
+            plugins = detect_plugins([(week_path / part).read_text(encoding='utf-8')])
+            return self._blob(render_page(deck['week'], folder, [part], plugins,
+                                          page_key(deck['week'], [part], plugins)), content_type(name))
+        if name in deck['chunks']:
+            return self._blob(deck['chunks'][name], content_type(name))
+        return None
+
+    def resolve(self, url_path: str) -> Optional[Dict[str, Any]]:
+        """Map a request path to a cached response body"""
+        if url_path in ('/', '/index.html'):
+            return self.index_html
+        if url_path.startswith('/generated/'):
+            return self.generated(url_path[len('/generated/'):])
+
+        if url_path.startswith('/slides/'):
+            root, rel_path = self.slides_dir, url_path[len('/slides/'):]
+        else:
+            root, rel_path = self.src_dir, url_path.lstrip('/')
+        root = root.resolve()
+        path = (root / rel_path).resolve()
+        if root not in path.parents:
+            return None
+        if path.is_dir():
+            path = path / 'index.html'
+        return self.read_file(path)
+
+    # -- live reload ---------------------------------------------------------
+
+    def notify(self, weeks: Set[str]):
+        """Send a reload event to every tab viewing one of the given weeks"""
+        for week, queue in list(self.clients):
+            if week in weeks:
+                queue.put_nowait('reload')
+
+    def apply_changes(self, changes: Optional[Set[str]]) -> Set[str]:
+        """
+        Refresh week metadata after changes under slides/
+
+        Directory-level changes and watcher overflows rescan every week;
+        file edits re-extract just the weeks they belong to.
+
+        Returns:
+            Weeks to reload: the changed weeks, plus '' when the index
+            page's HTML changed
+        """
+        if changes is None or any(path.endswith('/') for path in changes):
+            self.weeks[:] = scan_weeks_directory(self.slides_dir, self.project_root / '.cache')
+            touched = {week['number'] for week in self.weeks}
+        else:
+            touched = set()
+            for rel_path in changes:
+                match = WEEK_PATTERN.match(rel_path.partition('/')[0])
+                if match:
+                    touched.add(match.group(1))
+            for number in touched:
+                folder = next((week['folder'] for week in self.weeks if week['number'] == number), None)
+                if folder and (self.slides_dir / folder).is_dir():
+                    week_info = extract_week_info(self.slides_dir / folder, number)
+                    self.weeks[:] = [w for w in self.weeks if w['number'] != number] + [week_info]
+            self.weeks.sort(key=lambda week: int(week['number']))
+
+        index_html = self._blob(inject_reload(self.render_index(self.weeks)), 'text/html; charset=utf-8')
+        if index_html['etag'] != self.index_html['etag']:
+            self.index_html = index_html
+            touched.add('')
+        return touched
+
+    async def watch(self, force_polling: bool = False):
+        """Forward slides/ changes to the connected tabs until cancelled"""
+        loop = asyncio.get_running_loop()
+        watcher = create_watcher(self.slides_dir, force_polling)
+        print(f"👀 Watching {self.slides_dir} ({watcher.name})")
+        try:
+            while True:
+                changes = await loop.run_in_executor(None, watcher.read_changes, 1.0)
+                if changes is not None and not changes:
+                    continue
+                try:
+                    touched = self.apply_changes(changes)
+                except OSError as e:
+                    # Files can vanish mid-save; the next event settles it
+                    print(f"⚠️  Could not apply changes: {e}")
+                    continue
+                viewers = sum(1 for week, _queue in self.clients if week in touched)
+                labels = ', '.join(f'week {week}' if week else 'index' for week in sorted(touched))
+                print(f"🔄 {len(changes) if changes else 'all'} change(s): {labels or 'nothing'} "
+                      f"→ reloading {viewers} tab(s)")
+                self.notify(touched)
+        finally:
+            watcher.close()
+
+    # -- HTTP ----------------------------------------------------------------
+
+    async def send(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str],
+                   body: bytes = b''):
+        lines = [f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "")}']
+        lines += [f'{name}: {value}' for name, value in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+    async def stream_events(self, writer: asyncio.StreamWriter, week: str):
+        """Hold an SSE connection open and forward reload events for one week"""
+        queue: asyncio.Queue = asyncio.Queue()
+        client = (normalize_week(week), queue)
+        self.clients.add(client)
+        try:
+            await self.send(writer, 200, {'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache',
+                                          'Connection': 'keep-alive'}, b'retry: 1000\n\n')
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                    writer.write(f'event: {event}\ndata: {{}}\n\n'.encode('utf-8'))
+                except asyncio.TimeoutError:
+                    writer.write(b': heartbeat\n\n')
+                await writer.drain()
+        finally:
+            self.clients.discard(client)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one (keep-alive) connection"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    return
+                if len(head) > MAX_HEADER_BYTES:
+                    return
+                request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, _version = request_line.split(' ', 2)
+                except ValueError:
+                    await self.send(writer, 400, {'Content-Length': '0', 'Connection': 'close'})
+                    return
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                url = urlsplit(target)
+                url_path = unquote(url.path)
+                if url_path == EVENTS_PATH:
+                    await self.stream_events(writer, parse_qs(url.query).get('week', [''])[0])
+                    return
+                if method not in ('GET', 'HEAD'):
+                    await self.send(writer, 405, {'Content-Length': '0', 'Allow': 'GET, HEAD'})
+                    continue
+
+                try:
+                    entry = self.resolve(url_path)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  {url_path}: {e}")
+                    entry = None
+                if entry is None:
+                    body = b'Not found'
+                    await self.send(writer, 404, {'Content-Type': 'text/plain', 'Content-Length': str(len(body))},
+                                    b'' if method == 'HEAD' else body)
+                    continue
+
+                etag = f'"{entry["etag"]}"'
+                common = {'ETag': etag, 'Cache-Control': 'no-cache'}
+                if headers.get('if-none-match') == etag:
+                    await self.send(writer, 304, common)
+                    continue
+                await self.send(writer, 200, dict(common, **{'Content-Type': entry['type'],
+                                                             'Content-Length': str(len(entry['body']))}),
+                                b'' if method == 'HEAD' else entry['body'])
+        except (ConnectionError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run(server: PreviewServer, host: str, port: int, force_polling: bool = False,
+              on_ready: Optional[Callable[[str], None]] = None):
+    """Serve until cancelled"""
+    http = await asyncio.start_server(server.handle, host, port, limit=MAX_HEADER_BYTES)
+    watch_task = asyncio.create_task(server.watch(force_polling))
+    if on_ready:
+        on_ready(f'http://{host}:{port}/')
+    try:
+        async with http:
+            await http.serve_forever()
+    finally:
+        watch_task.cancel()
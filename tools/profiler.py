@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Phase-level profiling for bootstrap.py and the slide transforms
+
+Spans are recorded as Chrome trace events (open the JSON in
+chrome://tracing or https://ui.perfetto.dev) and summarized as a plain
+table. Optionally every top-level phase runs under cProfile and the
+slowest one is dumped. When profiling is off, span() costs one check.
+"""
+
+import os
+import time
+import pstats
+import cProfile
+import threading
+import contextlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from output_writer import write_json
+
+_state: Dict[str, Any] = {
+    'enabled': False,
+    'cprofile': False,
+    'events': [],
+    'depth': 0,
+    'profiles': {},   # top-level phase name → cProfile.Profile
+}
+
+
+def enable(cprofile: bool = False):
+    """Start recording spans (and cProfile top-level phases if requested)"""
+    _state.update(enabled=True, cprofile=cprofile, events=[], depth=0, profiles={})
+
+
+def enabled() -> bool:
+    return _state['enabled']
+
+
+def now_us() -> int:
+    """Wall clock in microseconds; shared by worker processes, unlike perf_counter"""
+    return time.time_ns() // 1000
+
+
+def record(name: str, start_us: int, end_us: int, category: str = 'phase',
+           pid: Optional[int] = None, tid: Optional[int] = None, **args):
+    """Add a finished span, e.g. one timed in a worker process"""
+    if not _state['enabled']:
+        return
+    _state['events'].append({
+        'name': name,
+        'cat': category,
+        'ph': 'X',
+        'ts': start_us,
+        'dur': max(0, end_us - start_us),
+        'pid': pid if pid is not None else os.getpid(),
+        'tid': tid if tid is not None else threading.get_ident() % 100000,
+        'args': args,
+    })
+
+
+@contextlib.contextmanager
+def span(name: str, category: str = 'phase', **args):
+    """
+    Time a block as a trace event
+
+    Top-level spans are the phases shown in the summary; with cProfile
+    enabled each one gets its own profiler.
+    """
+    if not _state['enabled']:
+        yield
+        return
+
+    top_level = _state['depth'] == 0
+    profile = None
+    if top_level and _state['cprofile']:
+        profile = _state['profiles'].setdefault(name, cProfile.Profile())
+        profile.enable()
+    _state['depth'] += 1
+    start = now_us()
+    try:
+        yield
+    finally:
+        end = now_us()
+        _state['depth'] -= 1
+        if profile is not None:
+            profile.disable()
+        record(name, start, end, category, top_level=top_level, **args)
+
+
+def summarize() -> List[Dict[str, Any]]:
+    """
+    Aggregate spans by name
+
+    Returns:
+        Rows with name, category, count, total/max ms and share of the
+        top-level total, slowest first
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    wall = 0
+    for event in _state['events']:
+        row = rows.setdefault(event['name'], {'name': event['name'], 'category': event['cat'],
+                                              'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                              'top_level': event['args'].get('top_level', False)})
+        ms = event['dur'] / 1000
+        row['count'] += 1
+        row['total_ms'] += ms
+        row['max_ms'] = max(row['max_ms'], ms)
+        if row['top_level']:
+            wall += ms
+    for row in rows.values():
+        row['share'] = row['total_ms'] / wall if wall and row['top_level'] else None
+    return sorted(rows.values(), key=lambda row: (not row['top_level'], -row['total_ms']))
+
+
+def format_summary(limit: int = 25) -> str:
+    """Plain-text table: phases first, then the slowest detail spans"""
+    rows = summarize()
+    lines = [f"{'span':44} {'count':>6} {'total ms':>10} {'max ms':>9} {'share':>6}"]
+    phases = [row for row in rows if row['top_level']]
+    details = [row for row in rows if not row['top_level']][:limit]
+    for row in phases + details:
+        share = f"{row['share'] * 100:5.1f}%" if row['share'] is not None else ''
+        name = row['name'] if row['top_level'] else f"  {row['category']}: {row['name']}"
+        lines.append(f"{name[:44]:44} {row['count']:>6} {row['total_ms']:>10.1f} {row['max_ms']:>9.1f} {share:>6}")
+    return '\n'.join(lines)
+
+
+def write_trace(path: Path) -> Path:
+    """Write the recorded spans as a Chrome trace-event JSON file"""
+    events = list(_state['events'])
+    for pid in sorted({event['pid'] for event in events}):
+        label = 'main' if pid == os.getpid() else f'worker {pid}'
+        events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': label}})
+    write_json(path, {'traceEvents': events, 'displayTimeUnit': 'ms'}, ensure_ascii=False)
+    return path
+
+
+def dump_slowest_phase(trace_path: Path, top: int = 20) -> Optional[Path]:
+    """
+    Dump the cProfile stats of the slowest top-level phase next to the trace
+
+    Returns:
+        Path of the .prof file (load with pstats or snakeviz), or None
+    """
+    phases = [row for row in summarize() if row['top_level'] and row['name'] in _state['profiles']]
+    if not phases:
+        return None
+    slowest = phases[0]['name']
+    safe_name = ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in slowest)
+    prof_path = trace_path.with_name(f'{trace_path.stem}.{safe_name}.prof')
+    profile = _state['profiles'][slowest]
+    profile.dump_stats(str(prof_path))
+    print(f"🔬 cProfile of slowest phase '{slowest}' → {prof_path}")
+    pstats.Stats(profile).sort_stats('cumulative').print_stats(top)
+    return prof_path
+
+
+def finish(trace_path: Path, title: str = 'Profile'):
+    """Write the trace, print the summary table and the optional cProfile dump"""
+    if not _state['enabled']:
+        return
+    trace_path = Path(trace_path)
+    write_trace(trace_path)
+    print(f"\n⏱️  {title} ({len(_state['events'])} spans) → {trace_path}")
+    print(format_summary())
+    if _state['cprofile']:
+        dump_slowest_phase(trace_path)
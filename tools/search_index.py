@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Prebuilt full-text search index over all weeks
+Writes one inverted-index shard per week to src/generated/search/ with
+slide-level postings; the index page fetches the shards on first search
+(src/js/course-search.js mirrors the tokenizer below)
+"""
+
+import re
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable
+
+from fences import line_roles
+from output_writer import fingerprinted, write_text
+
+SEARCH_DIR = 'search'
+SEARCH_VERSION = 3
+
+# Tokens from a slide's title count this many times
+TITLE_WEIGHT = 3
+
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$')
+MARKUP_PATTERN = re.compile(r'<!--.*?-->|<[^>]+>|&[a-z]+;', re.DOTALL)
+WORD_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*|[0-9]+')
+HANGUL_PATTERN = re.compile(r'[가-힣]+')
+# Humps of camelCase / PascalCase / snake_case identifiers
+IDENTIFIER_PART_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+
+def identifier_parts(word: str) -> List[str]:
+    """Split an identifier into lowercase parts; empty when it has only one part"""
+    parts = [part.lower() for part in IDENTIFIER_PART_PATTERN.findall(word) if len(part) >= 2]
+    return parts if len(parts) > 1 else []
+
+
+def tokenize(text: str) -> Iterable[str]:
+    """
+    Yield search tokens: lowercase words and identifiers (plus their
+    camelCase/snake_case parts) and Hangul bigrams (single syllables
+    stay as they are)
+    """
+    for match in WORD_PATTERN.finditer(text):
+        word = match.group(0)
+        if len(word) >= 2:
+            yield word.lower()
+        yield from identifier_parts(word)
+    for match in HANGUL_PATTERN.finditer(text):
+        run = match.group(0)
+        if len(run) == 1:
+            yield run
+        for i in range(len(run) - 1):
+            yield run[i:i + 2]
+
+
+def slide_tokens(body: str) -> Dict[str, int]:
+    """
+    Count a slide's tokens
+
+    Prose lines drop HTML markup first and headings count TITLE_WEIGHT
+    times; code fence lines are tokenized as they are, so identifiers
+    are searchable whole and by their parts.
+
+    Returns:
+        Token → weighted term frequency
+    """
+    counts: Dict[str, int] = {}
+    for line, role in line_roles(body.split('\n')):
+        if role == 'fence':
+            continue
+        weight = 1
+        if role == 'text':
+            line = MARKUP_PATTERN.sub(' ', line)
+            if HEADING_PATTERN.match(line):
+                weight = TITLE_WEIGHT
+        for token in tokenize(line):
+            counts[token] = counts.get(token, 0) + weight
+    return counts
+
+
+def build_week_shard(index: Dict[str, Any], texts: List[str]) -> Dict[str, Any]:
+    """
+    Build one week's shard from its slide index and chunk texts
+
+    Args:
+        index: Slide index from deck_index.build_week_index
+        texts: Chunk markdown texts (slide offsets are relative to these)
+
+    Returns:
+        Shard with 'slides' ([h, v, title] per slide, plus [part, line]
+        when slides.md is assembled from its parts) and 'terms'
+        (token → flat [slide ordinal, frequency, ...] postings)
+    """
+    encoded = [text.encode('utf-8') for text in texts]
+    slides = []
+    terms: Dict[str, List[int]] = {}
+    for ordinal, slide in enumerate(index['slides']):
+        data = encoded[slide['chunk']]
+        body = data[slide['offset']:slide['offset'] + slide['length']].decode('utf-8')
+        entry = [slide['h'], slide['v'], slide['title']]
+        if 'part' in slide:
+            entry += [slide['part'], slide['part_line']]
+        slides.append(entry)
+        for token, count in slide_tokens(body).items():
+            terms.setdefault(token, []).extend((ordinal, count))
+
+    return {
+        'version': SEARCH_VERSION,
+        'week': index['week'],
+        'folder': index['folder'],
+        'slides': slides,
+        'terms': dict(sorted(terms.items()))
+    }
+
+
+def write_week_shard(index: Dict[str, Any], texts: List[str], search_dir: Path) -> bool:
+    """
+    Write a week's shard as search/<folder>.<hash>.json and drop older ones
+
+    Returns:
+        True if the shard was written
+    """
+    shard_text = json.dumps(build_week_shard(index, texts), ensure_ascii=False, separators=(',', ':'))
+    name = fingerprinted(index['folder'], '.json', shard_text)
+    written = write_text(search_dir / name, shard_text + '\n')
+    for stale in search_dir.glob(f"{index['folder']}.*.json"):
+        if stale.name != name:
+            stale.unlink()
+    return written
+
+
+def find_week_shard(search_dir: Path, folder: str) -> Optional[str]:
+    """Name of a week's current shard in search_dir"""
+    names = sorted(path.name for path in search_dir.glob(f'{folder}.*.json'))
+    return names[-1] if names else None
+
+
+def prune_shards(search_dir: Path, live_folders: Iterable[str]):
+    """Remove shards of weeks that no longer exist"""
+    live = set(live_folders)
+    if not search_dir.exists():
+        return
+    for shard in search_dir.glob('*.json'):
+        if shard.name.split('.', 1)[0] not in live:
+            shard.unlink()
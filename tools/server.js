@@ -6,6 +6,7 @@ import { fileURLToPath } from 'url';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
+const PROJECT_ROOT = path.join(__dirname, '..');
 
 const app = express();
 const PORT = process.env.PORT || 3001;
@@ -24,9 +25,9 @@ app.post('/api/generate-pdf', async (req, res) => {
     try {
         console.log(`Generating PDF for week ${week}...`);
 
-        // Run the existing PDF export script
-        const child = spawn('node', ['scripts/export-pdf.mjs', '--week', week], {
-            cwd: __dirname,
+        // Run the parts-based PDF exporter from the project root
+        const child = spawn('python3', ['scripts/export_pdf.py', '--week', week], {
+            cwd: PROJECT_ROOT,
             stdio: 'pipe'
         });
 
@@ -46,7 +47,7 @@ app.post('/api/generate-pdf', async (req, res) => {
         child.on('close', (code) => {
             if (code === 0) {
                 // PDF generated successfully, send the file
-                const pdfPath = path.join(__dirname, 'pdf-exports', `week${week.padStart(2, '0')}.pdf`);
+                const pdfPath = path.join(PROJECT_ROOT, 'pdf-exports', `week${week.padStart(2, '0')}.pdf`);
 
                 if (fs.existsSync(pdfPath)) {
                     res.setHeader('Content-Type', 'application/pdf');
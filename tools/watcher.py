@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+File system watcher for the slides/ directory
+Uses Linux inotify through ctypes, with a portable polling fallback
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+# inotify event flags (see inotify(7))
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct('iIII')
+
+# Quiet period used to coalesce an editor's save burst into one batch
+DEBOUNCE_SECONDS = 0.1
+
+
+def is_ignored(name: str) -> bool:
+    """Skip editor swap/backup files that never reach the served tree"""
+    return name.startswith('.#') or name.endswith(('~', '.swp', '.swx', '.tmp'))
+
+
+class InotifyWatcher:
+    """
+    Recursive inotify watcher
+
+    read_changes() returns POSIX paths relative to the watched root.
+    Directory-level events are reported with a trailing '/', and None
+    means the kernel queue overflowed and the caller must rescan.
+    """
+
+    name = 'inotify'
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.watches: Dict[int, Path] = {}
+        self._add_tree(self.root)
+
+    def _add_watch(self, path: Path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOENT:
+                return
+            raise OSError(err, f'inotify_add_watch failed for {path}')
+        self.watches[wd] = path
+
+    def _add_tree(self, path: Path):
+        self._add_watch(path)
+        for dirpath, dirnames, _filenames in os.walk(path):
+            for name in dirnames:
+                self._add_watch(Path(dirpath) / name)
+
+    def _read_events(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changes: Set[str] = set()
+        data = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            parent = self.watches.get(wd)
+            if parent is None or (name and is_ignored(name)):
+                continue
+
+            path = parent / name if name else parent
+            rel_path = path.relative_to(self.root).as_posix()
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                changes.add(rel_path + '/')
+            elif not mask & IN_DELETE_SELF:
+                changes.add(rel_path)
+        return changes
+
+    def read_changes(self, timeout: Optional[float] = None) -> Optional[Set[str]]:
+        """
+        Block until something changes, then collect the whole burst
+
+        Args:
+            timeout: Seconds to wait for the first event (None = forever)
+
+        Returns:
+            Set of changed relative paths (empty on timeout), or None on overflow
+        """
+        changes = self._read_events(timeout)
+        while changes:
+            more = self._read_events(DEBOUNCE_SECONDS)
+            if more is None:
+                return None
+            if not more:
+                break
+            changes |= more
+        return changes
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """
+    Portable watcher that diffs (mtime, size) snapshots of the tree
+
+    Used where inotify is unavailable (macOS, Windows) or does not see
+    edits, e.g. WSL checkouts on /mnt/c.
+    """
+
+    name = 'polling'
+
+    def __init__(self, root: Path, interval: float = 0.5):
+        self.root = Path(root)
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            rel_dir = os.path.relpath(dirpath, self.root).replace(os.sep, '/')
+            prefix = '' if rel_dir == '.' else rel_dir + '/'
+            for name in dirnames:
+                snapshot[prefix + name + '/'] = (0, 0)
+            for name in filenames:
+                if is_ignored(name):
+                    continue
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                snapshot[prefix + name] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def read_changes(self, timeout: Optional[float] = None) -> Optional[Set[str]]:
+        """Same contract as InotifyWatcher.read_changes"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval)
+            current = self._snapshot()
+            changes = {path for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return changes
+
+    def close(self):
+        pass
+
+
+def create_watcher(root: Path, force_polling: bool = False):
+    """
+    Create the best available watcher for root
+
+    Args:
+        root: Directory to watch recursively
+        force_polling: Skip inotify even where it is available
+
+    Returns:
+        InotifyWatcher on Linux, PollingWatcher otherwise
+    """
+    if not force_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(root)
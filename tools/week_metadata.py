@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Week metadata extraction with a persistent cache
+Feeds both the index.html lecture cards and src/data/course-structure.json
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import profiler
+from deck_index import split_slides
+from output_writer import write_text, write_json
+
+CACHE_NAME = 'week-metadata.json'
+CACHE_VERSION = 1
+
+# Pattern to match weekXX or weekXX-description directories
+# (three or more digits are accepted for long courses, e.g. benchmark corpora)
+WEEK_PATTERN = re.compile(r'^week(\d{2,})(?:-.*)?$')
+
+# Files whose content determines a week's cached metadata
+SOURCE_FILES = ('slides.md', 'summary.md')
+
+# Below this many stale weeks a process pool costs more than it saves
+PARALLEL_MIN_WEEKS = 8
+
+COURSE_STRUCTURE_PATH = Path('src') / 'data' / 'course-structure.json'
+
+
+def extract_title_from_slides(content: str) -> str:
+    """Extract title from slides.md content"""
+    for line in content.split('\n'):
+        line = line.strip()
+        if line.startswith('# '):
+            return line[2:].strip()
+        # Only the leading heading block can hold the deck title
+        if len(line) > 0 and not line.startswith('#'):
+            break
+    return ""
+
+
+def extract_summary_info(content: str) -> Dict[str, Any]:
+    """Extract title and learning objectives from summary.md content"""
+    info = {}
+
+    # Extract title (first h1)
+    title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+    if title_match:
+        info['title'] = title_match.group(1).strip()
+
+    # Extract learning objectives (첫 번째 ## 🎯 학습 목표 섹션)
+    objective_match = re.search(
+        r'## 🎯 학습 목표\s*\n(.+?)(?=\n##|\n$)',
+        content,
+        re.DOTALL
+    )
+    if objective_match:
+        info['description'] = objective_match.group(1).strip()
+
+    return info
+
+
+def extract_content_info(week_path: Path, week_num: str,
+                         cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the cache entry for one week from slides.md and summary.md
+
+    Files are hashed first; when every hash matches the cached entry its
+    metadata is reused and only the recorded stat values are refreshed.
+    Runs in worker processes, so it only takes and returns plain data.
+
+    Args:
+        week_path: Path to weekXX directory
+        week_num: Week number string (e.g., "03")
+        cached: Previous cache entry for this week, if any
+
+    Returns:
+        Cache entry with 'files' (stat + sha256 per source file) and 'info'
+    """
+    files = {}
+    contents = {}
+    for name in SOURCE_FILES:
+        path = week_path / name
+        try:
+            st = path.stat()
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"Warning: Could not read {path}: {e}")
+            continue
+        files[name] = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'sha256': hashlib.sha256(data).hexdigest()
+        }
+        contents[name] = data.decode('utf-8', errors='replace')
+
+    if cached and {name: f['sha256'] for name, f in cached['files'].items()} == \
+            {name: f['sha256'] for name, f in files.items()}:
+        return {'files': files, 'info': cached['info']}
+
+    info = {
+        'title': f'Week {week_num}',
+        'description': 'No description available',
+        'has_slides': False,
+        'slide_count': 0
+    }
+
+    if 'slides.md' in contents:
+        info['has_slides'] = True
+        info['slide_count'] = len(split_slides(contents['slides.md']))
+        # Try to extract title from slides.md
+        title = extract_title_from_slides(contents['slides.md'])
+        if title:
+            info['title'] = title
+
+    if 'summary.md' in contents:
+        info.update(extract_summary_info(contents['summary.md']))
+
+    return {'files': files, 'info': info}
+
+
+def is_entry_fresh(week_path: Path, entry: Optional[Dict[str, Any]]) -> bool:
+    """Check a cache entry against the current mtime and size of its source files"""
+    if not entry:
+        return False
+    for name in SOURCE_FILES:
+        try:
+            st = (week_path / name).stat()
+        except FileNotFoundError:
+            if name in entry['files']:
+                return False
+            continue
+        recorded = entry['files'].get(name)
+        if not recorded or recorded['mtime_ns'] != st.st_mtime_ns or recorded['size'] != st.st_size:
+            return False
+    return True
+
+
+def has_entries(directory: Path) -> bool:
+    """Check whether a week subdirectory exists and is non-empty"""
+    try:
+        with os.scandir(directory) as entries:
+            return any(True for _ in entries)
+    except OSError:
+        return False
+
+
+def build_week_info(week_path: Path, week_num: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine cached content metadata with the week's current code/ and images/ state"""
+    week_info = {
+        'number': week_num,
+        'folder': week_path.name,
+    }
+    week_info.update(entry['info'])
+    week_info['has_code'] = has_entries(week_path / 'code')
+    week_info['has_images'] = has_entries(week_path / 'images')
+    return week_info
+
+
+def extract_week_info(week_path: Path, week_num: str) -> Dict[str, Any]:
+    """
+    Extract week information from week directory (uncached)
+
+    Args:
+        week_path: Path to weekXX directory
+        week_num: Week number string (e.g., "03")
+
+    Returns:
+        Dictionary with week metadata
+    """
+    return build_week_info(week_path, week_num, extract_content_info(week_path, week_num))
+
+
+def load_metadata_cache(cache_path: Path) -> Dict[str, Any]:
+    """Load cached week entries keyed by folder name"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION:
+            return cache['weeks']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def save_metadata_cache(cache_path: Path, entries: Dict[str, Any]):
+    write_json(cache_path, {'version': CACHE_VERSION, 'weeks': entries}, ensure_ascii=False)
+
+
+def extract_content_info_timed(week_path: Path, week_num: str,
+                               cached: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], int, int, int]:
+    """extract_content_info plus (start, end, pid) for the profiler's trace"""
+    start = profiler.now_us()
+    entry = extract_content_info(week_path, week_num, cached)
+    return entry, start, profiler.now_us(), os.getpid()
+
+
+def extract_stale_entries(stale: List[Tuple[Path, str, Optional[Dict[str, Any]]]],
+                          jobs: Optional[int]) -> List[Dict[str, Any]]:
+    """Extract entries for stale weeks, in a process pool when there are enough of them"""
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(stale) >= PARALLEL_MIN_WEEKS:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                if not profiler.enabled():
+                    return list(pool.map(extract_content_info, *zip(*stale)))
+                entries = []
+                for (week_path, _num, _old), (entry, start, end, pid) in zip(
+                        stale, pool.map(extract_content_info_timed, *zip(*stale))):
+                    profiler.record(f'extract {week_path.name}', start, end, 'week', pid=pid, tid=pid)
+                    entries.append(entry)
+                return entries
+        except (OSError, NotImplementedError) as e:
+            print(f"⚠️  Worker pool unavailable ({e}), extracting serially")
+    entries = []
+    for args in stale:
+        with profiler.span(f'extract {args[0].name}', 'week'):
+            entries.append(extract_content_info(*args))
+    return entries
+
+
+def scan_weeks_directory(slides_path: Path, cache_dir: Optional[Path] = None,
+                         jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Scan slides directory for weekXX folders and extract week information
+
+    Weeks whose slides.md/summary.md are unchanged since the last run
+    (same mtime and size, or same hash) are served from the cache in
+    cache_dir; the rest are extracted in parallel.
+
+    Args:
+        slides_path: Path to slides directory
+        cache_dir: Directory for the metadata cache (None disables caching)
+        jobs: Worker processes for extraction (default: CPU count)
+
+    Returns:
+        List of week dictionaries with metadata
+    """
+    weeks = []
+
+    if not slides_path.exists():
+        print(f"Warning: slides directory not found at {slides_path}")
+        return weeks
+
+    start = time.perf_counter()
+    cache_path = cache_dir / CACHE_NAME if cache_dir is not None else None
+    cached = load_metadata_cache(cache_path) if cache_path else {}
+
+    found = []
+    stale = []
+    for item in slides_path.iterdir():
+        if item.is_dir():
+            match = WEEK_PATTERN.match(item.name)
+            if match:
+                found.append((item, match.group(1)))
+                if not is_entry_fresh(item, cached.get(item.name)):
+                    stale.append((item, match.group(1), cached.get(item.name)))
+
+    entries = {item.name: cached[item.name] for item, _week_num in found
+               if item.name in cached}
+    for (item, _week_num, _old), entry in zip(stale, extract_stale_entries(stale, jobs)):
+        entries[item.name] = entry
+
+    for item, week_num in found:
+        weeks.append(build_week_info(item, week_num, entries[item.name]))
+
+    if cache_path and entries != cached:
+        save_metadata_cache(cache_path, entries)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"🗂️  Week metadata: {len(found) - len(stale)} cached, "
+          f"{len(stale)} extracted ({elapsed_ms:.1f} ms)")
+
+    # Sort weeks by number
+    weeks.sort(key=lambda x: int(x['number']))
+    return weeks
+
+
+def generate_course_structure(weeks: List[Dict[str, Any]],
+                              existing: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Refresh course-structure.json from week metadata
+
+    Course and module titles/descriptions are kept from the existing file;
+    every module's week list is regenerated. A week keeps the module it was
+    listed under; a new week joins the module of the closest earlier week.
+
+    Args:
+        weeks: Week list from scan_weeks_directory
+        existing: Current course-structure.json content
+
+    Returns:
+        Updated course structure
+    """
+    course = dict(existing.get('course', {}))
+    modules = [dict(module) for module in course.get('modules', [])]
+    if not modules:
+        modules = [{'id': 'lectures', 'title': course.get('title', 'Lectures'),
+                    'description': '', 'weeks': []}]
+
+    module_of = {}
+    for i, module in enumerate(modules):
+        for week in module.get('weeks', []):
+            module_of[week.get('number')] = i
+
+    assigned = [[] for _ in modules]
+    current = 0
+    for week in weeks:
+        current = module_of.get(week['number'], current)
+        assigned[current].append({
+            'id': week['folder'],
+            'number': week['number'],
+            'title': week['title'],
+            'description': week['description']
+        })
+
+    for module, module_weeks in zip(modules, assigned):
+        module['weeks'] = module_weeks
+    course['modules'] = modules
+    return {'course': course}
+
+
+def write_course_structure(project_root: Path, weeks: List[Dict[str, Any]]) -> bool:
+    """
+    Regenerate src/data/course-structure.json, writing only on change
+
+    Returns:
+        True if the file was rewritten
+    """
+    path = project_root / COURSE_STRUCTURE_PATH
+    existing = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+    except (OSError, ValueError) as e:
+        if path.exists():
+            print(f"Warning: Could not read {path}: {e}")
+
+    content = json.dumps(generate_course_structure(weeks, existing), ensure_ascii=False, indent=2)
+    return write_text(path, content)